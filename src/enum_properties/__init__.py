@@ -20,12 +20,19 @@ specialization support for python enumeration classes.
 """
 
 import enum
+import os
+import re
 import sys
+import threading
 import typing as t
 import unicodedata
+from bisect import bisect_left
+from collections import Counter, OrderedDict
 from collections.abc import Generator, Hashable, Iterable, Mapping
+from contextlib import nullcontext
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
+from itertools import chain
 
 VERSION = (2, 7, 0)
 
@@ -46,8 +53,10 @@ __all__ = [
     "symmetric",
     "Symmetric",
     "SymmetricMixin",
+    "MissCacheInfo",
     "DecomposeMixin",
     "specialize",
+    "member_property",
     "p",
     "s",
 ]
@@ -68,6 +77,24 @@ Annotations are loaded after enum member definitions in python 3.14+
 """
 
 
+_profiler: t.Any = None
+"""
+The active :class:`~enum_properties.profiling.Profile` that class construction is
+recorded to, or None if construction is not being profiled.
+"""
+
+_NO_STAGE = nullcontext()
+
+
+def _stage(record: t.Any, stage: str) -> t.ContextManager[t.Any]:
+    """
+    Get a context manager that records the time and allocations of a stage of class
+    construction to the given :class:`~enum_properties.profiling.ClassProfile`, or
+    that does nothing if the class is not being profiled.
+    """
+    return _NO_STAGE if record is None else record.stage(stage)
+
+
 if t.TYPE_CHECKING:
     # For type checking, mixins inherit from enum types to provide proper attributes
     _SymmetricMixinBase: type[enum.Enum] = enum.Enum  # pragma: no cover
@@ -78,11 +105,104 @@ else:
     _DecomposeMixinBase = object
 
 
-def _do_casenorm(text: str) -> str:
-    """Normalize unicode text to be case agnostic."""
+_generator_types: dict[type, bool] = {}
+
+
+def _is_generator(value: t.Any) -> bool:
+    """
+    A faster isinstance(value, Generator) that caches the verdict for each type.
+    """
+    try:
+        return _generator_types[type(value)]
+    except KeyError:
+        is_generator = _generator_types[type(value)] = isinstance(value, Generator)
+        return is_generator
+
+
+@lru_cache(maxsize=4096)
+def _casenorm_unicode(text: str) -> str:
+    """Normalize non-ascii unicode text to be case agnostic - memoized."""
     return unicodedata.normalize("NFKD", text.casefold())
 
 
+def _do_casenorm(text: str) -> str:
+    """
+    Normalize unicode text to be case agnostic. ASCII text is its own NFKD
+    normalization and casefolds to its lower case, so the expensive path is only
+    taken (and memoized) for non-ascii text.
+    """
+    if text.isascii():
+        return text.lower()
+    return _casenorm_unicode(text)
+
+
+_NOT_FOUND = object()
+"""
+Lookup failure sentinel - private.
+"""
+
+_HEAPTYPE = 1 << 9
+"""
+Py_TPFLAGS_HEAPTYPE - set on classes defined in Python code.
+"""
+
+_NO_BUFFER_TYPES: frozenset[type] = frozenset(
+    {object, type, type(None), tuple, list, dict, set, frozenset}
+)
+"""
+Builtin base classes that are known not to implement the buffer protocol.
+"""
+
+_COERCION_HOOKS: dict[type, tuple[str, ...]] = {
+    int: ("__int__", "__index__", "__trunc__"),
+    float: ("__float__", "__index__"),
+    complex: ("__complex__", "__float__", "__index__"),
+}
+"""
+The special methods that allow instances of arbitrary types to be passed to the
+constructors of these builtin numeric types.
+"""
+
+_INT_STRING = re.compile(r"[+-]?[\d_]+")
+_FLOAT_STRING = re.compile(
+    r"[+-]?(?:[\d_.]*(?:e[+-]?[\d_]*)?|inf(?:inity)?|nan)", re.IGNORECASE
+)
+
+_COERCION_GUARDS: dict[tuple[type, type], t.Callable[[t.Any], t.Any]] = {
+    (str, int): lambda value: _INT_STRING.fullmatch(value.strip()),
+    (str, float): lambda value: _FLOAT_STRING.fullmatch(value.strip()),
+}
+"""
+Cheap value checks that must pass for a (source type, coerce type) conversion to
+succeed. These are necessary, not sufficient conditions - they let us skip
+conversions that would only raise.
+"""
+
+
+def _may_coerce(src: type, dst: type) -> bool:
+    """
+    Return False if constructing ``dst`` from any instance of ``src`` is
+    guaranteed to raise. This is only ever decided for builtin numeric types, all
+    other conversions are assumed to be possible.
+    """
+    hooks = _COERCION_HOOKS.get(dst)
+    if hooks is None or issubclass(src, str):
+        return True
+    if any(hasattr(src, hook) for hook in hooks):
+        return True
+    if dst is complex:
+        return False
+    # int() and float() also accept bytes and other buffer protocol objects
+    return (
+        issubclass(src, (bytes, bytearray, memoryview))
+        or hasattr(src, "__buffer__")
+        or any(
+            not (base.__flags__ & _HEAPTYPE) and base not in _NO_BUFFER_TYPES
+            for base in src.__mro__
+        )
+    )
+
+
 @dataclass
 class Symmetric:
     """
@@ -147,6 +267,54 @@ def symmetric(case_fold: bool = False, match_none: bool = False):
     return symmetric_decorator
 
 
+class _MemberProperty:
+    """
+    A non-data descriptor that computes a property from a member - private. The
+    values computed for each member during enumeration construction shadow it, so
+    it is only called for composite flag values that are not named members.
+    """
+
+    func: t.Callable[[t.Any], t.Any]
+
+    def __init__(self, func: t.Callable[[t.Any], t.Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: t.Any, owner: t.Any = None) -> t.Any:
+        if instance is None:
+            return self
+        return self.func(instance)
+
+
+def member_property(func: t.Callable[[t.Any], t.Any]) -> t.Any:
+    """
+    A decorator that computes a property of each member once, when the enumeration
+    is created. The values are stored and looked up like the values of properties
+    declared in the member tuples, so they may also be made symmetric by
+    decorating the property with :func:`symmetric`. For example:
+
+    .. code-block:: python
+
+        class MyEnum(EnumProperties):
+
+            ...
+
+            @symmetric(case_fold=True)
+            @member_property
+            def uri(self):
+                return f"https://example.com/{self.name.lower()}"
+
+    The function is called on each member after its tuple declared property values
+    and specializations are set, and after any member properties declared before
+    it. Member properties declared on a base class are computed for the members of
+    its subclasses, unless the subclass redefines the name.
+
+    :param func: The function that computes the property value from a member
+    :return: A member property descriptor
+    """
+    return _MemberProperty(func)
+
+
 class _Prop(str):
     """Property interface - private"""
 
@@ -169,6 +337,13 @@ class _SProp(_Prop):
     match_none: bool
 
 
+_property_types: dict[tuple[str, bool, bool, bool], type[_Prop]] = {}
+"""
+Property types are immutable, so :func:`p` and :func:`s` create each distinct
+property type once, keyed by (name, symmetric, case_fold, match_none).
+"""
+
+
 def s(
     prop_name: str, case_fold: bool = False, match_none: bool = False
 ) -> type[_SProp]:
@@ -184,11 +359,18 @@ def s(
         the enumeration value.
     :return: a named symmetric property class
     """
-    return type(
-        prop_name,
-        (_SProp,),
-        {"case_fold": case_fold, "match_none": match_none},
-    )
+    key = (prop_name, True, bool(case_fold), bool(match_none))
+    prop = _property_types.get(key)
+    if prop is None:
+        prop = _property_types.setdefault(
+            key,
+            type(
+                prop_name,
+                (_SProp,),
+                {"case_fold": bool(case_fold), "match_none": bool(match_none)},
+            ),
+        )
+    return t.cast(type[_SProp], prop)
 
 
 def p(prop_name: str) -> type[_Prop]:
@@ -202,7 +384,71 @@ def p(prop_name: str) -> type[_Prop]:
     :param prop_name: The name of the property
     :return: a named property class
     """
-    return type(prop_name, (_Prop,), {})
+    key = (prop_name, False, False, False)
+    prop = _property_types.get(key)
+    if prop is None:
+        prop = _property_types.setdefault(key, type(prop_name, (_Prop,), {}))
+    return prop
+
+
+class _CompactProperty:
+    """
+    Class level accessor for a property value stored at a fixed position in the
+    ``_ep_values_`` tuple of each member, see ``_compact_properties_``. Values that
+    have no stored values, like composite flags, fall back to the member property
+    that computes the value, if any, and otherwise to the default.
+    """
+
+    __slots__ = ("default", "fallback", "index", "name")
+
+    def __init__(
+        self,
+        name: str,
+        index: int,
+        default: t.Any = _NOT_FOUND,
+        fallback: "_MemberProperty | None" = None,
+    ):
+        self.name = name
+        self.index = index
+        self.default = default
+        self.fallback = fallback
+
+    def __get__(self, instance: t.Any, owner: t.Any = None) -> t.Any:
+        if instance is None:
+            return self
+        try:
+            return instance._ep_values_[self.index]
+        except AttributeError:
+            # composite flag values have no property values
+            if self.fallback is not None:
+                return self.fallback.func(instance)
+            if self.default is not _NOT_FOUND:
+                return self.default
+            raise AttributeError(
+                f"{type(instance).__name__!r} object has no attribute {self.name!r}"
+            ) from None
+
+
+def _set_compact_values(cls: t.Any, rows: t.Iterable[tuple[t.Any, ...]]):
+    """
+    Store the property values of each distinct member, followed by its ordinal, in
+    its ``_ep_values_`` tuple and install the accessors that read them.
+
+    :param cls: The enumeration class
+    :param rows: The property values of each member in ``_ep_members_``.
+    """
+    for ordinal, (member, values) in enumerate(zip(cls._ep_members_, rows)):
+        member._ep_values_ = (*values, ordinal)
+    member_properties = getattr(cls, "_ep_member_properties_", {})
+    for idx, prop in enumerate(cls._properties_):
+        type.__setattr__(
+            cls,
+            str(prop),
+            _CompactProperty(prop, idx, fallback=member_properties.get(prop)),
+        )
+    type.__setattr__(
+        cls, "_ordinal_", _CompactProperty("_ordinal_", len(cls._properties_), None)
+    )
 
 
 class _Specialized:
@@ -238,6 +484,228 @@ def specialize(*values):
     return specialize_decorator
 
 
+class MissCacheInfo(t.NamedTuple):
+    """
+    Statistics for an enumeration's negative lookup cache. See
+    :meth:`~enum_properties.EnumPropertiesMeta.miss_cache_info`.
+    """
+
+    hits: int
+    """
+    The number of lookups that were failed from the cache.
+    """
+
+    misses: int
+    """
+    The number of lookups that were not in the cache.
+    """
+
+    maxsize: int
+    """
+    The maximum number of values the cache will hold.
+    """
+
+    currsize: int
+    """
+    The number of values currently held in the cache.
+    """
+
+
+class _MissCache:
+    """
+    A size bounded LRU set of hashable values that are known to fail symmetric
+    resolution - private. Values are keyed by their type as well as their value
+    because equal values of different types (e.g. 1 and True) coerce differently.
+    Cached values are only valid for the number of values in ``_value2member_map_``
+    they were cached at, because Flag adds composite pseudo members to it as they
+    are created and a value that coerces to a new one no longer misses.
+    """
+
+    __slots__ = ("_keys", "_size", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._keys: OrderedDict[tuple[type, t.Any], None] = OrderedDict()
+        self._size = 0
+
+    def __contains__(self, key: tuple[type, t.Any]) -> bool:
+        try:
+            self._keys.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def add(self, key: tuple[type, t.Any]):
+        self._keys[key] = None
+        if len(self._keys) > self.maxsize:
+            try:
+                self._keys.popitem(last=False)
+            except KeyError:  # pragma: no cover
+                pass
+
+    def clear(self):
+        """Forget all cached values - statistics are preserved."""
+        self._keys.clear()
+
+    def validate(self, size: int):
+        """
+        Forget all cached values if the number of values in ``_value2member_map_``
+        has changed since they were cached.
+        """
+        if size != self._size:
+            self._keys.clear()
+            self._size = size
+
+    def info(self) -> MissCacheInfo:
+        return MissCacheInfo(self.hits, self.misses, self.maxsize, len(self._keys))
+
+
+class _PrefixIndex:
+    """
+    Sorted array index over the string keys of a symmetric map. All keys sharing a
+    prefix are contiguous in sort order so the matches for a prefix are found with
+    a binary search for the first of them.
+    """
+
+    __slots__ = ("keys", "members")
+
+    def __init__(self, mapping: Mapping[t.Any, t.Any]):
+        # members are not orderable so only the keys may be compared
+        items = sorted(
+            ((key, member) for key, member in mapping.items() if isinstance(key, str)),
+            key=lambda item: item[0],
+        )
+        self.keys = [key for key, _ in items]
+        self.members = [member for _, member in items]
+
+    def search(self, prefix: str) -> Generator[t.Any, None, None]:
+        idx = bisect_left(self.keys, prefix)
+        keys = self.keys
+        while idx < len(keys) and keys[idx].startswith(prefix):
+            yield self.members[idx]
+            idx += 1
+
+
+def _edit_distance(left: str, right: str, bound: int) -> int:
+    """
+    The Levenshtein distance between two strings, or ``bound + 1`` if it exceeds
+    ``bound``. Only the diagonal band of width ``2 * bound + 1`` is computed.
+    """
+    if len(left) < len(right):
+        left, right = right, left
+    if len(left) - len(right) > bound:
+        return bound + 1
+    # common affixes never contribute edits
+    start = 0
+    while start < len(right) and left[start] == right[start]:
+        start += 1
+    stop = 0
+    while stop < len(right) - start and left[-1 - stop] == right[-1 - stop]:
+        stop += 1
+    left = left[start : len(left) - stop]
+    right = right[start : len(right) - stop]
+    if not right:
+        return min(len(left), bound + 1)
+    over = bound + 1
+    width = len(right)
+    previous = list(range(width + 1))
+    for row, lchar in enumerate(left, 1):
+        first = max(row - bound, 1)
+        last = min(row + bound, width)
+        current = [over] * (width + 1)
+        if first == 1:
+            current[0] = row
+        best = over
+        left_cost = current[first - 1]
+        for col in range(first, last + 1):
+            cost = previous[col - 1] + (lchar != right[col - 1])
+            cost = min(cost, previous[col] + 1, left_cost + 1)
+            current[col] = left_cost = cost
+            best = min(best, cost)
+        if best > bound:
+            return over
+        previous = current
+    return min(previous[-1], over)
+
+
+class _FuzzyIndex:
+    """
+    Bigram index over the string keys of symmetric maps. Strings within edit distance
+    d of each other of which the longer has length n must share at least
+    ``n - 1 - 2 * d`` bigrams, so only keys that pass this count filter have their
+    edit distance computed.
+    """
+
+    __slots__ = ("by_length", "keys", "members", "postings")
+
+    Q = 2
+
+    def __init__(self, items: Iterable[tuple[str, t.Any]]):
+        self.keys: list[str] = []
+        self.members: list[t.Any] = []
+        # the k-th occurrence of a bigram in a key is posted under (bigram, k) so
+        # that counting postings counts the bigrams shared with repetition
+        self.postings: dict[tuple[str, int], list[int]] = {}
+        self.by_length: dict[int, list[int]] = {}
+        for key, member in items:
+            entry = len(self.keys)
+            self.keys.append(key)
+            self.members.append(member)
+            self.by_length.setdefault(len(key), []).append(entry)
+            for gram in self.grams(key):
+                self.postings.setdefault(gram, []).append(entry)
+
+    @classmethod
+    def grams(cls, text: str) -> list[tuple[str, int]]:
+        seen: dict[str, int] = {}
+        grams = []
+        for idx in range(len(text) - cls.Q + 1):
+            gram = text[idx : idx + cls.Q]
+            seen[gram] = seen.get(gram, 0) + 1
+            grams.append((gram, seen[gram]))
+        return grams
+
+    def search(self, text: str, max_distance: int) -> dict[int, tuple[int, t.Any]]:
+        """
+        :return: A mapping of the index of each matching key to its edit distance
+            from ``text`` and its member.
+        """
+        shared = Counter(
+            chain.from_iterable(
+                self.postings.get(gram, ()) for gram in self.grams(text)
+            )
+        )
+        floor = 1 - self.Q * (max_distance + 1)
+        if len(text) + floor > 0:
+            # every match shares enough bigrams to be counted
+            least = len(text) + floor
+            candidates: Iterable[int] = [
+                entry for entry, count in shared.items() if count >= least
+            ]
+        else:
+            candidates = chain.from_iterable(
+                self.by_length.get(length, ())
+                for length in range(
+                    len(text) - max_distance, len(text) + max_distance + 1
+                )
+            )
+        matches: dict[int, tuple[int, t.Any]] = {}
+        for entry in candidates:
+            key = self.keys[entry]
+            if abs(len(key) - len(text)) > max_distance:
+                continue
+            if shared[entry] < max(len(text), len(key)) + floor:
+                continue
+            distance = _edit_distance(text, key, max_distance)
+            if distance <= max_distance:
+                matches[entry] = (distance, self.members[entry])
+        return matches
+
+
 class SymmetricMixin(_SymmetricMixinBase):
     """
     This mixin enables symmetric :class:`enum.Enum` creation from properties marked
@@ -250,6 +718,18 @@ class SymmetricMixin(_SymmetricMixinBase):
     member containing a list of string property names or
     :py:meth:`~enum_properties.s` values. By default, the ``name``
     property will be a case sensitive symmetric property.
+
+    If values that fail symmetric resolution are likely to repeat, a bounded
+    negative lookup cache may be enabled by supplying a ``_miss_cache_size_``
+    member set to the maximum number of failed values to remember.
+
+    The symmetric maps are built when the class is created. Supplying a truthy
+    ``_lazy_symmetry_`` member defers building them until the first symmetric
+    lookup, which saves import time for enumerations that are seldom looked up.
+
+    Property values are stored in the ``__dict__`` of each member. Supplying a
+    truthy ``_compact_properties_`` member stores them in one tuple per member
+    instead, which is read through accessors on the class.
     """
 
     _ep_symmetric_map_: dict[t.Any, enum.Enum]
@@ -262,12 +742,70 @@ class SymmetricMixin(_SymmetricMixinBase):
     The case insensitive mapping of symmetric values to enumeration values.
     """
 
+    _ep_property_maps_: dict[str, dict[t.Any, enum.Enum]]
+    """
+    The case sensitive mapping of values to enumeration values for each symmetric
+    property, keyed by property name.
+    """
+
+    _ep_iproperty_maps_: dict[str, dict[str, enum.Enum]]
+    """
+    The case insensitive mapping of values to enumeration values for each case
+    folded symmetric property, keyed by property name.
+    """
+
     _ep_coerce_types_: list[type[t.Any]]
     """
     On instantiation, if _missing_ is invoked a coercion attempt will be made to each
     of these types before failure.
     """
 
+    _ep_coerce_dispatch_: dict[type, tuple[tuple[type, t.Any], ...]]
+    """
+    A lazily populated dispatch table that maps the type of a value passed to
+    ``_missing_`` to the ordered chain of (coerce type, guard) pairs in
+    ``_ep_coerce_types_`` that may succeed for it. An empty chain is the cached
+    verdict that no coercion is possible for that type.
+    """
+
+    _ep_miss_cache_: _MissCache | None
+    """
+    The negative lookup cache if ``_miss_cache_size_`` is set, None otherwise.
+    """
+
+    _ep_prefix_index_: dict[str | None, tuple[_PrefixIndex, _PrefixIndex]]
+    """
+    Sorted string keys of the symmetric maps used by ``complete()``, keyed by the
+    property they were drawn from or None for all symmetric properties. Each index
+    is built on first use.
+    """
+
+    _ep_fuzzy_index_: tuple[_FuzzyIndex, _FuzzyIndex] | None
+    """
+    The case sensitive and case folded bigram indexes of the symmetric string
+    values used by ``fuzzy()``, or None until first use.
+    """
+
+    _ep_columns_: dict[str, tuple[t.Any, ...]]
+    """
+    The values of each property for every distinct member in definition order,
+    keyed by property name. See ``column()``.
+    """
+
+    _ep_member_properties_: dict[_Prop, _MemberProperty]
+    """
+    The :func:`member_property` descriptors of this class and its bases, keyed by
+    property. Only set on classes that define or inherit member properties.
+    """
+
+    _ep_pending_: t.Any
+    """
+    The symmetric property values and members the symmetric maps are built from,
+    or None once the maps are built. Maps are built when the class is created
+    unless ``_lazy_symmetry_`` is set, in which case they are built on first
+    lookup.
+    """
+
     _num_sym_props_: int
     """
     The number of symmetric properties on this enumeration.
@@ -278,20 +816,38 @@ class SymmetricMixin(_SymmetricMixinBase):
     List of properties defined on the enumeration class.
     """
 
+    _ep_members_: tuple[t.Any, ...]
+    """
+    The distinct members in definition order, indexed by their ``_ordinal_``.
+    Aliases are not included, named composite flags are.
+    """
+
     __first_class_members__: list[str]
     """
     The list of first class members - this includes all members and aliases. May be
     overridden.
     """
 
+    _ordinal_: int | None = None
+    """
+    The position of this member in ``_ep_members_``. Composite flag values that are
+    not named members have no ordinal.
+    """
+
     def __eq__(self, value: t.Any) -> bool:
         """Symmetric equality - try to coerce value before failure"""
-        if isinstance(value, self.__class__):
-            return self.value == value.value
+        if value is self:
+            return True
+        cls = self.__class__
+        if isinstance(value, cls):
+            return self._value_ == value._value_
         try:
-            return self.value == self.__class__(value).value
+            # resolve without raising - failed comparisons are common and
+            # exceptions are expensive
+            member = type(cls).get(cls, value, _NOT_FOUND)  # type: ignore[attr-defined]
         except (ValueError, TypeError):
             return False
+        return member is not _NOT_FOUND and self._value_ == member._value_
 
     def __ne__(self, value: t.Any) -> bool:
         """Symmetric inequality is the inverse of symmetric equality"""
@@ -324,100 +880,574 @@ class SymmetricMixin(_SymmetricMixinBase):
                 return cls(0)
             return composite
 
-        try:
-            return cls._ep_symmetric_map_[value]
-        except KeyError:
-            pass
+        member = cls._ep_resolve_(value)
+        if member is None:
+            return super()._missing_(value)
+        return member
 
-        if isinstance(value, str):
+    @classmethod
+    def _ep_resolve_(cls, value: t.Any) -> t.Any:
+        """
+        Resolve a value to a member through the symmetric maps and type coercion, in
+        priority order, without raising - private.
+
+        :param value: The value to resolve, lookup by value must already have failed.
+        :raises TypeError: if the value is not hashable.
+        :return: The matching member or None if there is no match.
+        """
+        if cls._ep_pending_ is not None:
+            type(cls)._ep_build_maps_(cls)  # type: ignore[attr-defined]
+
+        miss_key: tuple[type, t.Any] | None = None
+        if cls._ep_miss_cache_ is not None:
+            cls._ep_miss_cache_.validate(len(cls._value2member_map_))
             try:
-                return cls._ep_isymmetric_map_[_do_casenorm(value)]
-            except KeyError:
-                pass
+                miss_key = (type(value), value)
+                if miss_key in cls._ep_miss_cache_:
+                    return None
+            except TypeError:
+                miss_key = None
+
+        # dict.get() avoids raising KeyError on the miss path
+        member = cls._ep_symmetric_map_.get(value)
+        if member is not None:
+            return member
+
+        if isinstance(value, str):
+            member = cls._ep_isymmetric_map_.get(_do_casenorm(value))
+            if member is not None:
+                return member
 
         if value is not None:
-            for coerce_to in cls._ep_coerce_types_:
+            try:
+                chain = cls._ep_coerce_dispatch_[type(value)]
+            except KeyError:
+                chain = _coerce_chain(cls, type(value))
+            for coerce_to, guard in chain:
                 try:
+                    if guard is not None and not guard(value):
+                        continue
                     val = coerce_to(value)
-                    try:
-                        return cls._value2member_map_[val]
-                    except KeyError:
-                        pass
+                    member = cls._value2member_map_.get(val)
+                    if member is None:
+                        member = cls._ep_symmetric_map_.get(val)
+                    if member is None and isinstance(val, str):
+                        member = cls._ep_isymmetric_map_.get(_do_casenorm(val))
+                    if member is not None:
+                        return member
+                except Exception:
+                    pass
 
-                    try:
-                        return cls._ep_symmetric_map_[val]
-                    except KeyError:
-                        pass
+        if miss_key is not None:
+            cls._ep_miss_cache_.add(miss_key)  # type: ignore[union-attr]
+        return None
 
-                    if isinstance(val, str):
-                        return cls._ep_isymmetric_map_[_do_casenorm(val)]
 
-                except Exception:
-                    pass
+_symmetric_missing = SymmetricMixin._missing_.__func__  # type: ignore[attr-defined]
 
-        return super()._missing_(value)
 
+# the type of class dictionary the base enum metaclass prepares
+_EnumDict = type(enum.EnumMeta.__prepare__("_EnumDict", (enum.Enum,)))
 
-class EnumPropertiesMeta(enum.EnumMeta):
+
+class _AnnotationPropertyRecorder(dict):
+    """
+    Stands in for the ``__annotations__`` dictionary of an enumeration class body
+    and creates a property for each annotation as it is recorded.
     """
-    A metaclass for creating enum choices with additional named properties for
-    each value. An :class:`enum.Enum` can be given property support simply by:
 
-    .. code-block::
+    class_dict: "_PropertyEnumDict"
 
-        import enum
-        from enum_properties import EnumPropertiesMeta
+    def __init__(self, class_dict: "_PropertyEnumDict"):
+        self.class_dict = class_dict
+        # we only use annotations to create properties if p/s value
+        # inheritance is not used
+        super().__init__()
 
-        class MyEnum(enum.Enum, metaclass=EnumPropertiesMeta):
-            ...
+    def __setitem__(self, key, value):
+        if self.class_dict._create_properties_:
+            if (
+                key not in EnumPropertiesMeta.RESERVED
+                and key not in EnumPropertiesMeta.EXPECTED
+            ):
+                prop: type[_Prop]
+                if getattr(value, "__metadata__", None) and isinstance(
+                    value.__metadata__[0], Symmetric
+                ):
+                    prop = s(
+                        key,
+                        case_fold=value.__metadata__[0].case_fold,
+                        match_none=value.__metadata__[0].match_none,
+                    )
+                else:
+                    prop = p(key)
+                if key == "name" or key == "value":
+                    if issubclass(prop, _SProp):
+                        if self.class_dict.__contains__("_symmetric_builtins_"):
+                            self.class_dict["_symmetric_builtins_"].append(prop)
+                        else:
+                            self.class_dict["_symmetric_builtins_"] = [prop]
+                else:
+                    if _lazy_annotations_:
+                        self.class_dict._lazy_properties_.append(prop())
+                    else:
+                        self.class_dict._ep_properties_[prop()] = []
+        super().__setitem__(key, value)
 
-    To support symmetrical properties, add the SymmetricMixin:
 
-    .. code-block::
+class _MemberNames(list):
+    """
+    The member names of an enum class dictionary on python < 3.11 - private. The base
+    class dictionary keeps them in a list that it searches every time a name is set
+    in the class body, which makes defining large enumerations quadratic. The names
+    are mirrored in a set so that search is constant time.
+    """
 
-        import enum
-        from enum_properties import (
-            EnumPropertiesMeta,
-            SymmetricMixin
-        )
+    def __init__(self, names: t.Iterable[str] = ()):
+        super().__init__(names)
+        self._names = set(self)
 
-        class MyEnum(SymmetricMixin, enum.Enum, metaclass=EnumPropertiesMeta):
-            ...
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
 
-    All :class:`enum.Enum` functionality is compatible with the EnumPropertiesMeta
-    metaclass. This class works by stripping out the
-    :py:meth:`~enum_properties.p` and :py:meth:`~enum_properties.s`
-    values during ``__prepare__`` and using their class name's as expected
-    property values to set the appropriate values to properties in ``__new__``.
+    def append(self, name: str):
+        super().append(name)
+        self._names.add(name)
 
-    .. automethod:: __prepare__
+    def pop(self, index: t.SupportsIndex = -1) -> str:
+        name = super().pop(index)
+        self._names.discard(name)
+        return name
 
-    """
+    def remove(self, name: str):
+        super().remove(name)
+        self._names.discard(name)
 
-    # members expected to be supplied by inheriting classes
-    EXPECTED = ["_symmetric_builtins_"]
 
-    # members reserved for use by EnumProperties
-    RESERVED = [
-        "_properties_",
-        "_num_sym_props_",
-        "_ep_coerce_types_",
-        "_ep_symmetric_map_",
-        "_ep_isymmetric_map_",
-    ]
+class _PropertyEnumDict(_EnumDict):  # type: ignore[misc,valid-type]
+    """
+    This wrapper class is used to strip properties off of the
+    enumeration values and capture them as they are set into the class
+    dictionary. Wrapping the private enumeration code and delegating
+    all of the existing functionality to the delegate allows a light
+    touch that should be robust to future changes in enum.
+    """
 
-    _ep_symmetric_map_: dict[t.Any, enum.Enum]
-    _ep_isymmetric_map_: dict[str, enum.Enum]
-    _ep_coerce_types_: list[type[t.Any]]
-    _num_sym_props_: int
-    _properties_: list[_Prop]
+    # the class dictionary prepared by the base enum metaclass
+    _ep_class_dict_: t.Any
+    _ep_properties_: dict[_Prop, list[t.Any]]
+    _ep_profile_: t.Any
+
+    # lazy properties in annotation declaration order
+    _lazy_properties_: list[_Prop]
+
+    # member -> value tuple
+    _lazy_property_values_: dict[str, t.Any]
+    _member_properties_: dict[_Prop, _MemberProperty]
+    _specialized_: dict[str, dict[str, _Specialized]]
+    _ids_: dict[int, str]
+    _member_names: list[str] | dict[str, t.Any]
+    _create_properties_: bool
     __first_class_members__: list[str]
 
-    def __call__(  # type: ignore[override]  # pyright: ignore[reportIncompatibleMethodOverride]
-        cls,
-        value,
-        names=None,
-        *,
+    def __init__(
+        self, class_dict: t.Any, properties: dict[_Prop, list[t.Any]], record: t.Any
+    ):
+        super().__init__()
+        if sys.version_info < (3, 11):
+            self._member_names = _MemberNames()
+            class_dict._member_names = _MemberNames(class_dict._member_names)
+        self._ep_class_dict_ = class_dict
+        self._ep_properties_ = properties
+        self._ep_profile_ = record
+        self._lazy_properties_ = []
+        self._lazy_property_values_ = {}
+        self._member_properties_ = {}
+        self._specialized_ = {}
+        self._ids_ = {}
+        self._create_properties_ = False
+        self.__first_class_members__ = []
+        # adopt any state the base metaclass set on its dictionary that ours lacks
+        ours = vars(self)
+        for attr, value in vars(class_dict).items():
+            if attr not in ours:
+                setattr(self, attr, value)
+        for item, value in class_dict.items():
+            self[item] = value
+        self._create_properties_ = not self._ep_properties_
+
+    def add_member_and_properties(self, key: str, value: t.Any) -> t.Any:
+        try:
+            num_vals = len(value) - len(self._ep_properties_)
+            if num_vals < 1 or len(self._ep_properties_) != len(value[num_vals:]):
+                raise ValueError(
+                    f"{key} must have {len(self._ep_properties_)} property values."
+                )
+            idx = num_vals
+            for values in self._ep_properties_.values():
+                values.append(value[idx])
+                idx += 1
+
+            if num_vals == 1:
+                return value[0]
+            else:
+                return value[0:num_vals]
+
+        except TypeError as type_err:
+            raise ValueError(
+                f"{key} must have {len(self._ep_properties_)} property values."
+            ) from type_err
+
+    def __setitem__(self, key, value):
+        if self._ep_profile_ is None:
+            self._ep_setitem_(key, value)
+        else:
+            with self._ep_profile_.stage("members"):
+                self._ep_setitem_(key, value)
+
+    def _ep_setitem_(self, key, value):
+        if isinstance(value, _Specialized):
+            for en_val in value.ids:
+                self._specialized_.setdefault(self._ids_[en_val], {})[key] = value
+        elif isinstance(value, _MarkedSymmetric):
+            prop = s(key, value.symmetric.case_fold, value.symmetric.match_none)
+            if isinstance(value.member, _MemberProperty):
+                # replace inherited or earlier registrations of the name
+                self._member_properties_.pop(key, None)
+                self._member_properties_[prop()] = value.member
+            else:
+                self.setdefault("_symmetric_builtins_", []).append(prop)
+            dict.__setitem__(self, key, value.member)
+        elif isinstance(value, _MemberProperty):
+            self._member_properties_.pop(key, None)
+            self._member_properties_[p(key)()] = value
+            dict.__setitem__(self, key, value)
+        elif key in EnumPropertiesMeta.EXPECTED:
+            dict.__setitem__(self, key, value)
+        elif key in EnumPropertiesMeta.RESERVED:
+            raise ValueError(f"{key} is reserved.")
+        elif self._ep_properties_ or (_lazy_annotations_ and isinstance(value, tuple)):
+            member_names = self._ep_class_dict_._member_names
+            # are we an enum value? - just kick this up to parent class
+            # logic, this code runs once on load - its fine that it's
+            # doing a little redundant work and doing it this way
+            # ensures robust fidelity to Enum behavior.
+            before = len(member_names)
+            self._ep_class_dict_[key] = value
+            if value and isinstance(
+                ((value,) if not isinstance(value, tuple) else value)[0],
+                enum.auto,
+            ):
+                # capture resolved auto() values
+                value = self._ep_class_dict_[key]
+            # are we done with annotations?
+            self._create_properties_ = _lazy_annotations_
+            remove = False
+            if (
+                len(member_names) > before
+                and
+                # base class lets nested classes through! see:
+                # https://github.com/bckohan/enum-properties/issues/29
+                # todo remove below when minimum python >= 3.13
+                not isinstance(value, type)
+            ):
+                self.__first_class_members__.append(key)
+                if _lazy_annotations_ and not self._ep_properties_:
+                    self._lazy_property_values_[key] = value
+                    # we set the value of the member to the first value
+                    # in the tuple - this is important to do here
+                    # because it allows members to be used as their
+                    # value element later on in the declaration - think
+                    # named composite flag values - we may have to
+                    # change this later because we do not know what our
+                    # properties are yet
+                    value = value[0]
+                else:
+                    value = self.add_member_and_properties(key, value)
+
+            elif key in member_names:
+                remove = True  # pragma: no cover
+
+            self._ids_[id(value)] = key
+            super().__setitem__(key, value)
+
+            if remove:
+                # todo remove when minimum python >= 3.13
+                # base class lets nested classes through! see:
+                # https://github.com/bckohan/enum-properties/issues/29
+                if isinstance(self._member_names, list):
+                    # the name was just appended, avoid a linear search
+                    if self._member_names[-1] == key:
+                        self._member_names.pop()
+                    else:
+                        self._member_names.remove(key)
+                else:
+                    # >= python 3.11
+                    del self._member_names[key]
+        else:
+            self._ids_[id(value)] = key
+            if key == "__annotations__":
+                value = _AnnotationPropertyRecorder(self)
+            before = len(self._member_names)
+            super().__setitem__(key, value)
+            if key in {"_generate_next_value_", "_ignore_"}:
+                # this EnumDict renders auto() - so we need to make sure
+                # that any custom _generate_next_value_ is set on it
+                self._ep_class_dict_[key] = value
+            if len(self._member_names) > before:
+                self._create_properties_ = _lazy_annotations_
+
+
+def _open_text(source: t.Any, encoding: str) -> t.ContextManager[t.Any]:
+    """
+    Open a path for reading text, or pass through an open file or other iterable
+    of lines unchanged.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, encoding=encoding, newline="")
+    return nullcontext(source)
+
+
+_BUILD_LOCK = threading.RLock()
+_BUILDING = object()
+
+
+def _build_maps(
+    cls: type[enum.Enum],
+    symmetric_values: dict[_SProp, list[t.Any]],
+    member_values: list[enum.Enum],
+    record: t.Any = None,
+) -> tuple[
+    dict[t.Any, enum.Enum],
+    dict[str, enum.Enum],
+    dict[str, dict[t.Any, enum.Enum]],
+    dict[str, dict[str, enum.Enum]],
+    list[type[t.Any]],
+    int,
+]:
+    """
+    Compute the symmetric lookup state of an enumeration class without modifying
+    it. See :meth:`EnumPropertiesMeta._ep_build_maps_`.
+
+    :return: A tuple of the symmetric map, the case insensitive symmetric map, the
+        per property maps, the case insensitive per property maps, the coerce types
+        and the number of symmetric properties.
+    """
+    symmetric_map: dict[t.Any, enum.Enum] = {}
+    isymmetric_map: dict[str, enum.Enum] = {}
+    property_maps: dict[str, dict[t.Any, enum.Enum]] = {}
+    iproperty_maps: dict[str, dict[str, enum.Enum]] = {}
+    coerce_types: list[type[t.Any]] = []
+    num_sym_props = 0
+
+    def prop_maps(prop: _SProp) -> tuple[dict, dict | None]:
+        return property_maps.setdefault(str(prop), {}), (
+            iproperty_maps.setdefault(str(prop), {}) if prop.case_fold else None
+        )
+
+    # hashability is decided by type, so each type is only checked once
+    hashable_types: set[type[t.Any]] = set()
+    seen_types: set[type[t.Any]] = set()
+
+    def add_sym_lookup(
+        prop: _SProp,
+        p_val: t.Any,
+        enum_inst: enum.Enum,
+        prop_map: dict[t.Any, enum.Enum],
+        iprop_map: dict[str, enum.Enum] | None,
+    ):
+        if p_val is None and not prop.match_none:
+            return
+        if type(p_val) in hashable_types:
+            pass
+        elif isinstance(p_val, Hashable):
+            hashable_types.add(type(p_val))
+        else:
+            raise ValueError(
+                f"{cls}.{prop}:{p_val} is not hashable. Symmetrical "
+                f"enumeration properties must be hashable or a list of "
+                f"hashable values."
+            )
+        symmetric_map[p_val] = enum_inst
+        prop_map[p_val] = enum_inst
+        if iprop_map is not None and isinstance(p_val, str):
+            norm = _do_casenorm(p_val)
+            isymmetric_map[norm] = enum_inst
+            iprop_map[norm] = enum_inst
+
+    def add_coerce_type(typ: type[t.Any]):
+        if typ in seen_types:
+            return
+        seen_types.add(typ)
+        if issubclass(typ, Hashable) and not issubclass(typ, cls):
+            coerce_types.append(typ)
+
+    # we reverse to maintain precedence order for symmetric lookups
+    with _stage(record, "symmetric"):
+        for val in cls:
+            val = t.cast(enum.Enum, val)
+            add_coerce_type(type(val.value))
+
+        for prop in reversed(symmetric_values):
+            num_sym_props += 1
+            maps = prop_maps(prop)
+            for val2, enum_cls in zip(
+                reversed(symmetric_values[prop]), reversed(member_values)
+            ):
+                if isinstance(val2, (set, list)):
+                    for val_item in val2:
+                        add_coerce_type(type(val_item))
+                        add_sym_lookup(prop, val_item, enum_cls, *maps)
+                else:
+                    add_sym_lookup(prop, val2, enum_cls, *maps)
+                    add_coerce_type(type(val2))
+
+    # add builtin symmetries
+    with _stage(record, "builtins"):
+        num_sym_props += len(getattr(cls, "_symmetric_builtins_", []))
+        for sym_builtin in reversed(getattr(cls, "_symmetric_builtins_", [])):
+            # allow simple strings for the default case
+            if isinstance(sym_builtin, str):
+                sym_builtin = s(sym_builtin)()
+            elif issubclass(sym_builtin, _SProp):
+                sym_builtin = sym_builtin()
+            else:
+                raise ValueError(
+                    f"_symmetric_builtins_ contained {type(sym_builtin)}, "
+                    f"expected string or s() property."
+                )
+
+            maps = prop_maps(sym_builtin)
+            for enum_val in cls:
+                enum_val = t.cast(enum.Enum, enum_val)
+                if not hasattr(enum_val, sym_builtin):
+                    raise ValueError(
+                        f"{cls}.{sym_builtin} does not exist, but is listed in"
+                        f" _symmetric_builtins_."
+                    )
+                add_sym_lookup(
+                    sym_builtin, getattr(enum_val, sym_builtin), enum_val, *maps
+                )
+
+    return (
+        symmetric_map,
+        isymmetric_map,
+        property_maps,
+        iproperty_maps,
+        coerce_types,
+        num_sym_props,
+    )
+
+
+def _coerce_chain(
+    cls: type[SymmetricMixin], typ: type
+) -> tuple[tuple[type, t.Any], ...]:
+    """
+    Compute and cache the coercion chain for values of the given type. Coerce types
+    that are guaranteed to fail for the type are dropped, as are builtin types that
+    the value already is - those lookups have been attempted before coercion.
+
+    :param cls: The enumeration class
+    :param typ: The type of the value being coerced
+    :return: The ordered tuple of (coerce type, guard) pairs to attempt
+    """
+    chain = tuple(
+        (coerce_to, _COERCION_GUARDS.get((typ, coerce_to)))
+        for coerce_to in cls._ep_coerce_types_
+        if not (typ is coerce_to and coerce_to.__module__ == "builtins")
+        and _may_coerce(typ, coerce_to)
+    )
+    cls._ep_coerce_dispatch_[typ] = chain
+    return chain
+
+
+class EnumPropertiesMeta(enum.EnumMeta):
+    """
+    A metaclass for creating enum choices with additional named properties for
+    each value. An :class:`enum.Enum` can be given property support simply by:
+
+    .. code-block::
+
+        import enum
+        from enum_properties import EnumPropertiesMeta
+
+        class MyEnum(enum.Enum, metaclass=EnumPropertiesMeta):
+            ...
+
+    To support symmetrical properties, add the SymmetricMixin:
+
+    .. code-block::
+
+        import enum
+        from enum_properties import (
+            EnumPropertiesMeta,
+            SymmetricMixin
+        )
+
+        class MyEnum(SymmetricMixin, enum.Enum, metaclass=EnumPropertiesMeta):
+            ...
+
+    All :class:`enum.Enum` functionality is compatible with the EnumPropertiesMeta
+    metaclass. This class works by stripping out the
+    :py:meth:`~enum_properties.p` and :py:meth:`~enum_properties.s`
+    values during ``__prepare__`` and using their class name's as expected
+    property values to set the appropriate values to properties in ``__new__``.
+
+    .. automethod:: __prepare__
+
+    """
+
+    # members expected to be supplied by inheriting classes
+    EXPECTED = [
+        "_symmetric_builtins_",
+        "_miss_cache_size_",
+        "_lazy_symmetry_",
+        "_compact_properties_",
+    ]
+
+    # members reserved for use by EnumProperties
+    RESERVED = [
+        "_properties_",
+        "_num_sym_props_",
+        "_ep_coerce_types_",
+        "_ep_coerce_dispatch_",
+        "_ep_miss_cache_",
+        "_ep_prefix_index_",
+        "_ep_fuzzy_index_",
+        "_ep_columns_",
+        "_ep_member_properties_",
+        "_ep_pending_",
+        "_ep_symmetric_map_",
+        "_ep_isymmetric_map_",
+        "_ep_property_maps_",
+        "_ep_iproperty_maps_",
+        "_ep_values_",
+        "_ep_members_",
+        "_ordinal_",
+    ]
+
+    _ep_symmetric_map_: dict[t.Any, enum.Enum]
+    _ep_isymmetric_map_: dict[str, enum.Enum]
+    _ep_property_maps_: dict[str, dict[t.Any, enum.Enum]]
+    _ep_iproperty_maps_: dict[str, dict[str, enum.Enum]]
+    _ep_coerce_types_: list[type[t.Any]]
+    _ep_coerce_dispatch_: dict[type, tuple[tuple[type, t.Any], ...]]
+    _ep_miss_cache_: _MissCache | None
+    _ep_prefix_index_: dict[str | None, tuple[_PrefixIndex, _PrefixIndex]]
+    _ep_fuzzy_index_: tuple[_FuzzyIndex, _FuzzyIndex] | None
+    _ep_columns_: dict[str, tuple[t.Any, ...]]
+    _ep_member_properties_: dict[_Prop, _MemberProperty]
+    _ep_members_: tuple[t.Any, ...]
+    _ep_pending_: t.Any
+    _num_sym_props_: int
+    _properties_: list[_Prop]
+    __first_class_members__: list[str]
+
+    def __call__(  # type: ignore[override]  # pyright: ignore[reportIncompatibleMethodOverride]
+        cls,
+        value,
+        names=None,
+        *,
         module=None,
         qualname=None,
         type=None,
@@ -474,14 +1504,76 @@ class EnumPropertiesMeta(enum.EnumMeta):
         # ------------------------------------------------------------------
         # Functional API *with* properties
         # ------------------------------------------------------------------
-        metacls = cls.__class__  # EnumPropertiesMeta
-
-        # Parse each property specification into a p()/s() *type*.
         if isinstance(properties, str):
             raise TypeError(
                 f"'properties' must be an iterable of strings or p()/s() types, "
                 f"not str. Did you mean properties=({properties!r},)?"
             )
+
+        # Parse *names* into (member_name, value) pairs.
+        if isinstance(names, str):
+            names = names.replace(",", " ").split()
+
+        items: Iterable[tuple[str, t.Any]]
+        if isinstance(names, (list, tuple)):
+            if not names:
+                items = []
+            elif isinstance(names[0], str):
+                # Plain list of names – generate sequential values.
+                items = [(name, start + i) for i, name in enumerate(names)]
+            else:
+                items = [tuple(item) for item in names]  # type: ignore[assignment]
+        elif isinstance(names, Mapping):
+            items = names.items()
+        else:
+            # Non-sequence iterables (e.g. generators).  Match Enum functional
+            # API: if this is an iterable of names, generate sequential values;
+            # otherwise, treat elements as (name, value) pairs.
+            raw_items = list(names)
+            if not raw_items:
+                items = []
+            elif all(isinstance(n, str) for n in raw_items):
+                items = [(name, start + i) for i, name in enumerate(raw_items)]
+            else:
+                items = [tuple(item) for item in raw_items]  # type: ignore[assignment]
+
+        if module is None:
+            try:
+                module = sys._getframe(1).f_globals["__name__"]
+            except (AttributeError, ValueError, KeyError):
+                pass
+
+        return cls._ep_functional_(
+            value, items, properties, module, qualname, type, **kwargs
+        )
+
+    def _ep_functional_(
+        cls,
+        name: str,
+        items: Iterable[tuple[str, t.Any]],
+        properties: Iterable[t.Any],
+        module: str | None,
+        qualname: str | None,
+        type: type | None,
+        **kwargs,
+    ):
+        """
+        Create a new enumeration class with properties, see :meth:`__call__`.
+        Member items are consumed one at a time and fed straight into the class
+        dictionary, so they may be streamed from a generator.
+
+        :param name: The name of the new class.
+        :param items: (member name, value) pairs, where values hold the member
+            value followed by its property values.
+        :param properties: Property specifications.
+        :param module: Module name for the new class.
+        :param qualname: Qualified name for the new class.
+        :param type: An optional mixin type for the new class.
+        :return: The new enumeration class.
+        """
+        metacls = cls.__class__  # EnumPropertiesMeta
+
+        # Parse each property specification into a p()/s() *type*.
         prop_types = []
         for prop in properties:
             if isinstance(prop, str):
@@ -508,267 +1600,716 @@ class EnumPropertiesMeta(enum.EnumMeta):
 
         # Let __prepare__ build the classdict (it strips prop_types from bases
         # and populates _ep_properties_).
-        classdict = metacls.__prepare__(value, full_bases, **kwargs)
-
-        # Parse *names* into a list of (member_name, value) pairs.
-        if isinstance(names, str):
-            names = names.replace(",", " ").split()
-
-        items: list[tuple[str, t.Any]]
-        if isinstance(names, (list, tuple)):
-            if not names:
-                items = []
-            elif isinstance(names[0], str):
-                # Plain list of names – generate sequential values.
-                items = [(name, start + i) for i, name in enumerate(names)]
-            else:
-                items = [tuple(item) for item in names]  # type: ignore[assignment]
-        elif isinstance(names, Mapping):
-            items = list(names.items())
-        else:
-            # Non-sequence iterables (e.g. generators).  Match Enum functional
-            # API: if this is an iterable of names, generate sequential values;
-            # otherwise, treat elements as (name, value) pairs.
-            raw_items = list(names)
-            if not raw_items:
-                items = []
-            elif all(isinstance(n, str) for n in raw_items):
-                items = [(name, start + i) for i, name in enumerate(raw_items)]
-            else:
-                items = [tuple(item) for item in raw_items]  # type: ignore[assignment]
+        classdict = metacls.__prepare__(name, full_bases, **kwargs)
 
         # Populate the classdict; _PropertyEnumDict.__setitem__ strips property
         # values from each tuple and records them in _ep_properties_.
-        for name, val in items:
-            classdict[name] = val
+        for member, val in items:
+            classdict[member] = val
 
         # Construct the enum class.  Pass *bases* (without prop_types) because
         # __new__ also filters _Prop subclasses, and __prepare__ already
         # recorded the properties.
-        enum_class = metacls.__new__(metacls, value, bases, classdict, **kwargs)
-        enum_class.__qualname__ = qualname or value
-
-        if module is None:
-            try:
-                module = sys._getframe(1).f_globals["__name__"]
-            except (AttributeError, ValueError, KeyError):
-                pass
+        enum_class = metacls.__new__(metacls, name, bases, classdict, **kwargs)
+        enum_class.__qualname__ = qualname or name
 
         if module is not None:
             enum_class.__module__ = module
 
         return enum_class
 
-    @classmethod
-    def __prepare__(metacls, cls, bases, **kwds):  # type: ignore[override]
+    def from_csv(
+        cls,
+        name: str,
+        source: t.Any,
+        member: str,
+        value: str | None = None,
+        properties: Iterable[t.Any] = (),
+        *,
+        converters: Mapping[str, t.Callable[[str], t.Any]] | None = None,
+        module: str | None = None,
+        qualname: str | None = None,
+        type: type | None = None,
+        start: int = 1,
+        encoding: str = "utf-8",
+        **fmtparams,
+    ):
         """
-        Strip properties out of inheritance and record them on our class
-        dictionary for per-value based assignment in ``__new__``.
+        Create a new enumeration class from the rows of a CSV file with a header
+        row. Rows are read one at a time and fed straight into the class
+        dictionary, so the file is processed in one pass without first being
+        loaded into memory:
+
+        .. code-block:: python
+
+            Currency = EnumProperties.from_csv(
+                "Currency",
+                "currencies.csv",
+                member="code",
+                value="number",
+                properties=[s("symbol"), "decimals"],
+                converters={"number": int, "decimals": int},
+            )
 
-        :raises ValueError: If a reserved name is present as either a property
-            or a member, or if the number of specified properties does not
-            match the number of listed property values in the value tuples.
+        :param name: The name of the new class.
+        :param source: The path of the CSV file, or an open text file or other
+            iterable of lines.
+        :param member: The column holding the member names.
+        :param value: The column holding the member values, or None to number the
+            members sequentially from ``start``.
+        :param properties: The columns to add as properties, each given as a
+            column name or as a :func:`p` or :func:`s` property named after a
+            column.
+        :param converters: Callables keyed by column that convert the text of that
+            column to its value.
+        :param module: Module name for the new class.
+        :param qualname: Qualified name for the new class.
+        :param type: An optional mixin type for the new class.
+        :param start: The first value when members are numbered sequentially.
+        :param encoding: The encoding of the file when ``source`` is a path.
+        :param fmtparams: Formatting parameters passed to :func:`csv.reader`.
+        :raises ValueError: if the header does not contain all of the columns or if
+            a row is missing values.
+        :return: The new enumeration class.
         """
-        bases = list(bases)
-        properties: dict[_Prop, list[t.Any]] = {}
-        real_bases = []
-        for base in bases:
-            if issubclass(base, _Prop):
-                if (
-                    base.name() in EnumPropertiesMeta.RESERVED
-                    or base.name() in EnumPropertiesMeta.EXPECTED
-                ):
-                    raise ValueError(f"{base.name()} is reserved.")
-                properties[base()] = []
+        import csv
+
+        if module is None:
+            module = sys._getframe(1).f_globals.get("__name__")
+        with _open_text(source, encoding) as lines:
+            # short rows are filled with the sentinel so they can be rejected
+            reader = csv.DictReader(lines, restval=_NOT_FOUND, **fmtparams)
+            return cls._ep_from_rows_(
+                name,
+                reader,
+                member,
+                value,
+                properties,
+                converters,
+                module,
+                qualname,
+                type,
+                start,
+                columns=reader.fieldnames or [],
+            )
+
+    def from_json(
+        cls,
+        name: str,
+        source: t.Any,
+        member: str,
+        value: str | None = None,
+        properties: Iterable[t.Any] = (),
+        *,
+        lines: bool = False,
+        converters: Mapping[str, t.Callable[[t.Any], t.Any]] | None = None,
+        module: str | None = None,
+        qualname: str | None = None,
+        type: type | None = None,
+        start: int = 1,
+        encoding: str = "utf-8",
+    ):
+        """
+        Create a new enumeration class from a JSON array of objects, or from JSON
+        Lines with one object per line. JSON Lines are read one line at a time and
+        fed straight into the class dictionary, while a JSON array must be parsed
+        in full before its objects are added. Prefer JSON Lines for large tables.
+
+        :param name: The name of the new class.
+        :param source: The path of the JSON file, or an open text file or other
+            iterable of lines.
+        :param member: The key holding the member names.
+        :param value: The key holding the member values, or None to number the
+            members sequentially from ``start``.
+        :param properties: The keys to add as properties, each given as a key or
+            as a :func:`p` or :func:`s` property named after a key.
+        :param lines: True if the source is JSON Lines.
+        :param converters: Callables keyed by key that convert the JSON value of
+            that key to its value.
+        :param module: Module name for the new class.
+        :param qualname: Qualified name for the new class.
+        :param type: An optional mixin type for the new class.
+        :param start: The first value when members are numbered sequentially.
+        :param encoding: The encoding of the file when ``source`` is a path.
+        :raises ValueError: if the JSON is not a list of objects or if an object is
+            missing one of the keys.
+        :return: The new enumeration class.
+        """
+        import json
+
+        if module is None:
+            module = sys._getframe(1).f_globals.get("__name__")
+        with _open_text(source, encoding) as text:
+            if lines:
+                rows = (json.loads(line) for line in text if line.strip())
             else:
-                real_bases.append(base)
+                # files are read once, other iterables of lines must be joined
+                rows = (
+                    json.load(text)
+                    if hasattr(text, "read")
+                    else json.loads("".join(text))
+                )
+                if not isinstance(rows, list):
+                    raise ValueError(
+                        f"Expected a JSON array of objects, got {rows.__class__}."
+                    )
+            return cls._ep_from_rows_(
+                name,
+                rows,
+                member,
+                value,
+                properties,
+                converters,
+                module,
+                qualname,
+                type,
+                start,
+            )
 
-        class_dict = super().__prepare__(cls, tuple(real_bases), **kwds)
+    def _ep_from_rows_(
+        cls,
+        name: str,
+        rows: Iterable[t.Any],
+        member: str,
+        value: str | None,
+        properties: Iterable[t.Any],
+        converters: Mapping[str, t.Callable[[t.Any], t.Any]] | None,
+        module: str | None,
+        qualname: str | None,
+        type: type | None,
+        start: int,
+        columns: t.Collection[str] | None = None,
+    ):
+        """
+        Create a new enumeration class from an iterable of rows that map column
+        names to values, see :meth:`from_csv` and :meth:`from_json`.
 
-        class _PropertyEnumDict(class_dict.__class__):  # type: ignore[name-defined]
-            """
-            This wrapper class is used to strip properties off of the
-            enumeration values and capture them as they are set into the class
-            dictionary. Wrapping the private enumeration code and delegating
-            all of the existing functionality to the delegate allows a light
-            touch that should be robust to future changes in enum.
-            """
+        :param columns: The columns every row has, if known up front. Rows of
+            known columns hold ``_NOT_FOUND`` for the values they are missing.
+        :raises ValueError: if a row does not have all of the columns.
+        """
+        properties = list(properties)
+        fields = [
+            *([] if value is None else [value]),
+            *(prop if isinstance(prop, str) else prop.name() for prop in properties),
+        ]
+        if columns is not None:
+            missing = [field for field in [member, *fields] if field not in columns]
+            if missing:
+                raise ValueError(
+                    f"Unable to create {name}, missing columns: {', '.join(missing)}."
+                )
+        convert = [
+            (idx, converters[field])
+            for idx, field in enumerate(fields)
+            if converters and field in converters
+        ]
+        member_convert = (converters or {}).get(member)
+
+        def items() -> Generator[tuple[str, t.Any], None, None]:
+            for idx, row in enumerate(rows):
+                try:
+                    member_name = row[member]
+                    values = [row[field] for field in fields]
+                except KeyError as err:
+                    raise ValueError(
+                        f"Unable to create {name}, row {idx + 1} does not have {err}."
+                    ) from err
+                except TypeError as err:
+                    raise ValueError(
+                        f"Unable to create {name}, row {idx + 1} is not an object."
+                    ) from err
+                if columns is not None and (
+                    member_name is _NOT_FOUND or _NOT_FOUND in values
+                ):
+                    missing = (
+                        member
+                        if member_name is _NOT_FOUND
+                        else fields[values.index(_NOT_FOUND)]
+                    )
+                    raise ValueError(
+                        f"Unable to create {name}, row {idx + 1} does not have "
+                        f"{missing!r}."
+                    )
+                if member_convert is not None:
+                    member_name = member_convert(member_name)
+                for pos, converter in convert:
+                    values[pos] = converter(values[pos])
+                if value is None:
+                    values.insert(0, start + idx)
+                yield member_name, tuple(values) if properties else values[0]
 
-            _ep_properties_ = properties
-
-            # lazy properties in annotation declaration order
-            _lazy_properties_: list[_Prop] = []
-
-            # member -> value tuple
-            _lazy_property_values_: dict[str, t.Any] = {}
-            _specialized_: dict[str, dict[str, _Specialized]] = {}
-            _ids_: dict[int, str] = {}
-            _member_names: list[str] | dict[str, t.Any]
-            _create_properties_: bool = False
-            __first_class_members__: list[str] = []
-
-            class AnnotationPropertyRecorder(dict):
-                class_dict: "_PropertyEnumDict"
-                create_properties: bool
-
-                def __init__(self, class_dict: "_PropertyEnumDict"):
-                    self.class_dict = class_dict
-                    # we only use annotations to create properties if p/s value
-                    # inheritance is not used
-                    super().__init__()
-
-                def __setitem__(self, key, value):
-                    if self.class_dict._create_properties_:
-                        if (
-                            key not in EnumPropertiesMeta.RESERVED
-                            and key not in EnumPropertiesMeta.EXPECTED
-                        ):
-                            prop: type[_Prop]
-                            if getattr(value, "__metadata__", None) and isinstance(
-                                value.__metadata__[0], Symmetric
-                            ):
-                                prop = s(
-                                    key,
-                                    case_fold=value.__metadata__[0].case_fold,
-                                    match_none=value.__metadata__[0].match_none,
-                                )
-                            else:
-                                prop = p(key)
-                            if key == "name" or key == "value":
-                                if issubclass(prop, _SProp):
-                                    if self.class_dict.__contains__(
-                                        "_symmetric_builtins_"
-                                    ):
-                                        self.class_dict["_symmetric_builtins_"].append(
-                                            prop
-                                        )
-                                    else:
-                                        self.class_dict["_symmetric_builtins_"] = [prop]
-                            else:
-                                if _lazy_annotations_:
-                                    self.class_dict._lazy_properties_.append(prop())
-                                else:
-                                    self.class_dict._ep_properties_[prop()] = []
-                    super().__setitem__(key, value)
-
-            def __init__(self):
-                super().__init__()
-                for attr in set(dir(class_dict)).difference(set(dir(self))):
-                    setattr(self, attr, getattr(class_dict, attr))
-                for item, value in class_dict.items():
-                    self[item] = value
-                self._create_properties_ = not self._ep_properties_
-
-            def add_member_and_properties(self, key: str, value: t.Any) -> t.Any:
+        return cls._ep_functional_(name, items(), properties, module, qualname, type)
+
+    def get(cls, value: t.Any, default: t.Any = None) -> t.Any:
+        """
+        Fetch the member that ``value`` resolves to, or ``default`` if it does not
+        resolve to a member. Resolution follows the exact same order as
+        instantiating the enumeration from ``value`` would, but for the common
+        case no exceptions are raised, which makes this much cheaper than catching
+        the :exc:`ValueError` raised on failure:
+
+        .. code-block:: python
+
+            MyEnum.get("not a value")  # None
+            MyEnum.get("not a value", MyEnum.DEFAULT)  # MyEnum.DEFAULT
+
+        :param value: The value, symmetric value or member to resolve.
+        :param default: The value to return if ``value`` cannot be resolved.
+        :return: The member ``value`` resolves to or ``default``.
+        """
+        if type(value) is cls:
+            return value
+        try:
+            member = cls._value2member_map_.get(value, _NOT_FOUND)
+        except TypeError:
+            pass
+        else:
+            if member is not _NOT_FOUND:
+                return member
+            if getattr(
+                cls._missing_, "__func__", None
+            ) is _symmetric_missing and not _is_generator(value):
+                member = cls._ep_resolve_(value)  # type: ignore[attr-defined]
+                if member is not None:
+                    return member
+                if not issubclass(cls, enum.Flag):
+                    return default
+        # unhashable values, flags and custom _missing_ implementations must run
+        # through the full instantiation machinery
+        try:
+            return cls(value)
+        except (ValueError, TypeError):
+            return default
+
+    def coerce_many(
+        cls,
+        values: Iterable[t.Any],
+        on_error: str = "raise",
+        default: t.Any = None,
+        lazy: bool = False,
+    ) -> t.Any:
+        """
+        Resolve every value in an iterable to a member. Each distinct value is
+        resolved only once per call, which makes this much faster than
+        instantiating the enumeration from each value when values repeat (e.g. a
+        column of data):
+
+        .. code-block:: python
+
+            MyEnum.coerce_many(["a", "A", "b", "a"], on_error="skip")
+
+        :param values: An iterable of values to resolve.
+        :param on_error: What to do with values that do not resolve to a member.
+            ``raise`` (default) raises the :exc:`ValueError` that instantiation
+            would, ``skip`` leaves the value out of the results and ``default``
+            substitutes ``default``.
+        :param default: The substitute value when ``on_error`` is ``default``.
+        :param lazy: If True, return a generator that yields members as the
+            iterable is consumed instead of a list.
+        :raises ValueError: if ``on_error`` is not one of the above or if a value
+            does not resolve and ``on_error`` is ``raise``.
+        :return: A list of members, or a generator of members if ``lazy``.
+        """
+        if on_error not in {"raise", "skip", "default"}:
+            raise ValueError(
+                f"on_error must be one of 'raise', 'skip' or 'default', not "
+                f"{on_error!r}."
+            )
+        get = type(cls).get
+        memo: dict[tuple[type, t.Any], t.Any] = {}
+
+        def coerce() -> Generator[t.Any, None, None]:
+            for value in values:
+                key = (type(value), value)
                 try:
-                    num_vals = len(value) - len(self._ep_properties_)
-                    if num_vals < 1 or len(self._ep_properties_) != len(
-                        value[num_vals:]
-                    ):
-                        raise ValueError(
-                            f"{key} must have "
-                            f"{len(self._ep_properties_)} property "
-                            f"values."
-                        )
-                    idx = num_vals
-                    for values in self._ep_properties_.values():
-                        values.append(value[idx])
-                        idx += 1
-
-                    if num_vals == 1:
-                        return value[0]
+                    member = memo[key]
+                except KeyError:
+                    member = memo[key] = get(cls, value, _NOT_FOUND)
+                except TypeError:
+                    member = get(cls, value, _NOT_FOUND)
+                if member is _NOT_FOUND:
+                    if on_error == "skip":
+                        continue
+                    if on_error == "default":
+                        member = default
                     else:
-                        return value[0:num_vals]
+                        # instantiate to raise the same error we normally would
+                        member = cls(value)
+                yield member
 
-                except TypeError as type_err:
-                    raise ValueError(
-                        f"{key} must have {len(self._ep_properties_)} property values."
-                    ) from type_err
-
-            def __setitem__(self, key, value):
-                if isinstance(value, _Specialized):
-                    for en_val in value.ids:
-                        self._specialized_.setdefault(self._ids_[en_val], {})[key] = (
-                            value
-                        )
-                elif isinstance(value, _MarkedSymmetric):
-                    self.setdefault("_symmetric_builtins_", []).append(
-                        s(key, value.symmetric.case_fold, value.symmetric.match_none)
-                    )
-                    dict.__setitem__(self, key, value.member)
-                elif key in EnumPropertiesMeta.EXPECTED:
-                    dict.__setitem__(self, key, value)
-                elif key in EnumPropertiesMeta.RESERVED:
-                    raise ValueError(f"{key} is reserved.")
-                elif self._ep_properties_ or (
-                    _lazy_annotations_ and isinstance(value, tuple)
-                ):
-                    member_names = getattr(class_dict, "_member_names")
-                    # are we an enum value? - just kick this up to parent class
-                    # logic, this code runs once on load - its fine that it's
-                    # doing a little redundant work and doing it this way
-                    # ensures robust fidelity to Enum behavior.
-                    before = len(member_names)
-                    class_dict[key] = value
-                    if value and isinstance(
-                        ((value,) if not isinstance(value, tuple) else value)[0],
-                        enum.auto,
-                    ):
-                        # capture resolved auto() values
-                        value = class_dict[key]
-                    # are we done with annotations?
-                    self._create_properties_ = _lazy_annotations_
-                    remove = False
-                    if (
-                        len(member_names) > before
-                        and
-                        # base class lets nested classes through! see:
-                        # https://github.com/bckohan/enum-properties/issues/29
-                        # todo remove below when minimum python >= 3.13
-                        not isinstance(value, type)
-                    ):
-                        self.__first_class_members__.append(key)
-                        if _lazy_annotations_ and not self._ep_properties_:
-                            self._lazy_property_values_[key] = value
-                            # we set the value of the member to the first value in the
-                            # tuple - this is important to do here because it allows
-                            # members to be used as their value element later on in the
-                            # declaration - think named composite flag values - we may
-                            # have to change this later because we do not know what our
-                            # properties are yet
-                            value = value[0]
-                        else:
-                            value = self.add_member_and_properties(key, value)
+        return coerce() if lazy else list(coerce())
 
-                    elif key in member_names:
-                        remove = True  # pragma: no cover
+    def by_property(cls, prop: str, value: t.Any, default: t.Any = _NOT_FOUND) -> t.Any:
+        """
+        Fetch the member whose symmetric property ``prop`` matches ``value``. Only
+        that property is consulted - there is no fall through to other symmetric
+        properties, lookup by value or type coercion. If the property is case
+        folded, case insensitive matches are made after exact matches:
+
+        .. code-block:: python
+
+            ISOCountry.by_property("alpha3", "usa")  # ISOCountry.US
+
+        :param prop: The name of a symmetric property (including symmetric builtins
+            like ``name``).
+        :param value: The property value to look up.
+        :param default: If given, return this value instead of raising when no
+            member matches.
+        :raises ValueError: if ``prop`` is not a symmetric property, or if no member
+            matches and no default was given.
+        :return: The matching member.
+        """
+        if cls._ep_pending_ is not None:
+            cls._ep_build_maps_()
+        prop_map = cls._ep_property_maps_.get(prop)
+        if prop_map is None:
+            raise ValueError(
+                f"{prop!r} is not a symmetric property of {cls.__qualname__}."
+            )
+        member = prop_map.get(value)
+        if member is None and isinstance(value, str):
+            iprop_map = cls._ep_iproperty_maps_.get(prop)
+            if iprop_map is not None:
+                member = iprop_map.get(_do_casenorm(value))
+        if member is not None:
+            return member
+        if default is _NOT_FOUND:
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}.{prop}.")
+        return default
+
+    def complete(
+        cls, prefix: str, limit: int | None = None, prop: str | None = None
+    ) -> list[t.Any]:
+        """
+        Fetch the members with a symmetric string property value that starts with
+        ``prefix``, for instance to back type-ahead search. Case folded properties
+        also match the prefix case insensitively:
 
-                    self._ids_[id(value)] = key
-                    super().__setitem__(key, value)
+        .. code-block:: python
 
-                    if remove:
-                        # todo remove when minimum python >= 3.13
-                        # base class lets nested classes through! see:
-                        # https://github.com/bckohan/enum-properties/issues/29
-                        if isinstance(self._member_names, list):
-                            self._member_names.remove(key)
-                        else:
-                            # >= python 3.11
-                            del self._member_names[key]
+            ISOCountry.complete("united")  # [ISOCountry.AE, ISOCountry.GB, ...]
+
+        Members are returned at most once, ordered by the first of their values to
+        match. Exact case matches are returned before case insensitive ones. The
+        sorted index this searches is built on the first call.
+
+        :param prefix: The prefix to complete.
+        :param limit: The maximum number of members to return, or None for all.
+        :param prop: The name of a symmetric property to complete over. By default
+            the values of all symmetric properties are searched.
+        :raises ValueError: if ``prop`` is not a symmetric property.
+        :return: The list of matching members.
+        """
+        if limit is not None and limit < 1:
+            return []
+        if cls._ep_pending_ is not None:
+            cls._ep_build_maps_()
+        index = cls._ep_prefix_index_.get(prop)
+        if index is None:
+            if prop is None:
+                index = (
+                    _PrefixIndex(cls._ep_symmetric_map_),
+                    _PrefixIndex(cls._ep_isymmetric_map_),
+                )
+            elif prop in cls._ep_property_maps_:
+                index = (
+                    _PrefixIndex(cls._ep_property_maps_[prop]),
+                    _PrefixIndex(cls._ep_iproperty_maps_.get(prop, {})),
+                )
+            else:
+                raise ValueError(
+                    f"{prop!r} is not a symmetric property of {cls.__qualname__}."
+                )
+            cls._ep_prefix_index_[prop] = index
+        found: dict[int, t.Any] = {}
+        for member in chain(
+            index[0].search(prefix), index[1].search(_do_casenorm(prefix))
+        ):
+            if id(member) not in found:
+                found[id(member)] = member
+                if len(found) == limit:
+                    break
+        return list(found.values())
+
+    def fuzzy(
+        cls, value: str, max_distance: int = 2, limit: int | None = None
+    ) -> list[t.Any]:
+        """
+        Fetch the members with a symmetric string property value within
+        ``max_distance`` edits (insertions, deletions or substitutions) of
+        ``value``, for instance to suggest corrections for misspelled input. Case
+        folded properties are compared case insensitively:
+
+        .. code-block:: python
+
+            ISOCountry.fuzzy("Germny")  # [ISOCountry.DE]
+
+        Short values are within a few edits of many short property values, so
+        ``max_distance`` should be small relative to the length of ``value``. The
+        index this searches is built on the first call.
+
+        :param value: The string to match.
+        :param max_distance: The maximum number of edits between ``value`` and a
+            matching property value.
+        :param limit: The maximum number of members to return, or None for all.
+        :raises TypeError: if ``value`` is not a string.
+        :return: The list of matching members, closest first. Ties are broken by
+            the order of the symmetric maps, case sensitive values first.
+        """
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Fuzzy matching requires a string, got {type(value).__name__}."
+            )
+        if cls._ep_pending_ is not None:
+            cls._ep_build_maps_()
+        if cls._ep_fuzzy_index_ is None:
+            folded = cls._ep_isymmetric_map_
+            cls._ep_fuzzy_index_ = (
+                _FuzzyIndex(
+                    (key, member)
+                    for key, member in cls._ep_symmetric_map_.items()
+                    # folded values are always at least as close as their originals
+                    if isinstance(key, str)
+                    and folded.get(_do_casenorm(key)) is not member
+                ),
+                _FuzzyIndex(folded.items()),
+            )
+        sensitive, insensitive = cls._ep_fuzzy_index_
+        # (distance, key position) of the closest key of each member
+        best: dict[int, tuple[int, int]] = {}
+        found: dict[int, t.Any] = {}
+        for offset, matches in (
+            (0, sensitive.search(value, max_distance)),
+            (
+                len(sensitive.keys),
+                insensitive.search(_do_casenorm(value), max_distance),
+            ),
+        ):
+            for entry, (distance, member) in matches.items():
+                rank = (distance, offset + entry)
+                if id(member) not in best or rank < best[id(member)]:
+                    best[id(member)] = rank
+                    found[id(member)] = member
+        ranked = sorted(best, key=best.__getitem__)
+        return [found[key] for key in ranked[:limit]]
+
+    def to_codes(cls, values: t.Any, dtype: t.Any = "int32") -> t.Any:
+        """
+        Convert an array of values into a :mod:`numpy` array of integer member codes.
+        Members are coded by their position in definition order and values that do
+        not resolve to a member are coded -1. Requires :mod:`numpy`, see
+        :func:`enum_properties.arrays.to_codes`.
+
+        :param values: An array or array-like of values to convert.
+        :param dtype: The integer dtype of the returned codes.
+        :raises ValueError: if a value resolves to an unnamed composite flag.
+        :return: An array of member codes the same shape as ``values``.
+        """
+        from enum_properties.arrays import to_codes
+
+        return to_codes(cls, values, dtype=dtype)
+
+    def from_codes(
+        cls,
+        codes: t.Any,
+        prop: str | None = None,
+        fill: t.Any = None,
+        dtype: t.Any = None,
+    ) -> t.Any:
+        """
+        Map a :mod:`numpy` array of member codes back to members, or to the values of
+        one of their properties. Requires :mod:`numpy`, see
+        :func:`enum_properties.arrays.from_codes`.
+
+        :param codes: An array or array-like of member codes.
+        :param prop: The name of the property to map to, or None to map to members.
+        :param fill: The value that -1 codes map to.
+        :param dtype: The dtype of the returned array.
+        :return: An array the same shape as ``codes``.
+        """
+        from enum_properties.arrays import from_codes
+
+        return from_codes(cls, codes, prop=prop, fill=fill, dtype=dtype)
+
+    def from_ordinal(cls, ordinal: int) -> t.Any:
+        """
+        Fetch the member at a position in definition order, the inverse of
+        ``member._ordinal_``. Ordinals are dense, so data about members may be
+        kept in lists or arrays indexed by ordinal instead of in dictionaries keyed
+        by member.
+
+        :param ordinal: The ordinal of the member, between 0 and the number of
+            distinct members - 1.
+        :raises ValueError: if no member has the ordinal.
+        :return: The member.
+        """
+        if 0 <= ordinal < len(cls._ep_members_):
+            return cls._ep_members_[ordinal]
+        raise ValueError(f"{ordinal!r} is not a valid {cls.__qualname__} ordinal.")
+
+    def column(cls, prop: str) -> tuple[t.Any, ...]:
+        """
+        Get the values of a property for every member, in the order the members
+        were defined. Aliases are not included, named composite flags are:
+
+        .. code-block:: python
+
+            ISOCountry.column("alpha3")  # ('AND', 'ARE', 'AFG', ...)
+
+        :param prop: The name of the property.
+        :raises ValueError: if ``prop`` is not a property of the enumeration.
+        :return: A tuple of the property value of each member.
+        """
+        try:
+            return cls._ep_columns_[prop]
+        except KeyError:
+            raise ValueError(
+                f"{prop!r} is not a property of {cls.__qualname__}."
+            ) from None
+
+    def columns(cls) -> dict[str, tuple[t.Any, ...]]:
+        """
+        Get the values of every property for every member, see :meth:`column`.
+
+        :return: A dictionary of property names to the tuple of values of that
+            property, in the order the properties were defined.
+        """
+        return dict(cls._ep_columns_)
+
+    def column_array(cls, prop: str, typecode: str | None = None) -> t.Any:
+        """
+        Get the values of a property for every member as an array, see
+        :meth:`column`. If a typecode is given the values are returned in a
+        standard library :class:`array.array`, otherwise in a :mod:`numpy` array
+        of the inferred dtype, which requires :mod:`numpy`. See
+        :func:`enum_properties.arrays.column`.
+
+        :param prop: The name of the property.
+        :param typecode: The :mod:`array` typecode of the values.
+        :raises ValueError: if ``prop`` is not a property of the enumeration.
+        :return: An array of the property value of each member.
+        """
+        if typecode is not None:
+            from array import array
+
+            return array(typecode, cls.column(prop))
+        from enum_properties.arrays import column
+
+        return column(cls, prop)
+
+    def miss_cache_info(cls) -> MissCacheInfo | None:
+        """
+        Report the statistics of this enumeration's negative lookup cache. The cache
+        is enabled by setting ``_miss_cache_size_`` on the class to the maximum
+        number of failed lookup values to remember.
+
+        :return: A :class:`~enum_properties.MissCacheInfo` or None if the negative
+            lookup cache is not enabled.
+        """
+        if cls._ep_miss_cache_ is None:
+            return None
+        return cls._ep_miss_cache_.info()
+
+    def _ep_build_maps_(cls, record: t.Any = None):
+        """
+        Build the symmetric maps, the per property maps and the coerce types from
+        the symmetric property values held in ``_ep_pending_``. This runs at most
+        once per class, when the class is created or on first lookup if
+        ``_lazy_symmetry_`` is set. Builds are serialized across threads and nothing
+        is published unless the build succeeds, so a build that fails raises the
+        same error every time it is attempted.
+
+        :raises ValueError: if ``_symmetric_builtins_`` is specified
+            incorrectly, or if non-hashable values are provided for a
+            symmetric property.
+        """
+        with _BUILD_LOCK:
+            pending = cls._ep_pending_
+            if pending is None or pending is _BUILDING:
+                # built or being built further up this thread's stack
+                return
+            cls._ep_pending_ = _BUILDING
+            try:
+                maps = _build_maps(cls, *pending, record)
+            except BaseException:
+                cls._ep_pending_ = pending
+                raise
+            cls._ep_publish_maps_(maps)
+
+    def _ep_publish_maps_(cls, maps: t.Any):
+        """
+        Install symmetric lookup state computed by :func:`_build_maps` or loaded
+        from a snapshot onto the class, replacing any pending build.
+
+        :param maps: A tuple of the symmetric map, the case insensitive symmetric
+            map, the per property maps, the case insensitive per property maps, the
+            coerce types and the number of symmetric properties.
+        """
+        (
+            symmetric_map,
+            isymmetric_map,
+            property_maps,
+            iproperty_maps,
+            coerce_types,
+            num_sym_props,
+        ) = maps
+        with _BUILD_LOCK:
+            cls._ep_symmetric_map_.update(symmetric_map)
+            cls._ep_isymmetric_map_ = isymmetric_map
+            cls._ep_property_maps_ = property_maps
+            cls._ep_iproperty_maps_ = iproperty_maps
+            cls._ep_coerce_types_ = coerce_types
+            cls._num_sym_props_ = num_sym_props
+            cls._ep_maps_changed_()
+            cls._ep_pending_ = None
+
+    def _ep_maps_changed_(cls):
+        """
+        Invalidate all state derived from the symmetric maps and coerce types. This
+        must be called any time they are modified after class creation.
+        """
+        cls._ep_coerce_dispatch_ = {}
+        cls._ep_prefix_index_ = {}
+        cls._ep_fuzzy_index_ = None
+        if cls._ep_miss_cache_ is not None:
+            cls._ep_miss_cache_.clear()
+
+    @classmethod
+    def __prepare__(metacls, cls, bases, **kwds):  # type: ignore[override]
+        """
+        Strip properties out of inheritance and record them on our class
+        dictionary for per-value based assignment in ``__new__``.
+
+        :raises ValueError: If a reserved name is present as either a property
+            or a member, or if the number of specified properties does not
+            match the number of listed property values in the value tuples.
+        """
+        record = None if _profiler is None else _profiler.new_class(cls)
+        with _stage(record, "prepare"):
+            bases = list(bases)
+            properties: dict[_Prop, list[t.Any]] = {}
+            real_bases = []
+            for base in bases:
+                if issubclass(base, _Prop):
+                    if (
+                        base.name() in EnumPropertiesMeta.RESERVED
+                        or base.name() in EnumPropertiesMeta.EXPECTED
+                    ):
+                        raise ValueError(f"{base.name()} is reserved.")
+                    properties[base()] = []
                 else:
-                    self._ids_[id(value)] = key
-                    if key == "__annotations__":
-                        value = self.AnnotationPropertyRecorder(self)
-                    before = len(self._member_names)
-                    super().__setitem__(key, value)
-                    if key in {"_generate_next_value_", "_ignore_"}:
-                        # this EnumDict renders auto() - so we need to make sure that
-                        # any custom _generate_next_value_ is set on it
-                        class_dict[key] = value
-                    if len(self._member_names) > before:
-                        self._create_properties_ = _lazy_annotations_
-
-        return _PropertyEnumDict()  # type: ignore[no-untyped-call]
+                    real_bases.append(base)
+
+            class_dict = super().__prepare__(cls, tuple(real_bases), **kwds)
+
+            classdict = _PropertyEnumDict(class_dict, properties, record)
+            # member properties are inherited, the first base to define one wins
+            for base in reversed(real_bases):
+                classdict._member_properties_.update(
+                    getattr(base, "_ep_member_properties_", {})
+                )
+            return classdict
 
     def __new__(mcs, classname, bases, classdict, **kwargs):
         """
@@ -777,7 +2318,8 @@ class EnumPropertiesMeta(enum.EnumMeta):
         1) pass up the inheritance tree to build the initial enumeration class.
         2) Add method specializations to each class
         3) Add property value to enumeration value maps for each property and
-            the property accessors that use them
+            the property accessors that use them, then compute the values of any
+            member properties
         4) Add casefolded symmetric maps for any symmetric properties
         5) Add any symmetric builtin properties to our symmetric maps
 
@@ -785,52 +2327,89 @@ class EnumPropertiesMeta(enum.EnumMeta):
             incorrectly, or if non-hashable values are provided for a
             symmetric property.
         """
+        record = getattr(classdict, "_ep_profile_", None)
+        if record is not None:
+            record.name = ".".join(
+                name
+                for name in (
+                    classdict.get("__module__"),
+                    classdict.get("__qualname__", classname),
+                )
+                if name
+            )
+
         if _lazy_annotations_ and not classdict._ep_properties_:
             """
             In python 3.14+ annotations are loaded after enum members are
             defined, so we have to reconcile our properties here.
             """
-            from annotationlib import (  # pyright: ignore[reportMissingImports]
-                Format,
-                call_annotate_function,
-                get_annotate_from_class_namespace,
-            )
+            with _stage(record, "annotations"):
+                from annotationlib import (  # pyright: ignore[reportMissingImports]
+                    Format,
+                    call_annotate_function,
+                    get_annotate_from_class_namespace,
+                )
 
-            annotate = get_annotate_from_class_namespace(classdict)
-            if annotate:
-                classdict["__annotations__"] = {}
-                for attr, typ in call_annotate_function(
-                    annotate, format=Format.VALUE
-                ).items():
-                    classdict["__annotations__"][attr] = typ  # or other formats
-
-            if classdict._lazy_property_values_:
-                classdict._ep_properties_ = {
-                    prop: [] for prop in classdict._lazy_properties_
-                }
-                for en, value in classdict._lazy_property_values_.items():
-                    real_value = classdict.add_member_and_properties(en, value)
-                    if real_value != classdict[en] and isinstance(real_value, tuple):
-                        # if we're here - our assumption that the value was the first
-                        # element of the member tuple was wrong - reset it to the real
-                        # value bypassing EnumDict checks
-                        dict.__setitem__(classdict, en, real_value)
-
-            classdict._lazy_properties_.clear()
-            classdict._lazy_property_values_.clear()
-
-        cls = super().__new__(
-            mcs,
-            classname,
-            tuple(base for base in bases if not issubclass(base, _Prop)),
-            classdict,
-            **kwargs,
-        )
+                annotate = get_annotate_from_class_namespace(classdict)
+                if annotate:
+                    classdict["__annotations__"] = {}
+                    for attr, typ in call_annotate_function(
+                        annotate, format=Format.VALUE
+                    ).items():
+                        classdict["__annotations__"][attr] = typ  # or other formats
+
+                if classdict._lazy_property_values_:
+                    classdict._ep_properties_ = {
+                        prop: [] for prop in classdict._lazy_properties_
+                    }
+                    for en, value in classdict._lazy_property_values_.items():
+                        real_value = classdict.add_member_and_properties(en, value)
+                        if real_value != classdict[en] and isinstance(
+                            real_value, tuple
+                        ):
+                            # if we're here - our assumption that the value was the
+                            # first element of the member tuple was wrong - reset it
+                            # to the real value bypassing EnumDict checks
+                            dict.__setitem__(classdict, en, real_value)
+
+                classdict._lazy_properties_.clear()
+                classdict._lazy_property_values_.clear()
+
+        with _stage(record, "enum"):
+            cls = super().__new__(
+                mcs,
+                classname,
+                tuple(base for base in bases if not issubclass(base, _Prop)),
+                classdict,
+                **kwargs,
+            )
         cls._ep_coerce_types_ = []
+        cls._ep_coerce_dispatch_ = {}
+        cls._ep_miss_cache_ = None
+        cls._ep_prefix_index_ = {}
+        cls._ep_fuzzy_index_ = None
         cls._num_sym_props_ = 0
         cls._ep_symmetric_map_ = cls._member_map_
         cls._ep_isymmetric_map_ = {}
+        cls._ep_property_maps_ = {}
+        cls._ep_iproperty_maps_ = {}
         cls._properties_ = list(classdict._ep_properties_.keys())
+        cls._ep_members_ = tuple(
+            {id(member): member for member in cls._member_map_.values()}.values()
+        )
+
+        miss_cache_size = getattr(cls, "_miss_cache_size_", None)
+        if miss_cache_size is not None:
+            if (
+                not isinstance(miss_cache_size, int)
+                or isinstance(miss_cache_size, bool)
+                or miss_cache_size < 1
+            ):
+                raise ValueError(
+                    f"_miss_cache_size_ must be a positive integer, got "
+                    f"{miss_cache_size!r}."
+                )
+            cls._ep_miss_cache_ = _MissCache(miss_cache_size)
 
         # we allow users to override this
         cls.__first_class_members__ = classdict.get(
@@ -838,92 +2417,99 @@ class EnumPropertiesMeta(enum.EnumMeta):
         )
 
         if classdict._specialized_:
-            for val in cls:  # type: ignore[var-annotated]
-                val = t.cast(enum.Enum, val)
-                for member_name, specialization in classdict._specialized_.get(
-                    val._name_, {}
-                ).items():
-                    # use descriptor binding
-                    setattr(val, member_name, specialization.wrapped.__get__(val))
-
-        def add_sym_lookup(prop: _SProp, p_val: t.Any, enum_inst: enum.Enum):
-            if p_val is None and not prop.match_none:
-                return
-            if not isinstance(p_val, Hashable):
-                raise ValueError(
-                    f"{cls}.{prop}:{p_val} is not hashable. Symmetrical "
-                    f"enumeration properties must be hashable or a list of "
-                    f"hashable values."
-                )
-            cls._ep_symmetric_map_[p_val] = enum_inst
-            if prop.case_fold and isinstance(p_val, str):
-                cls._ep_isymmetric_map_[_do_casenorm(p_val)] = enum_inst
-
-        def add_coerce_type(typ: type[t.Any]):
-            if (
-                typ not in cls._ep_coerce_types_
-                and issubclass(typ, Hashable)
-                and not issubclass(typ, cls)
-            ):
-                cls._ep_coerce_types_.append(typ)
-
-        for val in cls:
-            val = t.cast(enum.Enum, val)
-            add_coerce_type(type(val.value))
+            with _stage(record, "specialize"):
+                for val in cls:  # type: ignore[var-annotated]
+                    val = t.cast(enum.Enum, val)
+                    for member_name, specialization in classdict._specialized_.get(
+                        val._name_, {}
+                    ).items():
+                        # use descriptor binding
+                        setattr(val, member_name, specialization.wrapped.__get__(val))
 
         # set properties onto the members
-        for idx, member in enumerate(cls.__members__.values()):  # type: ignore[var-annotated]
-            member = t.cast(enum.Enum, member)
-            for prop, values in classdict._ep_properties_.items():
+        with _stage(record, "properties"):
+            # aliases are listed again, their values are set last so they win
+            positions = {
+                id(member): idx for idx, member in enumerate(cls.__members__.values())
+            }
+            compact = getattr(cls, "_compact_properties_", False)
+            if compact:
+                property_values = list(classdict._ep_properties_.values())
                 try:
-                    setattr(member, prop, values[idx])
+                    rows = [
+                        tuple(values[idx] for values in property_values)
+                        for idx in positions.values()
+                    ]
                 except IndexError as ierr:
                     raise ValueError(
-                        f"{member} must have {len(classdict._ep_properties_)} property "
-                        "values."
+                        f"{cls._ep_members_[-1]} must have "
+                        f"{len(classdict._ep_properties_)} property values."
                     ) from ierr
-
-        # we reverse to maintain precedence order for symmetric lookups
-        cls._num_sym_props_ = 0
+                _set_compact_values(cls, rows)
+            else:
+                for idx, member in enumerate(cls.__members__.values()):  # type: ignore[var-annotated]
+                    member = t.cast(enum.Enum, member)
+                    for prop, values in classdict._ep_properties_.items():
+                        try:
+                            setattr(member, prop, values[idx])
+                        except IndexError as ierr:
+                            raise ValueError(
+                                f"{member} must have "
+                                f"{len(classdict._ep_properties_)} property values."
+                            ) from ierr
+                for ordinal, member in enumerate(cls._ep_members_):
+                    member._ordinal_ = ordinal
+            member_properties = {}
+            for prop, member_prop in classdict._member_properties_.items():
+                if dict.get(classdict, prop) is member_prop:
+                    if prop in classdict._ep_properties_:
+                        raise ValueError(f"{prop} is already a property.")
+                elif prop in classdict or prop in classdict._ep_properties_:
+                    # the class body overrides an inherited member property
+                    continue
+                member_properties[prop] = member_prop
+            if classdict._member_properties_:
+                cls._ep_member_properties_ = member_properties
+            if member_properties:
+                for prop, member_prop in member_properties.items():
+                    computed = {
+                        id(member): member_prop.func(member)
+                        for member in cls._ep_members_
+                    }
+                    if not compact:
+                        for member in cls._ep_members_:
+                            setattr(member, prop, computed[id(member)])
+                    classdict._ep_properties_[prop] = [
+                        computed[id(member)] for member in cls.__members__.values()
+                    ]
+                    cls._properties_.append(prop)
+                if compact:
+                    property_values = list(classdict._ep_properties_.values())
+                    _set_compact_values(
+                        cls,
+                        (
+                            tuple(values[idx] for values in property_values)
+                            for idx in positions.values()
+                        ),
+                    )
+            cls._ep_columns_ = {
+                str(prop): tuple(map(values.__getitem__, positions.values()))
+                for prop, values in classdict._ep_properties_.items()
+            }
+
+        symmetric_values = {
+            t.cast(_SProp, prop): classdict._ep_properties_[prop]
+            for prop in cls._properties_
+            if prop.symmetric
+        }
+        # aliases share the value list entry of their canonical member
         member_values = t.cast(
             list[enum.Enum],
             list(cls._value2member_map_.values() or cls.__members__.values()),
         )
-        for prop in reversed([prop for prop in cls._properties_ if prop.symmetric]):
-            cls._num_sym_props_ += 1
-            prop = t.cast(_SProp, prop)
-            for idx, val2 in enumerate(reversed(classdict._ep_properties_[prop])):
-                enum_cls = member_values[len(member_values) - 1 - idx]
-                if isinstance(val2, (set, list)):
-                    for val_item in val2:
-                        add_coerce_type(type(val_item))
-                        add_sym_lookup(prop, val_item, enum_cls)
-                else:
-                    add_sym_lookup(prop, val2, enum_cls)
-                    add_coerce_type(type(val2))
-
-        # add builtin symmetries
-        cls._num_sym_props_ += len(getattr(cls, "_symmetric_builtins_", []))
-        for sym_builtin in reversed(getattr(cls, "_symmetric_builtins_", [])):
-            # allow simple strings for the default case
-            if isinstance(sym_builtin, str):
-                sym_builtin = s(sym_builtin)()
-            elif issubclass(sym_builtin, _SProp):
-                sym_builtin = sym_builtin()
-            else:
-                raise ValueError(
-                    f"_symmetric_builtins_ contained {type(sym_builtin)}, "
-                    f"expected string or s() property."
-                )
-
-            for enum_val in cls:  # type: ignore[var-annotated]
-                enum_val = t.cast(enum.Enum, enum_val)
-                if not hasattr(enum_val, sym_builtin):
-                    raise ValueError(
-                        f"{cls}.{sym_builtin} does not exist, but is listed in"
-                        f" _symmetric_builtins_."
-                    )
-                add_sym_lookup(sym_builtin, getattr(enum_val, sym_builtin), enum_val)
+        cls._ep_pending_ = (symmetric_values, member_values)
+        if not getattr(cls, "_lazy_symmetry_", False):
+            cls._ep_build_maps_(record)
 
         return cls
 
@@ -1093,3 +2679,9 @@ class IntFlagProperties(  # pyright: ignore[reportIncompatibleMethodOverride,rep
 
     def __hash__(self):
         return enum.IntFlag.__hash__(self)
+
+
+if os.environ.get("ENUM_PROPERTIES_PROFILE"):  # pragma: no cover
+    from enum_properties.profiling import _profile_from_environment
+
+    _profile_from_environment()
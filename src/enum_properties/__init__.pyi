@@ -1,11 +1,21 @@
 """Type stubs for enum_properties."""
 
 import enum
+import os
 import sys
 from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from types import MappingProxyType
-from typing import Any, Callable, Generic, Literal, TypeAlias, TypeVar, overload
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Literal,
+    NamedTuple,
+    TypeAlias,
+    TypeVar,
+    overload,
+)
 
 VERSION: tuple[int, int, int]
 __title__: str
@@ -14,6 +24,8 @@ __author__: str
 __license__: str
 __copyright__: str
 
+_profiler: Any
+
 _T = TypeVar("_T")
 _PropertyT = TypeVar("_PropertyT", bound=property)
 _EnumMemberT = TypeVar("_EnumMemberT")
@@ -27,6 +39,12 @@ class Symmetric:
     case_fold: bool = False
     match_none: bool = False
 
+class MissCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 class _Prop(str):
     symmetric: bool
     @classmethod
@@ -37,6 +55,22 @@ class _SProp(_Prop):
     case_fold: bool
     match_none: bool
 
+class _CompactProperty:
+    name: str
+    index: int
+    default: Any
+    fallback: _MemberProperty[Any] | None
+    def __init__(
+        self,
+        name: str,
+        index: int,
+        default: Any = ...,
+        fallback: _MemberProperty[Any] | None = None,
+    ) -> None: ...
+    def __get__(self, instance: Any, owner: Any = None) -> Any: ...
+
+def _set_compact_values(cls: Any, rows: Iterable[tuple[Any, ...]]) -> None: ...
+
 _PropertySpec: TypeAlias = str | type[_Prop]
 
 def s(
@@ -53,11 +87,27 @@ class _SymmetricProperty(Generic[_T]):
     @overload
     def __get__(self, obj: Any, objtype: type[Any] | None = ...) -> _T: ...
 
+class _MemberProperty(Generic[_T]):
+    """Descriptor returned by @member_property; __get__ on an instance returns _T."""
+
+    func: Callable[[Any], _T]
+    def __init__(self, func: Callable[[Any], _T]) -> None: ...
+    @overload
+    def __get__(
+        self, instance: None, owner: type[Any] = ...
+    ) -> _MemberProperty[_T]: ...
+    @overload
+    def __get__(self, instance: Any, owner: type[Any] | None = ...) -> _T: ...
+
+def member_property(func: Callable[[Any], _T]) -> _MemberProperty[_T]: ...
+
 class _SymmetricDecorator:
     """Return type of symmetric() — wraps a callable as a symmetric property."""
     @overload
     def __call__(self, f: _PropertyT) -> _PropertyT: ...
     @overload
+    def __call__(self, f: _MemberProperty[_T]) -> _MemberProperty[_T]: ...
+    @overload
     def __call__(self, f: Callable[[Any], _T]) -> _SymmetricProperty[_T]: ...
 
 def symmetric(
@@ -68,13 +118,28 @@ def specialize(
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 class EnumPropertiesMeta(enum.EnumMeta):
+    EXPECTED: list[str]
+    RESERVED: list[str]
     _ep_symmetric_map_: dict[Any, enum.Enum]
     _ep_isymmetric_map_: dict[str, enum.Enum]
+    _ep_property_maps_: dict[str, dict[Any, enum.Enum]]
+    _ep_iproperty_maps_: dict[str, dict[str, enum.Enum]]
     _ep_coerce_types_: list[type[Any]]
+    _ep_coerce_dispatch_: dict[type, tuple[tuple[type, Any], ...]]
+    _ep_miss_cache_: Any
+    _ep_prefix_index_: dict[str | None, Any]
+    _ep_fuzzy_index_: Any
+    _ep_columns_: dict[str, tuple[Any, ...]]
+    _ep_member_properties_: dict[_Prop, _MemberProperty[Any]]
+    _ep_members_: tuple[Any, ...]
+    _ep_pending_: Any
     _num_sym_props_: int
     _properties_: list[_Prop]
     __first_class_members__: list[str]
 
+    def _ep_build_maps_(cls, record: Any = None) -> None: ...
+    def _ep_publish_maps_(cls, maps: Any) -> None: ...
+    def _ep_maps_changed_(cls) -> None: ...
     def __iter__(self: type[_EnumMemberT]) -> Iterator[_EnumMemberT]: ...
     def __reversed__(self: type[_EnumMemberT]) -> Iterator[_EnumMemberT]: ...
     def __contains__(self: type[Any], value: object) -> bool: ...
@@ -86,6 +151,107 @@ class EnumPropertiesMeta(enum.EnumMeta):
     def __len__(self) -> int: ...
     def __bool__(self) -> Literal[True]: ...
     @overload
+    def get(cls: type[_EnumMemberT], value: Any) -> _EnumMemberT | None: ...
+    @overload
+    def get(cls: type[_EnumMemberT], value: Any, default: _T) -> _EnumMemberT | _T: ...
+    @overload
+    def coerce_many(
+        cls: type[_EnumMemberT],
+        values: Iterable[Any],
+        on_error: Literal["raise", "skip"] = "raise",
+        default: None = None,
+        lazy: Literal[False] = False,
+    ) -> list[_EnumMemberT]: ...
+    @overload
+    def coerce_many(
+        cls: type[_EnumMemberT],
+        values: Iterable[Any],
+        on_error: Literal["raise", "skip"] = "raise",
+        default: None = None,
+        *,
+        lazy: Literal[True],
+    ) -> Iterator[_EnumMemberT]: ...
+    @overload
+    def coerce_many(
+        cls: type[_EnumMemberT],
+        values: Iterable[Any],
+        on_error: Literal["default"],
+        default: _T,
+        lazy: Literal[False] = False,
+    ) -> list[_EnumMemberT | _T]: ...
+    @overload
+    def coerce_many(
+        cls: type[_EnumMemberT],
+        values: Iterable[Any],
+        on_error: Literal["default"],
+        default: _T,
+        *,
+        lazy: Literal[True],
+    ) -> Iterator[_EnumMemberT | _T]: ...
+    @overload
+    def by_property(cls: type[_EnumMemberT], prop: str, value: Any) -> _EnumMemberT: ...
+    @overload
+    def by_property(
+        cls: type[_EnumMemberT], prop: str, value: Any, default: _T
+    ) -> _EnumMemberT | _T: ...
+    def complete(
+        cls: type[_EnumMemberT],
+        prefix: str,
+        limit: int | None = None,
+        prop: str | None = None,
+    ) -> list[_EnumMemberT]: ...
+    def fuzzy(
+        cls: type[_EnumMemberT],
+        value: str,
+        max_distance: int = 2,
+        limit: int | None = None,
+    ) -> list[_EnumMemberT]: ...
+    def to_codes(cls, values: Any, dtype: Any = "int32") -> Any: ...
+    def from_codes(
+        cls,
+        codes: Any,
+        prop: str | None = None,
+        fill: Any = None,
+        dtype: Any = None,
+    ) -> Any: ...
+    def from_ordinal(cls: type[_EnumMemberT], ordinal: int) -> _EnumMemberT: ...
+    def column(cls, prop: str) -> tuple[Any, ...]: ...
+    def columns(cls) -> dict[str, tuple[Any, ...]]: ...
+    def column_array(cls, prop: str, typecode: str | None = None) -> Any: ...
+    def miss_cache_info(cls) -> MissCacheInfo | None: ...
+    def from_csv(
+        cls,
+        name: str,
+        source: str | os.PathLike[str] | Iterable[str],
+        member: str,
+        value: str | None = None,
+        properties: Iterable[_PropertySpec] = (),
+        *,
+        converters: Mapping[str, Callable[[str], Any]] | None = None,
+        module: str | None = None,
+        qualname: str | None = None,
+        type: type | None = None,
+        start: int = 1,
+        encoding: str = "utf-8",
+        **fmtparams: Any,
+    ) -> type[enum.Enum]: ...
+    def from_json(
+        cls,
+        name: str,
+        source: str | os.PathLike[str] | Iterable[str],
+        member: str,
+        value: str | None = None,
+        properties: Iterable[_PropertySpec] = (),
+        *,
+        lines: bool = False,
+        converters: Mapping[str, Callable[[Any], Any]] | None = None,
+        module: str | None = None,
+        qualname: str | None = None,
+        type: type | None = None,
+        start: int = 1,
+        encoding: str = "utf-8",
+    ) -> type[enum.Enum]: ...
+    @overload
     def __call__(
         cls: type[_EnumMemberT], value: Any, names: None = None
     ) -> _EnumMemberT: ...
@@ -132,14 +298,27 @@ class EnumPropertiesMeta(enum.EnumMeta):
 class SymmetricMixin:
     _ep_symmetric_map_: dict[Any, enum.Enum]
     _ep_isymmetric_map_: dict[str, enum.Enum]
+    _ep_property_maps_: dict[str, dict[Any, enum.Enum]]
+    _ep_iproperty_maps_: dict[str, dict[str, enum.Enum]]
     _ep_coerce_types_: list[type[Any]]
+    _ep_coerce_dispatch_: dict[type, tuple[tuple[type, Any], ...]]
+    _ep_miss_cache_: Any
+    _ep_prefix_index_: dict[str | None, Any]
+    _ep_fuzzy_index_: Any
+    _ep_columns_: dict[str, tuple[Any, ...]]
+    _ep_member_properties_: dict[_Prop, _MemberProperty[Any]]
+    _ep_members_: tuple[Any, ...]
+    _ep_pending_: Any
     _num_sym_props_: int
     _properties_: list[_Prop]
     __first_class_members__: list[str]
+    _ordinal_: int | None
     def __eq__(self, value: Any) -> bool: ...
     def __ne__(self, value: Any) -> bool: ...
     @classmethod
     def _missing_(cls, value: Any) -> Any: ...
+    @classmethod
+    def _ep_resolve_(cls, value: Any) -> Any: ...
 
 # DecomposeMixin provides flag decomposition functionality.
 # __iter__ is intentionally not declared here to avoid conflicts with Flag.__iter__
@@ -0,0 +1,192 @@
+"""
+NumPy support for enumerations with properties. Arrays of raw values can be
+converted to compact integer member codes and codes can be mapped back to members or
+property values. Members are coded by their position in definition order, their
+``_ordinal_``, and -1 codes values that do not resolve to a member.
+
+This module requires :mod:`numpy`, which is an optional dependency:
+
+.. code-block:: bash
+
+    pip install enum-properties[numpy]
+"""
+
+import enum
+import typing as t
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "enum_properties.arrays requires numpy: pip install enum-properties[numpy]"
+    ) from err
+
+__all__ = ["column", "from_codes", "members", "to_codes"]
+
+MISSING_CODE = -1
+"""
+The code given to values that do not resolve to a member.
+"""
+
+
+def members(enum_cls: type[enum.Enum]) -> tuple[enum.Enum, ...]:
+    """
+    Get the members of an enumeration in code order. Unlike iteration this includes
+    named composite flags but never includes aliases.
+
+    :param enum_cls: The enumeration class
+    :return: A tuple of members where the index of each member is its code, which
+        is also its ``_ordinal_``.
+    """
+    ordered = getattr(enum_cls, "_ep_members_", None)
+    if ordered is None:
+        unique = {id(member): member for member in enum_cls._member_map_.values()}
+        ordered = tuple(unique.values())
+    return ordered
+
+
+def _factorize(values: "np.ndarray") -> tuple[list[t.Any], "np.ndarray"]:
+    """
+    Reduce a flat array to its distinct values and the index into those values of
+    each element. Object arrays may hold values of mixed, unorderable types so they
+    are deduplicated by (type, value) instead of sorted.
+    """
+    if values.dtype.kind != "O":
+        uniques, inverse = np.unique(values, return_inverse=True)
+        return uniques.tolist(), inverse.reshape(-1)
+    distinct: list[t.Any] = []
+    index: dict[tuple[type, t.Any], int] = {}
+    inverse = np.empty(len(values), dtype=np.intp)
+    for pos, value in enumerate(values.tolist()):
+        try:
+            key = (type(value), value)
+            idx = index.get(key)
+            if idx is None:
+                idx = index[key] = len(distinct)
+                distinct.append(value)
+        except TypeError:
+            idx = len(distinct)
+            distinct.append(value)
+        inverse[pos] = idx
+    return distinct, inverse
+
+
+def to_codes(
+    enum_cls: type[enum.Enum], values: t.Any, dtype: t.Any = np.int32
+) -> "np.ndarray":
+    """
+    Convert an array of values to an array of member codes. Values are resolved
+    exactly as instantiating the enumeration would resolve them, but each distinct
+    value is only resolved once.
+
+    :param enum_cls: The enumeration class
+    :param values: An array of values to convert. Any other iterable is treated
+        as a one dimensional object array of its elements.
+    :param dtype: The integer dtype of the returned codes.
+    :raises ValueError: if a value resolves to an unnamed composite flag, which
+        has no code.
+    :return: An array of the same shape as values holding the code of the member
+        each value resolves to, or -1 if it does not resolve.
+    """
+    if isinstance(values, np.ndarray):
+        arr = values
+    else:
+        # numpy would upcast mixed types and nest sequences if left to infer
+        values = list(values)
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+    distinct, inverse = _factorize(arr.reshape(-1))
+    resolved = type(enum_cls).coerce_many(  # type: ignore[attr-defined]
+        enum_cls, distinct, on_error="default"
+    )
+    codes = []
+    for value, member in zip(distinct, resolved):
+        if member is None:
+            codes.append(MISSING_CODE)
+        elif member._ordinal_ is None:
+            raise ValueError(
+                f"{value!r} resolves to {member!r}, an unnamed composite of "
+                f"{enum_cls.__qualname__} that has no code."
+            )
+        else:
+            codes.append(member._ordinal_)
+    lookup = np.array(codes, dtype=dtype)
+    return lookup[inverse].reshape(arr.shape)
+
+
+def from_codes(
+    enum_cls: type[enum.Enum],
+    codes: t.Any,
+    prop: str | None = None,
+    fill: t.Any = None,
+    dtype: t.Any = None,
+) -> "np.ndarray":
+    """
+    Map an array of member codes back to members or to the values of one of their
+    properties.
+
+    :param enum_cls: The enumeration class
+    :param codes: An array or array-like of member codes.
+    :param prop: The name of the property to map to, or None to map to members.
+    :param fill: The value that -1 codes map to.
+    :param dtype: The dtype of the returned array, by default it is inferred from
+        the property values when ``prop`` is given and is object otherwise.
+    :raises ValueError: if a code is not -1 or the code of a member.
+    :return: An array of the same shape as codes.
+    """
+    table = list(members(enum_cls))
+    codes = np.asarray(codes)
+    if codes.size and (codes.min() < MISSING_CODE or codes.max() >= len(table)):
+        raise ValueError(
+            f"Codes must be between {MISSING_CODE} and {len(table) - 1} for "
+            f"{enum_cls.__qualname__}."
+        )
+    if prop is not None:
+        columns = getattr(enum_cls, "_ep_columns_", {})
+        table = (
+            list(columns[prop])
+            if prop in columns
+            else [getattr(member, prop) for member in table]
+        )
+    # -1 indexes the fill value at the end of the table
+    table.append(fill)
+    lookup = _array(table, dtype, infer=prop is not None)
+    return lookup[codes]
+
+
+def column(enum_cls: type[enum.Enum], prop: str, dtype: t.Any = None) -> "np.ndarray":
+    """
+    Get the values of a property for every member as an array, in code order.
+
+    :param enum_cls: The enumeration class
+    :param prop: The name of the property.
+    :param dtype: The dtype of the returned array, by default it is inferred from
+        the property values.
+    :raises ValueError: if ``prop`` is not a property of the enumeration.
+    :return: A one dimensional array of the property value of each member.
+    """
+    values = type(enum_cls).column(enum_cls, prop)  # type: ignore[attr-defined]
+    return _array(values, dtype, infer=True)
+
+
+def _array(values: t.Sequence[t.Any], dtype: t.Any, infer: bool) -> "np.ndarray":
+    """
+    Make a one dimensional array of values. Without a dtype it is inferred if
+    ``infer`` is true and the array holds objects otherwise, or if inference would
+    not produce a one dimensional array.
+    """
+    arr = None
+    if dtype is not None and dtype is not object:
+        arr = np.array(values, dtype=dtype)
+    elif infer and dtype is None:
+        try:
+            arr = np.array(values)
+        except ValueError:
+            pass
+        if arr is not None and arr.ndim != 1:
+            # sequence property values must not become array dimensions
+            arr = None
+    if arr is None:
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+    return arr
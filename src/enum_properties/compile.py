@@ -0,0 +1,460 @@
+"""
+Compile modules of enumerations with properties into static modules that define
+equivalent enumerations from literal data. Generated modules hold the member values,
+the property values of every member and the fully built symmetric lookup maps,
+including case folded keys, so importing them skips capturing and stripping
+properties from member values and never builds any symmetric maps.
+
+Generate a static module at build time:
+
+.. code-block:: bash
+
+    python -m enum_properties.compile my_app.enums -o my_app/enums_static.py
+
+and import your enumerations from it at runtime. The generated module must be
+regenerated whenever the enumerations it was compiled from change.
+
+Only enumerations that are pure data may be compiled. Member values and property
+values must be python literals, and the class body may not define methods other
+than :func:`~enum_properties.symmetric` properties, which are compiled to plain
+property values. Base classes are imported from the modules they are defined in.
+"""
+
+import builtins
+import enum
+import sys
+import typing as t
+
+import enum_properties
+from enum_properties import EnumPropertiesMeta, _set_compact_values, p, s
+
+__all__ = ["compile_class", "compile_module", "load", "main"]
+
+_CLASS_ATTRIBUTES = {
+    "__module__",
+    "__qualname__",
+    "__doc__",
+    "__annotations__",
+    "__annotate__",
+    "__annotate_func__",
+    "__annotations_cache__",
+    "__firstlineno__",
+    "__static_attributes__",
+    *EnumPropertiesMeta.EXPECTED,
+}
+
+
+_Maps = tuple[
+    dict[t.Any, enum.Enum],
+    dict[str, enum.Enum],
+    dict[str, dict[t.Any, enum.Enum]],
+    dict[str, dict[str, enum.Enum]],
+    list[type[t.Any]],
+    int,
+]
+"""
+The symmetric lookup state of a class: the symmetric map, the case insensitive
+symmetric map, the per property maps, the case insensitive per property maps, the
+coerce types and the number of symmetric properties.
+"""
+
+
+def _builtin_spec(builtin: t.Any) -> t.Any:
+    if isinstance(builtin, str):
+        return builtin
+    return builtin.name(), builtin.case_fold, builtin.match_none
+
+
+def _type_name(typ: type) -> tuple[str, str]:
+    return typ.__module__, typ.__qualname__
+
+
+def _resolve_type(module: str, qualname: str) -> type:
+    """
+    Find a type by its module and qualified name without importing anything.
+
+    :raises LookupError: if the type cannot be found.
+    """
+    if (module, qualname) == ("builtins", "NoneType"):
+        # the type of None is not an attribute of builtins
+        return type(None)
+    obj: t.Any = builtins if module == "builtins" else sys.modules.get(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part, None)
+    if not isinstance(obj, type):
+        raise LookupError(f"Unable to resolve {module}.{qualname}.")
+    return obj
+
+
+def _snapshot(cls: type[enum.Enum], maps: _Maps) -> tuple[t.Any, ...]:
+    """
+    Encode the symmetric lookup state of a class as plain data. Members are encoded
+    by their position in ``_member_map_``.
+
+    :param cls: The enumeration class
+    :param maps: The lookup state of the class.
+    :raises LookupError: if a coerce type cannot be found by name.
+    :return: The snapshot, see :func:`_hydrate`.
+    """
+    symmetric_map, isymmetric_map, property_maps, iproperty_maps, types, num = maps
+    positions: dict[int, int] = {}
+    for pos, member in enumerate(cls._member_map_.values()):
+        positions.setdefault(id(member), pos)
+
+    def encode(mapping: dict[t.Any, enum.Enum]) -> tuple[list[t.Any], list[int]]:
+        return list(mapping), [positions[id(member)] for member in mapping.values()]
+
+    type_names = []
+    for typ in types:
+        name = _type_name(typ)
+        if _resolve_type(*name) is not typ:
+            raise LookupError(f"{name} does not resolve to {typ}.")
+        type_names.append(name)
+
+    return (
+        encode(symmetric_map),
+        encode(isymmetric_map),
+        {prop: encode(mapping) for prop, mapping in property_maps.items()},
+        {prop: encode(mapping) for prop, mapping in iproperty_maps.items()},
+        type_names,
+        num,
+    )
+
+
+def _hydrate(cls: type[enum.Enum], snap: tuple[t.Any, ...]) -> _Maps:
+    """
+    Decode a :func:`_snapshot` back into the symmetric lookup state of a class.
+
+    :param cls: The enumeration class the snapshot was taken of.
+    :param snap: The snapshot
+    :raises LookupError: if a coerce type or member cannot be found.
+    :return: The lookup state of the class.
+    """
+    get = list(cls._member_map_.values()).__getitem__
+
+    def decode(encoded: tuple[list[t.Any], list[int]]) -> dict[t.Any, enum.Enum]:
+        keys, positions = encoded
+        return dict(zip(keys, map(get, positions)))
+
+    symmetric_map, isymmetric_map, property_maps, iproperty_maps, types, num = snap
+    return (
+        decode(symmetric_map),
+        decode(isymmetric_map),
+        {prop: decode(encoded) for prop, encoded in property_maps.items()},
+        {prop: decode(encoded) for prop, encoded in iproperty_maps.items()},
+        [_resolve_type(*name) for name in types],
+        num,
+    )
+
+
+def load(
+    name: str,
+    bases: tuple[type[enum.Enum], ...],
+    members: list[tuple[str, t.Any]],
+    properties: list[tuple[t.Any, ...]],
+    computed: list[str],
+    values: list[tuple[t.Any, ...]],
+    maps: tuple[t.Any, ...],
+    attributes: dict[str, t.Any],
+    module: str,
+    doc: str | None = None,
+) -> type[enum.Enum]:
+    """
+    Define an enumeration from the literal data written by :func:`compile_class`.
+    This is called by generated modules and is not meant to be called directly.
+
+    :param name: The name of the class.
+    :param bases: The base classes.
+    :param members: The (name, value) pairs of the members, including aliases.
+    :param properties: The (name, case_fold, match_none) of each symmetric
+        property, or the (name,) of each non-symmetric property.
+    :param computed: The names of the :func:`~enum_properties.symmetric`
+        properties.
+    :param values: The values of the properties followed by the values of the
+        computed properties of each distinct member, in definition order.
+    :param maps: A :func:`_snapshot` of the symmetric lookup state.
+    :param attributes: The configuration attributes defined on the class.
+    :param module: The module the class is defined in.
+    :param doc: The docstring of the class.
+    :return: The enumeration class.
+    """
+    metacls: t.Any = type(bases[-1])
+    classdict = metacls.__prepare__(name, bases)
+    # member property values are loaded below instead of computed
+    classdict._member_properties_.clear()
+    classdict["__module__"] = module
+    classdict["__qualname__"] = name
+    for attr, value in attributes.items():
+        if attr == "_symmetric_builtins_":
+            value = [
+                builtin if isinstance(builtin, str) else s(*builtin)
+                for builtin in value
+            ]
+        classdict[attr] = value
+    # the maps are loaded below instead of built
+    classdict["_lazy_symmetry_"] = True
+    for member, value in members:
+        classdict[member] = value
+    cls = metacls(name, bases, classdict)
+    if "_lazy_symmetry_" in attributes:
+        cls._lazy_symmetry_ = attributes["_lazy_symmetry_"]
+    else:
+        del cls._lazy_symmetry_
+    if doc is not None:
+        cls.__doc__ = doc
+
+    cls._properties_ = [
+        (s(*prop) if len(prop) > 1 else p(*prop))() for prop in properties
+    ]
+    names = [str(prop) for prop in cls._properties_] + computed
+    compact = len(properties) if getattr(cls, "_compact_properties_", False) else 0
+    if compact:
+        _set_compact_values(cls, (row[:compact] for row in values))
+    for member, row in zip(cls._ep_members_, values):
+        for prop, value in zip(names[compact:], row[compact:]):
+            setattr(member, prop, value)
+    cls._ep_columns_ = {
+        name: tuple(row[idx] for row in values)
+        for idx, name in enumerate(names[: len(properties)])
+    }
+    cls._ep_publish_maps_(_hydrate(cls, maps))
+    return cls
+
+
+def _literal(value: t.Any, what: str) -> str:
+    """
+    :raises ValueError: if the value is not a python literal.
+    :return: The python source of the value.
+    """
+    import ast
+    import marshal
+    import pprint
+
+    source = pprint.pformat(value, width=80, compact=True, sort_dicts=False)
+    try:
+        # marshal only accepts exact builtin types, so subclasses whose repr
+        # would silently lose their type are rejected
+        marshal.dumps(value)
+        if ast.literal_eval(source) != value:
+            raise ValueError(source)
+    except (ValueError, TypeError, SyntaxError) as err:
+        raise ValueError(f"{what} is not a python literal: {value!r}") from err
+    return source
+
+
+def _import_name(obj: t.Any, module: str) -> tuple[str, str]:
+    """
+    :raises ValueError: if the object cannot be imported from another module.
+    """
+    if obj.__module__ == module or "." in obj.__qualname__:
+        raise ValueError(
+            f"{obj.__module__}.{obj.__qualname__} must be importable from a module "
+            f"other than the one being compiled."
+        )
+    return obj.__module__, obj.__qualname__
+
+
+def compile_class(cls: t.Any) -> tuple[str, list[tuple[str, str]]]:
+    """
+    Generate the source code that defines an enumeration from literal data.
+
+    :param cls: The enumeration class, it must be an
+        :class:`~enum_properties.EnumPropertiesMeta` class.
+    :raises ValueError: if the class cannot be compiled.
+    :return: A tuple of the source code and the (module, name) of each object the
+        source code needs to import.
+    """
+    import types
+
+    if not isinstance(cls, EnumPropertiesMeta):
+        raise ValueError(f"{cls.__qualname__} is not an EnumPropertiesMeta class.")
+    module = cls.__module__
+    # build anything that was deferred so the maps are complete
+    cls._ep_build_maps_()
+
+    members = {
+        name: member
+        for name, member in cls._member_map_.items()
+        if isinstance(name, str) and vars(cls).get(name) is member
+    }
+    # symmetric() properties are descriptors on the class, their values are
+    # compiled like any other property value
+    computed = []
+    for builtin in getattr(cls, "_symmetric_builtins_", []):
+        spec = _builtin_spec(builtin)
+        name = spec if isinstance(spec, str) else spec[0]
+        if name not in members and hasattr(vars(cls).get(name), "__get__"):
+            computed.append(name)
+
+    probe = types.new_class("_Probe", cls.__bases__)
+    allowed = {
+        *vars(probe),
+        *members,
+        *computed,
+        *_CLASS_ATTRIBUTES,
+        # the accessors of compact property values and member properties
+        *(str(prop) for prop in cls._properties_),
+        "_ordinal_",
+        "_ep_member_properties_",
+    }
+    unsupported = [name for name in vars(cls) if name not in allowed]
+    if unsupported:
+        raise ValueError(
+            f"{cls.__qualname__} defines {', '.join(map(str, unsupported))} which "
+            f"cannot be compiled."
+        )
+
+    names = [str(prop) for prop in cls._properties_] + computed
+    distinct = {id(member): member for member in members.values()}
+    # specializations are bound to the members they specialize
+    unsupported = [
+        f"{member._name_}.{attr}"
+        for member in distinct.values()
+        for attr in vars(member)
+        if attr not in names and not (attr[0] == attr[-1] == "_")
+    ]
+    if unsupported:
+        raise ValueError(
+            f"{cls.__qualname__} specializes {', '.join(unsupported)} which cannot "
+            f"be compiled."
+        )
+
+    bases = [_import_name(base, module) for base in cls.__bases__]
+    properties = [
+        _builtin_spec(type(prop)) if prop.symmetric else (str(prop),)
+        for prop in cls._properties_
+    ]
+    rows = [
+        tuple(getattr(member, prop) for prop in names) for member in distinct.values()
+    ]
+    attributes = {
+        attr: [_builtin_spec(builtin) for builtin in value]
+        if attr == "_symmetric_builtins_"
+        else value
+        for attr, value in vars(cls).items()
+        if attr in EnumPropertiesMeta.EXPECTED
+    }
+    try:
+        maps = _snapshot(
+            t.cast(type[enum.Enum], cls),
+            (
+                cls._ep_symmetric_map_,
+                cls._ep_isymmetric_map_,
+                cls._ep_property_maps_,
+                cls._ep_iproperty_maps_,
+                cls._ep_coerce_types_,
+                cls._num_sym_props_,
+            ),
+        )
+    except LookupError as err:
+        raise ValueError(
+            f"{cls.__qualname__} has values of a type that cannot be imported: {err}"
+        ) from err
+
+    def arg(name: str, value: t.Any, what: str) -> str:
+        source = _literal(value, f"{cls.__qualname__} {what}")
+        return f"    {name}=" + source.replace("\n", "\n    ") + ","
+
+    lines = [
+        f"{cls.__name__} = load(",
+        f"    {cls.__name__!r},",
+        f"    ({''.join(f'{base}, ' for _, base in bases).strip()}),",
+        arg(
+            "members",
+            [(name, member._value_) for name, member in members.items()],
+            "member values",
+        ),
+        arg("properties", properties, "properties"),
+        arg("computed", computed, "computed properties"),
+        arg("values", rows, "property values"),
+        arg("maps", maps, "symmetric values"),
+        arg("attributes", attributes, "attributes"),
+        "    module=__name__,",
+    ]
+    if isinstance(cls.__doc__, str) and cls.__doc__ != probe.__doc__:
+        lines.append(arg("doc", cls.__doc__, "docstring"))
+    lines.append(")")
+    return "\n".join(lines), bases
+
+
+def compile_module(module: str) -> str:
+    """
+    Generate a static module that defines all of the enumerations with members
+    defined at the top level of the given module.
+
+    :param module: The import path of the module to compile.
+    :raises ValueError: if an enumeration in the module cannot be compiled.
+    :return: The source code of the static module.
+    """
+    import importlib
+
+    mod = importlib.import_module(module)
+    sources = []
+    imports: dict[str, list[str]] = {}
+    for name, obj in vars(mod).items():
+        if (
+            isinstance(obj, EnumPropertiesMeta)
+            and obj.__module__ == module
+            and obj.__name__ == name
+            and obj._member_map_
+        ):
+            source, bases = compile_class(obj)
+            sources.append(source)
+            for base_module, base in bases:
+                if base_module == "builtins":
+                    continue
+                if base not in imports.setdefault(base_module, []):
+                    imports[base_module].append(base)
+
+    header = [
+        '"""',
+        f"Generated by python -m enum_properties.compile {module}",
+        f"with enum-properties {enum_properties.__version__}. Do not edit.",
+        '"""',
+        "",
+        *(
+            f"from {base_module} import {', '.join(names)}"
+            for base_module, names in imports.items()
+        ),
+        "from enum_properties.compile import load",
+        "",
+        "",
+    ]
+    return "\n".join(header) + "\n\n\n".join(sources) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    The command line entry point, see ``python -m enum_properties.compile --help``.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m enum_properties.compile",
+        description=(
+            "Compile the enumerations defined in a module into a static module "
+            "that defines them from literal data."
+        ),
+    )
+    parser.add_argument("module", help="the import path of the module to compile")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="the file to write the generated module to, stdout by default",
+    )
+    args = parser.parse_args(argv)
+    try:
+        source = compile_module(args.module)
+    except (ImportError, ValueError) as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 1
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(source)
+    else:
+        sys.stdout.write(source)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
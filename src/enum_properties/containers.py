@@ -0,0 +1,431 @@
+"""
+Containers of the members of an enumeration with properties. Values are kept
+in lists or bits indexed by member ``_ordinal_``, so accessing them never hashes or
+compares members. Keys may be members or any value that resolves to a member,
+including symmetric property values.
+
+.. code-block:: python
+
+    from enum_properties.containers import EnumMap, EnumSet
+
+    population = EnumMap(ISOCountry)
+    population["USA"] = 334_914_895
+    population[ISOCountry.US]  # 334914895
+
+    eu = EnumSet(ISOCountry, ["FRA", "DEU", "ITA"])
+    "fr" in eu  # True
+"""
+
+import enum
+import typing as t
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSet
+
+__all__ = ["EnumMap", "EnumSet"]
+
+E = t.TypeVar("E", bound=enum.Enum)
+V = t.TypeVar("V")
+
+_MISSING: t.Any = object()
+"""
+Marks the slots of members that are not in a container.
+"""
+
+
+def _members(enum_cls: type[enum.Enum]) -> tuple[t.Any, ...]:
+    """
+    :raises TypeError: if the class is not an enumeration with properties.
+    :return: The distinct members of the enumeration in ordinal order.
+    """
+    members = getattr(enum_cls, "_ep_members_", None)
+    if members is None:
+        raise TypeError(
+            f"{enum_cls!r} is not an enumeration with properties, containers "
+            f"require an EnumPropertiesMeta class."
+        )
+    return members
+
+
+def _ordinal(enum_cls: type[enum.Enum], key: t.Any) -> int:
+    """
+    :raises KeyError: if the key does not resolve to a named member.
+    :return: The ordinal of the member the key resolves to.
+    """
+    if type(key) is not enum_cls:
+        # get() resolves without raising on misses
+        get = type(enum_cls).get  # type: ignore[attr-defined]
+        member = get(enum_cls, key, _MISSING)
+        if member is _MISSING:
+            raise KeyError(key)
+        key = member
+    ordinal = key._ordinal_
+    if ordinal is None:
+        # composite flag values that are not named members
+        raise KeyError(key)
+    return ordinal
+
+
+class EnumMap(MutableMapping[E, V]):
+    """
+    A mutable mapping of the members of an enumeration to values, stored in a list
+    indexed by member ordinal. Keys that are not members are resolved to members
+    the same way instantiating the enumeration resolves values, so symmetric
+    property values may be used as keys. Keys that do not resolve, and composite
+    flag values that are not named members, are never in the map.
+
+    Iteration is in member definition order, not insertion order.
+
+    :param enum_cls: The enumeration whose members are the keys.
+    :param items: A mapping or iterable of (key, value) pairs to initialize the
+        map with.
+    """
+
+    __slots__ = ("_enum", "_len", "_values")
+
+    _enum: type[E]
+    _values: list[t.Any]
+    _len: int
+
+    def __init__(
+        self,
+        enum_cls: type[E],
+        items: Mapping[t.Any, V] | Iterable[tuple[t.Any, V]] = (),
+    ) -> None:
+        self._enum = enum_cls
+        self._values = [_MISSING] * len(_members(enum_cls))
+        self._len = 0
+        self.update(items)
+
+    @property
+    def enum(self) -> type[E]:
+        """The enumeration whose members are the keys."""
+        return self._enum
+
+    def __getitem__(self, key: t.Any) -> V:
+        value = self._values[_ordinal(self._enum, key)]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: t.Any, value: V) -> None:
+        ordinal = _ordinal(self._enum, key)
+        if self._values[ordinal] is _MISSING:
+            self._len += 1
+        self._values[ordinal] = value
+
+    def __delitem__(self, key: t.Any) -> None:
+        ordinal = _ordinal(self._enum, key)
+        if self._values[ordinal] is _MISSING:
+            raise KeyError(key)
+        self._values[ordinal] = _MISSING
+        self._len -= 1
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return self._values[_ordinal(self._enum, key)] is not _MISSING
+        except KeyError:
+            return False
+
+    def get(self, key: t.Any, default: t.Any = None) -> t.Any:
+        try:
+            value = self._values[_ordinal(self._enum, key)]
+        except KeyError:
+            return default
+        return default if value is _MISSING else value
+
+    def __iter__(self) -> Iterator[E]:
+        return (
+            member
+            for member, value in zip(self._enum._ep_members_, self._values)  # type: ignore[attr-defined]
+            if value is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        return self._len
+
+    def clear(self) -> None:
+        self._values = [_MISSING] * len(self._values)
+        self._len = 0
+
+    def copy(self) -> "EnumMap[E, V]":
+        """
+        :return: A shallow copy of the map.
+        """
+        copy = type(self).__new__(type(self))
+        copy._enum = self._enum
+        copy._values = list(self._values)
+        copy._len = self._len
+        return copy
+
+    __copy__ = copy
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EnumMap) and other._enum is self._enum:
+            return self._values == other._values
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._enum.__qualname__}, "
+            f"{{{', '.join(f'{key!r}: {value!r}' for key, value in self.items())}}})"
+        )
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return type(self), (self._enum, list(self.items()))
+
+
+class EnumSet(MutableSet[E]):
+    """
+    A mutable set of the members of an enumeration, stored as the bits of an
+    integer indexed by member ordinal. Set operations between sets of the same
+    enumeration are single integer operations, and the set of all the members of
+    an enumeration with a thousand members is a 128 byte integer. Values that are
+    not members are resolved to members the same way instantiating the enumeration
+    resolves values, so symmetric property values may be tested for membership and
+    added. Values that do not resolve are never in the set.
+
+    Iteration is in member definition order, not insertion order.
+
+    :param enum_cls: The enumeration whose members may be in the set.
+    :param members: An iterable of members or values that resolve to members to
+        initialize the set with.
+    """
+
+    __slots__ = ("_bits", "_enum")
+
+    _enum: type[E]
+    _bits: int
+
+    def __init__(self, enum_cls: type[E], members: Iterable[t.Any] = ()) -> None:
+        _members(enum_cls)
+        self._enum = enum_cls
+        self._bits = 0
+        for member in members:
+            self._bits |= 1 << _ordinal(enum_cls, member)
+
+    @classmethod
+    def from_bits(cls, enum_cls: type[E], bits: int) -> "EnumSet[E]":
+        """
+        Create a set from its :attr:`bits`.
+
+        :param enum_cls: The enumeration whose members may be in the set.
+        :param bits: The integer whose set bits are the ordinals of the members.
+        :raises ValueError: if a set bit is not the ordinal of a member.
+        :return: The set.
+        """
+        if bits < 0 or bits >> len(_members(enum_cls)):
+            raise ValueError(
+                f"{bits!r} is not a valid set of {enum_cls.__qualname__} members."
+            )
+        enum_set = cls.__new__(cls)
+        enum_set._enum = enum_cls
+        enum_set._bits = bits
+        return enum_set
+
+    @classmethod
+    def all(cls, enum_cls: type[E]) -> "EnumSet[E]":
+        """
+        :param enum_cls: The enumeration.
+        :return: A set of all of the members of the enumeration.
+        """
+        return cls.from_bits(enum_cls, (1 << len(_members(enum_cls))) - 1)
+
+    @property
+    def enum(self) -> type[E]:
+        """The enumeration whose members may be in the set."""
+        return self._enum
+
+    @property
+    def bits(self) -> int:
+        """The integer whose set bits are the ordinals of the members in the set."""
+        return self._bits
+
+    def _from_iterable(self, members: Iterable[t.Any]) -> "EnumSet[E]":  # type: ignore[override]
+        # used by the Set mixins to build results from other iterables
+        return type(self)(self._enum, members)
+
+    def _with_bits(self, bits: int) -> "EnumSet[E]":
+        """
+        :return: A set of the same enumeration with the given, already valid, bits.
+        """
+        enum_set = object.__new__(type(self))
+        enum_set._enum = self._enum
+        enum_set._bits = bits
+        return enum_set
+
+    def _other_bits(self, other: t.Any) -> int | None:
+        """
+        :return: The bits of another set of the same enumeration, otherwise None.
+        """
+        if isinstance(other, EnumSet) and other._enum is self._enum:
+            return other._bits
+        return None
+
+    def __contains__(self, member: object) -> bool:
+        try:
+            return bool(self._bits >> _ordinal(self._enum, member) & 1)
+        except KeyError:
+            return False
+
+    def add(self, member: t.Any) -> None:
+        """
+        Add a member to the set.
+
+        :raises KeyError: if the value does not resolve to a member.
+        """
+        self._bits |= 1 << _ordinal(self._enum, member)
+
+    def discard(self, member: t.Any) -> None:
+        try:
+            self._bits &= ~(1 << _ordinal(self._enum, member))
+        except KeyError:
+            pass
+
+    def remove(self, member: t.Any) -> None:
+        bit = 1 << _ordinal(self._enum, member)
+        if not self._bits & bit:
+            raise KeyError(member)
+        self._bits ^= bit
+
+    def clear(self) -> None:
+        self._bits = 0
+
+    def __iter__(self) -> Iterator[E]:
+        members = self._enum._ep_members_  # type: ignore[attr-defined]
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield members[low.bit_length() - 1]
+            bits ^= low
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def copy(self) -> "EnumSet[E]":
+        """
+        :return: A copy of the set.
+        """
+        return self._with_bits(self._bits)
+
+    __copy__ = copy
+
+    def __or__(self, other: t.Any) -> t.Any:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__or__(other)
+        return self._with_bits(self._bits | bits)
+
+    def __and__(self, other: t.Any) -> t.Any:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__and__(other)
+        return self._with_bits(self._bits & bits)
+
+    def __sub__(self, other: t.Any) -> t.Any:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__sub__(other)
+        return self._with_bits(self._bits & ~bits)
+
+    def __xor__(self, other: t.Any) -> t.Any:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__xor__(other)
+        return self._with_bits(self._bits ^ bits)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __ior__(self, other: t.Any) -> "EnumSet[E]":
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__ior__(other)
+        self._bits |= bits
+        return self
+
+    def __iand__(self, other: t.Any) -> "EnumSet[E]":
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__iand__(other)
+        self._bits &= bits
+        return self
+
+    def __isub__(self, other: t.Any) -> "EnumSet[E]":
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__isub__(other)
+        self._bits &= ~bits
+        return self
+
+    def __ixor__(self, other: t.Any) -> "EnumSet[E]":
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__ixor__(other)
+        self._bits ^= bits
+        return self
+
+    def __invert__(self) -> "EnumSet[E]":
+        """
+        :return: The members of the enumeration that are not in the set.
+        """
+        members = self._enum._ep_members_  # type: ignore[attr-defined]
+        return self._with_bits(~self._bits & ((1 << len(members)) - 1))
+
+    def isdisjoint(self, other: t.Iterable[t.Any]) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().isdisjoint(other)
+        return not self._bits & bits
+
+    def __le__(self, other: t.Any) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__le__(other)
+        return not self._bits & ~bits
+
+    def __lt__(self, other: t.Any) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__lt__(other)
+        return self._bits != bits and not self._bits & ~bits
+
+    def __ge__(self, other: t.Any) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__ge__(other)
+        return not bits & ~self._bits
+
+    def __gt__(self, other: t.Any) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__gt__(other)
+        return self._bits != bits and not bits & ~self._bits
+
+    def __eq__(self, other: object) -> bool:
+        bits = self._other_bits(other)
+        if bits is None:
+            return super().__eq__(other)
+        return self._bits == bits
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._enum.__qualname__}, "
+            f"{{{', '.join(map(repr, self))}}})"
+        )
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # only the integer is pickled, not the members
+        return type(self).from_bits, (self._enum, self._bits)
@@ -0,0 +1,279 @@
+"""
+Opt-in instrumentation of enumeration class construction. While a profile is
+active, :class:`~enum_properties.EnumPropertiesMeta` records the wall time and the
+net number of allocated memory blocks spent in each stage of building each class:
+
+* ``prepare``: creating and wrapping the class dictionary in ``__prepare__``
+* ``members``: capturing member values and stripping off their properties
+* ``annotations``: reconciling lazily evaluated annotations (python 3.14+)
+* ``enum``: the base :class:`enum.EnumMeta` class construction
+* ``specialize``: binding method specializations to members
+* ``properties``: setting property values onto members
+* ``symmetric``: building the symmetric lookup maps for symmetric properties
+* ``builtins``: adding ``_symmetric_builtins_`` to the symmetric maps
+
+Profile a block of code with :func:`profile`:
+
+.. code-block:: python
+
+    from enum_properties.profiling import profile
+
+    with profile() as prof:
+        import my_enums
+
+    print(prof.report(sort="symmetric"))
+
+Or profile a whole process by setting the ``ENUM_PROPERTIES_PROFILE`` environment
+variable. The report is written to stderr at exit if it is set to ``1``, or to the
+file it names otherwise. Class construction is not instrumented unless a profile is
+active, so there is no cost when profiling is off.
+"""
+
+import atexit
+import os
+import sys
+import typing as t
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+
+import enum_properties
+
+__all__ = ["STAGES", "ClassProfile", "Profile", "StageStats", "profile"]
+
+ENV_VAR = "ENUM_PROPERTIES_PROFILE"
+
+STAGES = (
+    "prepare",
+    "members",
+    "annotations",
+    "enum",
+    "specialize",
+    "properties",
+    "symmetric",
+    "builtins",
+)
+"""
+The instrumented stages of class construction, in the order they run.
+"""
+
+
+@dataclass
+class StageStats:
+    """
+    Accumulated measurements for one stage of one class's construction.
+    """
+
+    calls: int = 0
+    """The number of times the stage was entered."""
+
+    seconds: float = 0.0
+    """The wall time spent in the stage."""
+
+    blocks: int = 0
+    """
+    The net number of memory blocks allocated in the stage, see
+    :func:`sys.getallocatedblocks`. Always zero on interpreters other than CPython.
+    """
+
+    _depth: int = field(default=0, repr=False, compare=False)
+
+    def add(self, other: "StageStats"):
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.blocks += other.blocks
+
+
+class _StageTimer:
+    __slots__ = ("blocks", "start", "stats")
+
+    def __init__(self, stats: StageStats):
+        self.stats = stats
+
+    def __enter__(self):
+        # reentering a stage is measured by the outermost entry only
+        self.stats._depth += 1
+        if self.stats._depth == 1:
+            self.blocks = sys.getallocatedblocks()
+            self.start = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.stats._depth -= 1
+        if not self.stats._depth:
+            self.stats.seconds += perf_counter() - self.start
+            self.stats.blocks += sys.getallocatedblocks() - self.blocks
+            self.stats.calls += 1
+
+
+@dataclass
+class ClassProfile:
+    """
+    The construction measurements of one enumeration class.
+    """
+
+    name: str
+    """The qualified name of the class, including its module once known."""
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    """Measurements keyed by stage name, only stages that ran are present."""
+
+    @property
+    def seconds(self) -> float:
+        """The total wall time spent in all stages."""
+        return sum(stats.seconds for stats in self.stages.values())
+
+    @property
+    def blocks(self) -> int:
+        """The net number of memory blocks allocated in all stages."""
+        return sum(stats.blocks for stats in self.stages.values())
+
+    def stage(self, stage: str) -> _StageTimer:
+        """
+        :param stage: The name of the stage.
+        :return: A context manager that adds the time and allocations of the code
+            it wraps to the given stage.
+        """
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        return _StageTimer(stats)
+
+
+class Profile:
+    """
+    A collection of :class:`ClassProfile` records, one for each enumeration class
+    constructed while the profile was active.
+    """
+
+    classes: list[ClassProfile]
+
+    def __init__(self) -> None:
+        self.classes = []
+
+    def new_class(self, name: str) -> ClassProfile:
+        record = ClassProfile(name)
+        self.classes.append(record)
+        return record
+
+    def totals(self) -> dict[str, StageStats]:
+        """
+        :return: The measurements of each stage summed over all classes.
+        """
+        totals = {stage: StageStats() for stage in STAGES}
+        for record in self.classes:
+            for stage, stats in record.stages.items():
+                totals.setdefault(stage, StageStats()).add(stats)
+        return totals
+
+    def sorted(self, sort: str = "seconds") -> list[ClassProfile]:
+        """
+        :param sort: ``seconds`` or ``blocks`` to sort by the class totals, a stage
+            name to sort by the time spent in that stage, or ``name``.
+        :raises ValueError: if the sort key is not recognized.
+        :return: The class records, largest first unless sorted by name.
+        """
+        key: t.Callable[[ClassProfile], t.Any]
+        if sort == "name":
+            return sorted(self.classes, key=lambda record: record.name)
+        if sort == "seconds":
+            key = lambda record: record.seconds
+        elif sort == "blocks":
+            key = lambda record: record.blocks
+        elif sort in STAGES:
+            key = lambda record: (
+                record.stages[sort].seconds if sort in record.stages else 0.0
+            )
+        else:
+            raise ValueError(
+                f"Cannot sort by {sort!r}, expected seconds, blocks, name or one of: "
+                f"{', '.join(STAGES)}."
+            )
+        return sorted(self.classes, key=key, reverse=True)
+
+    def report(self, sort: str = "seconds", limit: int | None = None) -> str:
+        """
+        Render a table of the time in milliseconds spent in each stage of each
+        class's construction, with totals.
+
+        :param sort: The row order, see :meth:`sorted`.
+        :param limit: The maximum number of classes to list, or None for all.
+        :return: The report text.
+        """
+        totals = self.totals()
+        stages = [stage for stage in totals if totals[stage].calls]
+        headers = ["class", "total ms", "blocks", *stages]
+
+        def row(name: str, blocks: int, stats: dict[str, StageStats]) -> list[str]:
+            return [
+                name,
+                f"{sum(stat.seconds for stat in stats.values()) * 1000:.3f}",
+                str(blocks),
+                *(
+                    f"{stats[stage].seconds * 1000:.3f}" if stage in stats else "-"
+                    for stage in stages
+                ),
+            ]
+
+        rows = [
+            row(record.name, record.blocks, record.stages)
+            for record in self.sorted(sort)[:limit]
+        ]
+        rows.append(
+            row(
+                f"TOTAL ({len(self.classes)} classes)",
+                sum(stats.blocks for stats in totals.values()),
+                totals,
+            )
+        )
+        widths = [
+            max(len(cells[col]) for cells in [headers, *rows])
+            for col in range(len(headers))
+        ]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if col == 0 else cell.rjust(width)
+                for col, (cell, width) in enumerate(zip(cells, widths))
+            )
+            for cells in [headers, *rows]
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+        lines.insert(-1, "-" * len(lines[0]))
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile() -> t.Iterator[Profile]:
+    """
+    Record the construction of every enumeration class defined in this context.
+    Profiles may be nested, but classes are only recorded by the innermost one.
+
+    :yield: The :class:`Profile` classes are recorded to.
+    """
+    prof = Profile()
+    previous = enum_properties._profiler
+    enum_properties._profiler = prof
+    try:
+        yield prof
+    finally:
+        enum_properties._profiler = previous
+
+
+def _profile_from_environment():
+    """
+    Profile the rest of the process and write the report at exit, as configured by
+    the ``ENUM_PROPERTIES_PROFILE`` environment variable.
+    """
+    target = os.environ.get(ENV_VAR, "")
+    if not target or target == "0":
+        return
+    prof = Profile()
+    enum_properties._profiler = prof
+
+    def dump():
+        if target == "1":
+            print(prof.report(), file=sys.stderr)
+        else:
+            with open(target, "w", encoding="utf-8") as out:
+                out.write(prof.report() + "\n")
+
+    atexit.register(dump)
@@ -11,6 +11,11 @@ class PerformanceAndMemoryChecks(TestCase):
 
         v1.3.3 ISOCountry: 151966 bytes
         v1.4.0 ISOCountry: 105046 bytes
+
+        The members are measured separately, including their property values storage:
+
+        v2.8.0 ISOCountry members: 87648 bytes
+        v2.8.0 ISOCountry members with _compact_properties_: 45816 bytes
         """
 
         seen = {}
@@ -27,6 +32,40 @@ class PerformanceAndMemoryChecks(TestCase):
 
         print("Total Memory footprint of ISOCountry: {} bytes".format(total_size))
 
+        def member_size(cls):
+            size = 0
+            for val in cls:
+                size += sys.getsizeof(vars(val))
+                if "_ep_values_" in vars(val):
+                    size += sys.getsizeof(val._ep_values_)
+            return size
+
+        from pathlib import Path
+
+        # the same enum with _compact_properties_ set
+        compact: dict = {"__name__": "compact_big_enum"}
+        exec(
+            (Path(__file__).parent.parent / "big_enum_annotations.py")
+            .read_text()
+            .replace(
+                "    # pylint: disable=C0303",
+                "    _compact_properties_ = True",
+                1,
+            ),
+            compact,
+        )
+        self.assertEqual(
+            compact["ISOCountry"].US.full_name, self.ISOCountry.US.full_name
+        )
+        member_dicts = member_size(self.ISOCountry)
+        compact_members = member_size(compact["ISOCountry"])
+        self.assertLess(compact_members, member_dicts)
+        print(
+            "ISOCountry members: {} bytes, compact: {} bytes".format(
+                member_dicts, compact_members
+            )
+        )
+
     def test_property_access_time(self):
         """
         Access benchmarks:
@@ -63,3 +102,238 @@ class PerformanceAndMemoryChecks(TestCase):
 
         for_loop_time = perf_counter() - for_loop_time
         print("for loop time: {}".format(for_loop_time))
+
+    def test_coerce_many(self):
+        """
+        Batch coercion benchmarks - 200,000 cells drawn from 1,000 distinct values
+
+        v2.8.0 ISOCountry per-item loop: ~0.73 seconds
+        v2.8.0 ISOCountry coerce_many: ~0.042 seconds (17x faster)
+        """
+        import random
+        from time import perf_counter
+
+        rand = random.Random(0)
+        pool = [
+            getattr(country, prop)
+            for country in self.ISOCountry
+            for prop in ("alpha2", "alpha3", "short_name", "value")
+        ]
+        pool = rand.sample(pool, 950) + [f"junk{i}" for i in range(50)]
+        cells = [rand.choice(pool) for _ in range(200000)]
+
+        loop_time = perf_counter()
+        expected = []
+        for cell in cells:
+            try:
+                expected.append(self.ISOCountry(cell))
+            except ValueError:
+                pass
+        loop_time = perf_counter() - loop_time
+
+        batch_time = perf_counter()
+        members = self.ISOCountry.coerce_many(cells, on_error="skip")
+        batch_time = perf_counter() - batch_time
+
+        self.assertEqual(members, expected)
+        print(
+            "per-item loop time: {}, coerce_many time: {}".format(loop_time, batch_time)
+        )
+
+    def test_symmetric_equality(self):
+        """
+        Symmetric equality benchmarks - 200,000 comparisons each
+
+        v2.7.0 ISOCountry true: ~1.17 seconds, false: ~2.65 seconds
+        v2.8.0 ISOCountry true: ~0.37 seconds, false: ~0.47 seconds
+        """
+        from time import perf_counter
+
+        def legacy_eq(self, value):
+            if isinstance(value, self.__class__):
+                return self.value == value.value
+            try:
+                return self.value == self.__class__(value).value
+            except (ValueError, TypeError):
+                return False
+
+        US = self.ISOCountry.US
+        for label, value, expected in (
+            ("true", "united states of america (the)", True),
+            ("false", "not a country", False),
+        ):
+            self.assertEqual(US == value, expected)
+            self.assertEqual(legacy_eq(US, value), expected)
+
+            legacy_time = perf_counter()
+            for _ in range(200000):
+                legacy_eq(US, value)
+            legacy_time = perf_counter() - legacy_time
+
+            eq_time = perf_counter()
+            for _ in range(200000):
+                US == value
+            eq_time = perf_counter() - eq_time
+
+            print(
+                "{} comparison legacy time: {}, time: {}".format(
+                    label, legacy_time, eq_time
+                )
+            )
+
+    def test_fuzzy(self):
+        """
+        Fuzzy matching benchmarks - 1,000 misspelled short names, max_distance=2
+
+        v2.8.0 ISOCountry bounded distance scan: ~0.55 seconds
+        v2.8.0 ISOCountry fuzzy: ~0.23 seconds (~0.23 ms per lookup)
+        """
+        import random
+        from time import perf_counter
+
+        from enum_properties import _edit_distance
+
+        rand = random.Random(0)
+        queries = []
+        for _ in range(1000):
+            country = rand.choice(list(self.ISOCountry))
+            name = country.short_name
+            pos = rand.randrange(len(name) - 1)
+            # transpose two characters, a distance of 2
+            queries.append(
+                (country, name[:pos] + name[pos + 1] + name[pos] + name[pos + 2 :])
+            )
+
+        keys = [
+            key for key in self.ISOCountry._ep_symmetric_map_ if isinstance(key, str)
+        ]
+        scan_time = perf_counter()
+        for country, query in queries:
+            self.assertTrue([key for key in keys if _edit_distance(query, key, 2) <= 2])
+        scan_time = perf_counter() - scan_time
+
+        fuzzy_time = perf_counter()
+        for country, query in queries:
+            self.assertIn(country, self.ISOCountry.fuzzy(query))
+        fuzzy_time = perf_counter() - fuzzy_time
+
+        print("scan time: {}, fuzzy time: {}".format(scan_time, fuzzy_time))
+
+    def test_class_creation(self):
+        """
+        Class creation benchmarks - best of 5, compiled class bodies are executed so
+        parsing is not timed
+
+        v2.8.0 500 small enums: ~0.24 seconds, ISOCountry x20: ~0.15 seconds
+        v2.8.0 module level enum dict: ~0.15 seconds, ~0.15 seconds
+        """
+        from pathlib import Path
+        from time import perf_counter
+
+        import typing as t
+
+        from enum_properties import EnumProperties, Symmetric
+
+        small = compile(
+            "\n".join(
+                f"class Enum{i}(EnumProperties):\n"
+                f"    label: t.Annotated[str, Symmetric()]\n"
+                f"    weight: int\n"
+                f"    ONE = 1, 'one{i}', 1\n"
+                f"    TWO = 2, 'two{i}', 2\n"
+                f"    THREE = 3, 'three{i}', 3\n"
+                for i in range(500)
+            ),
+            "<small enums>",
+            "exec",
+        )
+        big = compile(
+            (Path(__file__).parent.parent / "big_enum_annotations.py").read_text(),
+            "big_enum_annotations",
+            "exec",
+        )
+
+        small_time = big_time = float("inf")
+        for _ in range(5):
+            start = perf_counter()
+            namespace: dict = {
+                "t": t,
+                "EnumProperties": EnumProperties,
+                "Symmetric": Symmetric,
+            }
+            exec(small, namespace)
+            small_time = min(small_time, perf_counter() - start)
+
+            start = perf_counter()
+            for _ in range(20):
+                namespace = {"__name__": "big_enum_annotations"}
+                exec(big, namespace)
+            big_time = min(big_time, perf_counter() - start)
+
+        self.assertEqual(namespace["ISOCountry"]("USA").alpha2, "US")
+        print(
+            "500 small enums time: {}, ISOCountry x20 time: {}".format(
+                small_time, big_time
+            )
+        )
+
+    def test_many_enums_memory(self):
+        """
+        Import benchmarks for a module of 500 small enums - best of 5 for time,
+        memory retained by the enums is measured with tracemalloc
+
+        v2.8.0 fresh property types per use: ~0.18 seconds, ~7102 KiB
+        v2.8.0 interned property types: ~0.13 seconds, ~4950 KiB
+        """
+        import gc
+        import tracemalloc
+        from time import perf_counter
+
+        import typing as t
+
+        from enum_properties import EnumProperties, Symmetric
+
+        module = compile(
+            "\n".join(
+                f"class Enum{i}(EnumProperties):\n"
+                f"    _symmetric_builtins_ = ['name']\n"
+                f"    label: t.Annotated[str, Symmetric(case_fold=True)]\n"
+                f"    weight: int\n"
+                f"    ONE = 1, 'one{i}', 1\n"
+                f"    TWO = 2, 'two{i}', 2\n"
+                for i in range(500)
+            ),
+            "<many enums>",
+            "exec",
+        )
+
+        import_time = float("inf")
+        for _ in range(5):
+            gc.collect()
+            start = perf_counter()
+            exec(
+                module,
+                {"t": t, "EnumProperties": EnumProperties, "Symmetric": Symmetric},
+            )
+            import_time = min(import_time, perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            namespace: dict = {
+                "t": t,
+                "EnumProperties": EnumProperties,
+                "Symmetric": Symmetric,
+            }
+            exec(module, namespace)
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertIs(namespace["Enum499"]("TWO499"), namespace["Enum499"].TWO)
+        print(
+            "500 enums import time: {}, retained: {} KiB".format(
+                import_time, retained // 1024
+            )
+        )
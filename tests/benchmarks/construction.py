@@ -0,0 +1,149 @@
+"""
+Construction time scaling benchmarks for very large enumerations.
+
+Enumerations of increasing size, each with 5 case insensitive symmetric properties,
+are defined in this interpreter and the best time per member is reported for each
+size. Construction is linear when the time per member does not grow with the number
+of members:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.construction
+
+The run exits with an error if the time per member at the largest size is more than
+``--ratio`` times the time per member at the smallest size.
+
+Construction is only linear on python 3.11+. Older versions of the base enum
+metaclass find aliases by comparing each new member to every member defined before
+it, so construction there is quadratic and the ratio is reported but not checked.
+"""
+
+import argparse
+import gc
+import platform
+import sys
+import typing as t
+from time import perf_counter
+
+__all__ = ["LINEAR", "SIZES", "check", "main", "measure", "run"]
+
+SIZES = (1_000, 10_000, 100_000)
+"""
+The numbers of members of the benchmarked enumerations.
+"""
+
+PROPERTIES = 5
+"""
+The number of case insensitive symmetric properties of the benchmarked enumerations.
+"""
+
+LINEAR = sys.version_info >= (3, 11)
+"""
+True if the base enum metaclass of this python constructs enumerations in linear time.
+"""
+
+
+def _source(members: int) -> str:
+    properties = ", ".join(f"s('prop{j}', case_fold=True)" for j in range(PROPERTIES))
+    return f"class Big(EnumProperties, {properties}):\n" + "".join(
+        f"    M{i} = {i}, "
+        + ", ".join(f"'value{j}_{i}'" for j in range(PROPERTIES))
+        + "\n"
+        for i in range(members)
+    )
+
+
+def measure(members: int, repeat: int = 3) -> float:
+    """
+    Measure the time it takes to define an enumeration.
+
+    :param members: The number of members of the enumeration.
+    :param repeat: The number of measurements.
+    :return: The best time per member in seconds.
+    """
+    from enum_properties import EnumProperties, s
+
+    body = compile(_source(members), "<big enum>", "exec")
+    best = float("inf")
+    for _ in range(repeat):
+        namespace: dict[str, t.Any] = {"EnumProperties": EnumProperties, "s": s}
+        gc.collect()
+        start = perf_counter()
+        exec(body, namespace)
+        best = min(best, perf_counter() - start)
+    Big = namespace["Big"]
+    last = members - 1
+    if len(Big) != members or Big(f"VALUE4_{last}") is not Big[f"M{last}"]:
+        raise RuntimeError(f"The enumeration of {members} members is incorrect.")
+    return best / members
+
+
+def run(sizes: t.Iterable[int] = SIZES, repeat: int = 3) -> dict[int, float]:
+    """
+    Run the benchmarks. The largest size is only measured once.
+
+    :param sizes: The numbers of members to measure.
+    :param repeat: The number of measurements of each size.
+    :return: The best time per member in seconds of each size.
+    """
+    sizes = sorted(sizes)
+    return {
+        members: measure(members, repeat if members < sizes[-1] else 1)
+        for members in sizes
+    }
+
+
+def check(per_member: dict[int, float], ratio: float = 4.0) -> bool:
+    """
+    :param per_member: The results of :func:`run`.
+    :param ratio: The factor the time per member may grow by from the smallest to
+        the largest size.
+    :return: True if construction scaled linearly.
+    """
+    sizes = sorted(per_member)
+    return per_member[sizes[-1]] <= ratio * per_member[sizes[0]]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.construction",
+        description="Measure how construction time scales with enumeration size.",
+    )
+    parser.add_argument(
+        "sizes",
+        nargs="*",
+        type=int,
+        help=f"the numbers of members to measure, {SIZES} by default",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="the number of measurements of each size",
+    )
+    parser.add_argument(
+        "--ratio",
+        type=float,
+        default=4.0,
+        help="the factor the time per member may grow by",
+    )
+    args = parser.parse_args(argv)
+
+    per_member = run(args.sizes or SIZES, args.repeat)
+    for members, seconds in per_member.items():
+        print(f"{members:>10} members{seconds * 1e6:>10.1f}us per member")
+    if check(per_member, args.ratio):
+        return 0
+    if not LINEAR:
+        print(
+            f"time per member grew by more than {args.ratio}x, which is expected "
+            f"on python {platform.python_version()}"
+        )
+        return 0
+    print(f"time per member grew by more than {args.ratio}x")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
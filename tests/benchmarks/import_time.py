@@ -0,0 +1,292 @@
+"""
+Import time benchmarks for enumeration modules.
+
+Every subject module is imported in a fresh interpreter with ``python -X importtime``
+after enum_properties has already been imported, so the self time reported for the
+subject is the time spent executing its body - which is almost entirely enumeration
+class construction. Bytecode is cached in a temporary prefix and warmed up before
+measuring, so compilation is never timed.
+
+Run the suite and write the results to a file:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.import_time -o before.json
+
+and compare two runs, failing if any subject got more than 10% slower:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.import_time -o after.json --compare before.json
+
+Results are only comparable between runs on the same machine and python version,
+which are recorded in the results file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import typing as t
+from pathlib import Path
+
+__all__ = ["SUBJECTS", "measure", "run", "compare", "main"]
+
+ROOT = Path(__file__).parent.parent.parent
+
+FORMAT = 1
+"""
+The version of the results file format.
+"""
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)\s*$")
+
+
+def _many_legacy(count: int = 500) -> str:
+    return "from enum_properties import EnumProperties, p, s\n\n" + "\n".join(
+        f"class Enum{i}(EnumProperties, s('label', case_fold=True), p('weight')):\n"
+        f"    ONE = 1, 'one{i}', 1\n"
+        f"    TWO = 2, 'two{i}', 2\n"
+        f"    THREE = 3, 'three{i}', 3\n"
+        for i in range(count)
+    )
+
+
+def _many_annotations(count: int = 500, future: bool = False) -> str:
+    return (
+        ("from __future__ import annotations\n\n" if future else "")
+        + "import typing as t\n\n"
+        + "from enum_properties import EnumProperties, Symmetric\n\n"
+        + "\n".join(
+            f"class Enum{i}(EnumProperties):\n"
+            f"    label: t.Annotated[str, Symmetric(case_fold=True)]\n"
+            f"    weight: int\n"
+            f"    ONE = 1, 'one{i}', 1\n"
+            f"    TWO = 2, 'two{i}', 2\n"
+            f"    THREE = 3, 'three{i}', 3\n"
+            for i in range(count)
+        )
+    )
+
+
+SUBJECTS: dict[str, str | None] = {
+    "enum_properties": None,
+    "tests.big_enum": None,
+    "tests.big_enum_annotations": None,
+    "many_legacy": _many_legacy(),
+    "many_annotations": _many_annotations(),
+    "many_future_annotations": _many_annotations(future=True),
+}
+"""
+The benchmarked modules. Subjects with source are synthetic modules written to a
+temporary directory, the others are imported from the repository. On python 3.14+
+the annotation subjects exercise the deferred :mod:`annotationlib` path.
+"""
+
+
+def _import_time(module: str, env: dict[str, str]) -> int:
+    """
+    :return: The import time of the module in microseconds, excluding the modules
+        it imports unless it is enum_properties itself.
+    """
+    preload = "" if module == "enum_properties" else "import enum_properties; "
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{preload}import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match and match.group(3) == module:
+            # the package is measured cumulatively, subjects by their own body
+            return int(match.group(2 if module == "enum_properties" else 1))
+    raise RuntimeError(f"{module} was not imported:\n{proc.stderr}")
+
+
+def _environment(tmp: str) -> dict[str, str]:
+    """
+    :return: The environment of the benchmarked interpreters, it imports the
+        synthetic subjects from and caches bytecode to the given directory.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key != "PYTHONDONTWRITEBYTECODE"
+    }
+    env["PYTHONPATH"] = os.pathsep.join(
+        [tmp, str(ROOT / "src"), str(ROOT), os.environ.get("PYTHONPATH", "")]
+    )
+    env["PYTHONPYCACHEPREFIX"] = os.path.join(tmp, "pycache")
+    return env
+
+
+def measure(
+    subjects: t.Iterable[str], env: dict[str, str], repeat: int = 5
+) -> dict[str, dict[str, t.Any]]:
+    """
+    Measure the import time of each subject in fresh interpreters.
+
+    :param subjects: The names of the subjects to measure.
+    :param env: The environment of the interpreters, see :func:`_environment`.
+    :param repeat: The number of measurements of each subject.
+    :return: The min, median and samples in microseconds of each subject.
+    """
+    results = {}
+    for name in subjects:
+        # write the bytecode so compilation is not measured
+        _import_time(name, env)
+        samples = [_import_time(name, env) for _ in range(repeat)]
+        results[name] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "samples": samples,
+        }
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(subjects: t.Iterable[str] = SUBJECTS, repeat: int = 5) -> dict[str, t.Any]:
+    """
+    Run the benchmark suite.
+
+    :param subjects: The names of the subjects to measure.
+    :param repeat: The number of measurements of each subject.
+    :return: The results, with the environment they were measured in.
+    """
+    subjects = list(subjects)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in subjects:
+            source = SUBJECTS[name]
+            if source is not None:
+                (Path(tmp) / f"{name}.py").write_text(source)
+        env = _environment(tmp)
+        version = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import enum_properties; print(enum_properties.__version__)",
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return {
+            "format": FORMAT,
+            "commit": _commit(),
+            "enum_properties": version,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "unit": "us",
+            "results": measure(subjects, env, repeat),
+        }
+
+
+def compare(
+    baseline: dict[str, t.Any], current: dict[str, t.Any], threshold: float = 0.1
+) -> tuple[list[str], list[str]]:
+    """
+    Compare the minimum import times of two runs of the suite.
+
+    :param baseline: The results to compare against.
+    :param current: The new results.
+    :param threshold: The fraction a subject may slow down by before it is a
+        regression.
+    :return: A tuple of the report lines and the names of the regressed subjects.
+    """
+    lines = []
+    regressions = []
+    for key in ("python", "implementation", "platform"):
+        if baseline.get(key) != current.get(key):
+            lines.append(
+                f"warning: {key} differs: {baseline.get(key)} -> {current.get(key)}"
+            )
+    lines.append(
+        f"{'subject':<28}{'baseline':>12}{'current':>12}{'change':>10}"
+        f"  ({baseline.get('commit')} -> {current.get('commit')})"
+    )
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            lines.append(f"{name:<28}{'-':>12}{result['min']:>10}us")
+            continue
+        before = baseline["results"][name]["min"]
+        change = result["min"] / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(
+            f"{name:<28}{before:>10}us{result['min']:>10}us{change:>+10.1%}{flag}"
+        )
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.import_time",
+        description="Measure the import time of enumeration modules.",
+    )
+    parser.add_argument(
+        "subjects",
+        nargs="*",
+        choices=[[], *SUBJECTS],
+        help="the subjects to measure, all by default",
+    )
+    parser.add_argument("-o", "--output", help="write the results to this file")
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="the number of measurements of each subject",
+    )
+    parser.add_argument(
+        "-c", "--compare", help="compare the results to a previous results file"
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the fraction a subject may slow down by before it is a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.subjects or SUBJECTS, args.repeat)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if not args.compare:
+        for name, result in results["results"].items():
+            print(f"{name:<28}{result['min']:>10}us (median {result['median']}us)")
+        return 0
+
+    lines, regressions = compare(
+        json.loads(Path(args.compare).read_text()), results, args.threshold
+    )
+    print("\n".join(lines))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Enumerations that are compiled to static modules by tests/test_compile.py"""
+
+import typing as t
+
+from enum_properties import (
+    EnumProperties,
+    FlagProperties,
+    IntEnumProperties,
+    StrEnumProperties,
+    Symmetric,
+    member_property,
+    s,
+    symmetric,
+)
+
+
+class Color(EnumProperties):
+    """A color with hex and rgb codes."""
+
+    _symmetric_builtins_ = [s("name", case_fold=True)]
+    _miss_cache_size_ = 16
+    _compact_properties_ = True
+
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+    alt: t.Annotated[list[str], Symmetric()]
+    weight: float
+
+    RED = 1, "ff0000", (255, 0, 0), ["scarlet"], 0.5
+    GREEN = 2, "00ff00", (0, 255, 0), ["lime", "2"], 0.75
+    BLUE = 3, "0000ff", (0, 0, 255), [], None
+
+    @symmetric(case_fold=True)
+    def label(self):
+        return self.name.title()
+
+
+class Level(IntEnumProperties):
+    _lazy_symmetry_ = True
+
+    label: t.Annotated[str, Symmetric(case_fold=True, match_none=True)]
+
+    LOW = 1, "low"
+    HIGH = 2, None
+
+
+class Perm(FlagProperties):
+    label: t.Annotated[str, Symmetric(case_fold=True)]
+
+    R = 1, "read"
+    W = 2, "write"
+    X = 4, "execute"
+    RWX = 7, "all"
+
+    @symmetric()
+    @member_property
+    def bits(self):
+        return f"{self.value:03b}"
+
+
+class Text(StrEnumProperties):
+    upper: t.Annotated[str, Symmetric()]
+
+    A = "a", "A"
+    B = "b", "B"
+
+
+class _Private(EnumProperties):
+    ONE = 1
+    UNO = 1
@@ -0,0 +1,20 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    alpha2: t.Annotated[str, Symmetric(case_fold=True)]
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+
+    CA = 124, 'CA', 'CAN'
+    MO = 446, 'MO', 'MAC'
+    MA = 504, 'MA', 'MAR'
+
+
+# 'MAC' is the alpha3 code for Macao
+assert Country.by_property('alpha3', 'mac') is Country.MO
+
+# 'CA' is an alpha2 code, so it only resolves through alpha2
+assert Country('CA') is Country.CA
+assert Country.by_property('alpha3', 'CA', None) is None
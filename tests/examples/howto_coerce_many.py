@@ -0,0 +1,22 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Route(EnumProperties):
+
+    abbr: t.Annotated[str, Symmetric(case_fold=True)]
+
+    ALLEY   = 1, 'ALY'
+    AVENUE  = 2, 'AVE'
+
+
+column = ['ave', 'ALY', 'AVENUE', 'ave', 'Boulevard', 'aly']
+
+assert Route.coerce_many(column, on_error='skip') == [
+    Route.AVENUE, Route.ALLEY, Route.AVENUE, Route.AVENUE, Route.ALLEY
+]
+
+assert Route.coerce_many(column, on_error='default')[4] is None
+
+# or lazily
+assert next(Route.coerce_many(column, lazy=True)) is Route.AVENUE
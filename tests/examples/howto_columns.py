@@ -0,0 +1,26 @@
+import typing as t
+from array import array
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    population: int
+
+    CA = 124, 'CAN', 40_097_761
+    MX = 484, 'MEX', 126_705_138
+    US = 840, 'USA', 334_914_895
+
+
+# the values of one property for every member, in definition order
+assert Country.column('alpha3') == ('CAN', 'MEX', 'USA')
+
+# or of every property
+assert Country.columns() == {
+    'alpha3': ('CAN', 'MEX', 'USA'),
+    'population': (40_097_761, 126_705_138, 334_914_895),
+}
+
+# numeric columns may be loaded into arrays for vectorized code
+assert sum(Country.column_array('population', 'q')) == 501_717_794
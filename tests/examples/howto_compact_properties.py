@@ -0,0 +1,24 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    _compact_properties_ = True
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    short_name: t.Annotated[str, Symmetric(case_fold=True)]
+    independent: bool
+
+    CA = 124, 'CAN', 'Canada', True
+    MX = 484, 'MEX', 'Mexico', True
+    PR = 630, 'PRI', 'Puerto Rico', False
+
+
+# property values are stored in one tuple per member, followed by its ordinal
+assert Country.PR._ep_values_ == ('PRI', 'Puerto Rico', False, 2)
+assert 'short_name' not in vars(Country.PR)
+
+# and are accessed and looked up just like before
+assert Country.MX.short_name == 'Mexico'
+assert Country('can') is Country.CA
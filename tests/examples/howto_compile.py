@@ -0,0 +1,17 @@
+from enum_properties.compile import compile_module
+from tests.big_enum import ISOCountry
+
+
+# the same as: python -m enum_properties.compile tests.big_enum
+source = compile_module('tests.big_enum')
+
+# normally you would write the source to a file and import it
+static = {'__name__': 'static_enums'}
+exec(source, static)
+StaticCountry = static['ISOCountry']
+
+assert StaticCountry('usa') is StaticCountry.US
+assert StaticCountry.US.full_name == ISOCountry.US.full_name
+assert [member.name for member in StaticCountry] == [
+    member.name for member in ISOCountry
+]
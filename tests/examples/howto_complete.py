@@ -0,0 +1,21 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    short_name: t.Annotated[str, Symmetric()]
+
+    AE = 784, 'ARE', 'United Arab Emirates'
+    GB = 826, 'GBR', 'United Kingdom'
+    US = 840, 'USA', 'United States of America'
+    UY = 858, 'URY', 'Uruguay'
+
+
+assert Country.complete('United') == [Country.AE, Country.GB, Country.US]
+assert Country.complete('United', limit=2) == [Country.AE, Country.GB]
+
+# short_name is case sensitive, alpha3 is not
+assert Country.complete('u') == [Country.UY, Country.US]
+assert Country.complete('u', prop='short_name') == []
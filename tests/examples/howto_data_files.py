@@ -0,0 +1,40 @@
+import io
+from enum_properties import EnumProperties, s
+
+
+# any path, open file or iterable of lines will do
+currencies = io.StringIO(
+    'code,number,symbol,decimals,full_name\n'
+    'USD,840,$,2,US Dollar\n'
+    'EUR,978,€,2,Euro\n'
+    'JPY,392,¥,0,Yen\n'
+)
+
+Currency = EnumProperties.from_csv(
+    'Currency',
+    currencies,
+    member='code',
+    value='number',
+    properties=[s('symbol'), 'decimals', s('full_name', case_fold=True)],
+    converters={'number': int, 'decimals': int},
+)
+
+assert Currency.EUR.value == 978
+assert Currency.JPY.decimals == 0
+assert Currency('$') is Currency.USD
+assert Currency('us dollar') is Currency.USD
+
+# JSON arrays of objects and JSON Lines work the same way
+Currency = EnumProperties.from_json(
+    'Currency',
+    io.StringIO(
+        '{"code": "USD", "number": 840, "symbol": "$"}\n'
+        '{"code": "EUR", "number": 978, "symbol": "€"}\n'
+    ),
+    member='code',
+    value='number',
+    properties=[s('symbol')],
+    lines=True,
+)
+
+assert Currency('€') is Currency.EUR
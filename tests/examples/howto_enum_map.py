@@ -0,0 +1,25 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+from enum_properties.containers import EnumMap
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+
+    CA = 124, 'CAN'
+    MX = 484, 'MEX'
+    US = 840, 'USA'
+
+
+population = EnumMap(Country)
+
+# keys may be members or any value that resolves to a member
+population[Country.CA] = 40_097_761
+population['usa'] = 334_914_895
+
+assert population[Country.US] == 334_914_895
+assert 'MEX' not in population
+
+# iteration is in definition order
+assert list(population) == [Country.CA, Country.US]
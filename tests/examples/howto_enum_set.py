@@ -0,0 +1,27 @@
+import pickle
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+from enum_properties.containers import EnumSet
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+
+    CA = 124, 'CAN'
+    MX = 484, 'MEX'
+    US = 840, 'USA'
+
+
+# members may be added by any value that resolves to a member
+north = EnumSet(Country, ['usa', Country.CA])
+south = EnumSet(Country, ['MEX'])
+
+assert 'can' in north
+assert list(north | south) == list(Country)
+assert not north & south
+assert ~north == south
+
+# the set is stored, and pickled, as the bits of an integer
+assert north.bits == 0b101
+assert pickle.loads(pickle.dumps(north)) == north
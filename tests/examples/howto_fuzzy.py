@@ -0,0 +1,19 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    short_name: t.Annotated[str, Symmetric(case_fold=True)]
+
+    AT = 40, 'AUT', 'Austria'
+    AU = 36, 'AUS', 'Australia'
+    DE = 276, 'DEU', 'Germany'
+
+
+assert Country.fuzzy('germny') == [Country.DE]
+
+# 'Austrailia' is one edit from Australia and three from Austria
+assert Country.fuzzy('Austrailia') == [Country.AU]
+assert Country.fuzzy('Austrailia', max_distance=3) == [Country.AU, Country.AT]
@@ -0,0 +1,20 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Color(EnumProperties):
+
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+    RED   = 1, 'ff0000'
+    GREEN = 2, '00ff00'
+    BLUE  = 3, '0000ff'
+
+
+# resolution is the same as Color(value)
+assert Color.get('FF0000') is Color.RED
+assert Color.get('2') is Color.GREEN
+
+# but failures return a default instead of raising ValueError
+assert Color.get('purple') is None
+assert Color.get('purple', Color.BLUE) is Color.BLUE
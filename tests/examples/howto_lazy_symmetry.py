@@ -0,0 +1,24 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    _lazy_symmetry_ = True
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    short_name: t.Annotated[str, Symmetric(case_fold=True)]
+
+    CA = 124, 'CAN', 'Canada'
+    MX = 484, 'MEX', 'Mexico'
+    US = 840, 'USA', 'United States of America'
+
+
+# properties and lookups by value or name never build the symmetric maps
+assert Country.MX.short_name == 'Mexico'
+assert Country(124) is Country.CA
+assert Country['US'] is Country.US
+
+# the first symmetric lookup builds them
+assert Country('united states of america') is Country.US
+assert Country.CA == 'can'
@@ -0,0 +1,30 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric, member_property, symmetric
+
+
+class Color(EnumProperties):
+
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+    # name   value      hex
+    RED    = 1,      'ff0000'
+    GREEN  = 2,      '00ff00'
+    BLUE   = 3,      '0000ff'
+
+    # computed once for each member when the class is created
+    @member_property
+    def rgb(self) -> t.Tuple[int, int, int]:
+        return tuple(int(self.hex[idx:idx + 2], 16) for idx in range(0, 6, 2))
+
+    # member properties may be symmetric
+    @symmetric()
+    @member_property
+    def integer(self) -> int:
+        return int(self.hex, 16)
+
+
+assert Color.GREEN.rgb == (0, 255, 0)
+assert Color(0x0000ff) is Color.BLUE
+
+# member properties are stored like the properties in the value tuples
+assert Color.column('rgb') == ((255, 0, 0), (0, 255, 0), (0, 0, 255))
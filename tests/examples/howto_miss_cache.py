@@ -0,0 +1,23 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Route(EnumProperties):
+
+    # remember up to 1024 values that failed to resolve
+    _miss_cache_size_ = 1024
+
+    abbr: t.Annotated[str, Symmetric(case_fold=True)]
+
+    ALLEY   = 1, 'ALY'
+    AVENUE  = 2, 'AVE'
+
+
+for _ in range(3):
+    try:
+        Route('Boulevard')
+    except ValueError:
+        pass
+
+# the first miss runs the full resolution pipeline, repeats fail from the cache
+assert Route.miss_cache_info().hits == 2
@@ -0,0 +1,22 @@
+import typing as t
+import numpy as np
+from enum_properties import EnumProperties, Symmetric
+
+
+class Country(EnumProperties):
+
+    alpha3: t.Annotated[str, Symmetric(case_fold=True)]
+    population: int
+
+    US = 840, 'USA', 340_000_000
+    CA = 124, 'CAN', 41_000_000
+    MX = 484, 'MEX', 130_000_000
+
+
+codes = Country.to_codes(np.array(['US', 'usa', 124, 'mex', 'ZZZ'], dtype=object))
+assert codes.tolist() == [0, 0, 1, 2, -1]
+
+assert Country.from_codes(codes).tolist() == [
+    Country.US, Country.US, Country.CA, Country.MX, None
+]
+assert Country.from_codes(codes, prop='population', fill=0).sum() == 851_000_000
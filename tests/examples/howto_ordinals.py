@@ -0,0 +1,23 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+
+
+class Level(EnumProperties):
+
+    label: t.Annotated[str, Symmetric(case_fold=True)]
+
+    DEBUG = 10, 'Debug'
+    INFO = 20, 'Info'
+    ERROR = 40, 'Error'
+
+
+# members are numbered 0..n-1 in definition order
+assert [level._ordinal_ for level in Level] == [0, 1, 2]
+assert Level.from_ordinal(2) is Level.ERROR
+
+# so per member data can be kept in a list instead of a dictionary
+counts = [0] * len(Level)
+for record in ('info', 'error', 'info', 'debug', 'info'):
+    counts[Level(record)._ordinal_] += 1
+
+assert counts[Level.INFO._ordinal_] == 3
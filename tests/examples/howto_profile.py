@@ -0,0 +1,26 @@
+import typing as t
+from enum_properties import EnumProperties, Symmetric
+from enum_properties.profiling import profile
+
+
+with profile() as prof:
+
+    class Color(EnumProperties):
+
+        hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+        RED = 1, 'ff0000'
+        GREEN = 2, '00ff00'
+        BLUE = 3, '0000ff'
+
+
+record = prof.classes[0]
+assert record.name.endswith('Color')
+assert record.stages['symmetric'].seconds > 0
+
+report = prof.report(sort='seconds')
+# class            total ms  blocks  prepare  members   enum  properties  symmetric  builtins
+# -------------------------------------------------------------------------------------------
+# ...Color            0.541      93    0.195    0.092  0.142       0.011      0.089     0.012
+# -------------------------------------------------------------------------------------------
+# TOTAL (1 classes)   0.541      93    0.195    0.092  0.142       0.011      0.089     0.012
@@ -1,5 +1,5 @@
 import typing as t
-from enum_properties import EnumProperties as Enum, s, Symmetric, symmetric
+from enum_properties import EnumProperties as Enum, Symmetric, member_property, symmetric
 
 
 class MapBoxStyle(Enum):
@@ -24,10 +24,10 @@ class MapBoxStyle(Enum):
     NAVIGATION_DAY    = 'navigation-day',    'Navigation Day',     1
     NAVIGATION_NIGHT  = 'navigation-night',  'Navigation Night',   1
 
-    # we can define a normal property to produce property values based
+    # we can define a member property to produce property values based
     # off other properties! We can even use the symmetric decorator to make it symmetric
     @symmetric()
-    @property
+    @member_property
     def uri(self) -> str:
         return f'mapbox://styles/mapbox/{self.value}-v{self.version}'
 
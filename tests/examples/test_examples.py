@@ -131,3 +131,72 @@ def test_howto_members_and_aliases():
 
 def test_howto_functional():
     from tests.examples import howto_functional
+
+
+def test_howto_miss_cache():
+    from tests.examples import howto_miss_cache
+
+
+def test_howto_get():
+    from tests.examples import howto_get
+
+
+def test_howto_coerce_many():
+    from tests.examples import howto_coerce_many
+
+
+def test_howto_numpy():
+    pytest.importorskip("numpy")
+    from tests.examples import howto_numpy
+
+
+def test_howto_by_property():
+    from tests.examples import howto_by_property
+
+
+def test_howto_complete():
+    from tests.examples import howto_complete
+
+
+def test_howto_fuzzy():
+    from tests.examples import howto_fuzzy
+
+
+def test_howto_profile():
+    from tests.examples import howto_profile
+
+
+def test_howto_lazy_symmetry():
+    from tests.examples import howto_lazy_symmetry
+
+
+def test_howto_columns():
+    from tests.examples import howto_columns
+
+
+def test_howto_ordinals():
+    from tests.examples import howto_ordinals
+
+
+def test_howto_enum_map():
+    from tests.examples import howto_enum_map
+
+
+def test_howto_enum_set():
+    from tests.examples import howto_enum_set
+
+
+def test_howto_member_property():
+    from tests.examples import howto_member_property
+
+
+def test_howto_compact_properties():
+    from tests.examples import howto_compact_properties
+
+
+def test_howto_compile():
+    from tests.examples import howto_compile
+
+
+def test_howto_data_files():
+    from tests.examples import howto_data_files
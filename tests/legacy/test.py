@@ -54,6 +54,30 @@ class TestEnums(TestCase):
         self.assertTrue(prop3().case_fold)
         self.assertFalse(hasattr(prop4(), "case_fold"))
 
+    def test_p_interned(self):
+        self.assertIs(p("prop1"), p("prop1"))
+        self.assertIs(s("prop1"), s("prop1", case_fold=False, match_none=False))
+        self.assertIs(s("prop1", case_fold=True), s("prop1", True))
+        self.assertIsNot(p("prop1"), s("prop1"))
+        self.assertIsNot(s("prop1"), s("prop1", case_fold=True))
+        self.assertIsNot(s("prop1"), s("prop1", match_none=True))
+        self.assertIsNot(s("prop1", case_fold=True), s("prop1", match_none=True))
+        self.assertIs(s("prop1", case_fold=1), s("prop1", case_fold=True))
+
+        class Color(EnumProperties, s("hex", case_fold=True), p("weight")):
+            _symmetric_builtins_ = ["name"]
+
+            RED = 1, "ff0000", 0.5
+
+        class Shade(EnumProperties, s("hex"), p("weight")):
+            RED = 1, "FF0000", 0.25
+
+        self.assertIs(type(Color._properties_[1]), type(Shade._properties_[1]))
+        self.assertIs(Color("FF0000"), Color.RED)
+        self.assertIs(Color("RED"), Color.RED)
+        self.assertIsNone(Shade.get("ff0000"))
+        self.assertEqual(Shade.RED.weight, 0.25)
+
     def test_unhashable_symmetry(self):
         """
         Tests that a value error is thrown when an unhashable type is used as
@@ -895,3 +919,21 @@ class TestEnums(TestCase):
         self.assertEqual(ColorAutoOverride.ONE.spanish, "Uno")
         self.assertEqual(ColorAutoOverride.TWO.spanish, "Dos")
         self.assertEqual(ColorAutoOverride.THREE.spanish, "Tres")
+
+    def test_reused_member_name(self):
+        from enum_properties import _MemberNames
+
+        with self.assertRaises(TypeError):
+
+            class Reused(EnumProperties, p("spanish")):
+                ONE = 1, "Uno"
+                TWO = 2, "Dos"
+                ONE = 3, "Tres"
+
+        names = _MemberNames(["ONE", "TWO"])
+        names.append("THREE")
+        self.assertEqual(names.pop(), "THREE")
+        names.remove("ONE")
+        self.assertEqual(
+            (names, "TWO" in names, "ONE" in names), (["TWO"], True, False)
+        )
@@ -0,0 +1,178 @@
+"""
+Tests for the optional numpy support in enum_properties.arrays.
+"""
+
+import sys
+import typing as t
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from enum_properties import EnumProperties, IntFlagProperties, Symmetric
+
+np = pytest.importorskip("numpy")
+
+
+class Color(EnumProperties):
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+    weight: float
+
+    RED = 1, "ff0000", (255, 0, 0), 0.25
+    GREEN = 2, "00ff00", (0, 255, 0), 0.5
+    BLUE = 3, "0000ff", (0, 0, 255), 0.75
+
+
+class TestArrays(TestCase):
+    def test_members(self):
+        from enum_properties.arrays import members
+
+        self.assertEqual(members(Color), (Color.RED, Color.GREEN, Color.BLUE))
+
+        class Aliased(EnumProperties):
+            label: t.Annotated[str, Symmetric()]
+
+            ONE = 1, "one"
+            UNO = 1, "uno"
+            TWO = 2, "two"
+
+        self.assertEqual(members(Aliased), (Aliased.ONE, Aliased.TWO))
+
+        class Perm(IntFlagProperties):
+            label: t.Annotated[str, Symmetric()]
+
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+
+        self.assertEqual(members(Perm), (Perm.R, Perm.W, Perm.RW))
+
+    def test_to_codes(self):
+        codes = Color.to_codes(["RED", "ff0000", 2, "0000FF", "purple", (0, 255, 0)])
+        self.assertEqual(codes.dtype, np.int32)
+        self.assertEqual(codes.tolist(), [0, 0, 1, 2, -1, 1])
+
+        codes = Color.to_codes(np.array([[3, 1], [2, 5]]), dtype=np.int8)
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(codes.tolist(), [[2, 0], [1, -1]])
+
+        codes = Color.to_codes(np.array(["00FF00", "red", "RED"]))
+        self.assertEqual(codes.tolist(), [1, -1, 0])
+
+        self.assertEqual(Color.to_codes([]).tolist(), [])
+
+    def test_to_codes_composite_flags(self):
+        class Perm(IntFlagProperties):
+            label: t.Annotated[str, Symmetric()]
+
+            R = 1, "read"
+            W = 2, "write"
+            X = 4, "execute"
+            RW = 3, "read/write"
+
+        self.assertEqual(
+            Perm.to_codes([3, "write", "read/write", "none"]).tolist(), [3, 1, 3, -1]
+        )
+        with self.assertRaisesRegex(ValueError, "^5 resolves to .* has no code"):
+            Perm.to_codes(np.array([1, 5, 2]))
+
+    def test_to_codes_resolves_distinct_values_once(self):
+        from enum_properties import EnumPropertiesMeta
+
+        values = np.array(["RED", 1, "RED", 1, 1.0, [1]], dtype=object)
+        with patch.object(
+            EnumPropertiesMeta, "get", autospec=True, side_effect=EnumPropertiesMeta.get
+        ) as get:
+            self.assertEqual(Color.to_codes(values).tolist(), [0, 0, 0, 0, 0, -1])
+        self.assertEqual(get.call_count, 4)
+
+    def test_from_codes(self):
+        codes = np.array([0, 2, -1, 1])
+        members = Color.from_codes(codes)
+        self.assertEqual(members.dtype, object)
+        self.assertEqual(members.tolist(), [Color.RED, Color.BLUE, None, Color.GREEN])
+
+        self.assertEqual(
+            Color.from_codes(codes, prop="hex", fill="").tolist(),
+            ["ff0000", "0000ff", "", "00ff00"],
+        )
+        weights = Color.from_codes(codes, prop="weight", fill=np.nan)
+        self.assertEqual(weights.dtype, np.float64)
+        self.assertEqual(weights[[0, 1, 3]].tolist(), [0.25, 0.75, 0.5])
+        self.assertTrue(np.isnan(weights[2]))
+
+        rgbs = Color.from_codes(codes, prop="rgb")
+        self.assertEqual(rgbs.shape, (4,))
+        self.assertEqual(rgbs[0], (255, 0, 0))
+
+        self.assertEqual(
+            Color.from_codes(
+                np.array([[0], [1]]), prop="weight", dtype=np.float32
+            ).shape,
+            (2, 1),
+        )
+        for bad in ([3], [-2]):
+            with self.assertRaises(ValueError):
+                Color.from_codes(bad)
+
+    def test_column(self):
+        weights = Color.column_array("weight")
+        self.assertEqual(weights.dtype, np.float64)
+        self.assertEqual(weights.tolist(), [0.25, 0.5, 0.75])
+        self.assertEqual(
+            Color.column_array("hex").tolist(), ["ff0000", "00ff00", "0000ff"]
+        )
+
+        rgbs = Color.column_array("rgb")
+        self.assertEqual((rgbs.shape, rgbs.dtype), ((3,), object))
+        self.assertEqual(rgbs[2], (0, 0, 255))
+
+        from enum_properties.arrays import column
+
+        self.assertEqual(column(Color, "weight", dtype=np.float32).dtype, np.float32)
+        self.assertEqual(
+            Color.from_codes([2, 0], prop="weight").tolist(),
+            Color.column_array("weight")[[2, 0]].tolist(),
+        )
+        with self.assertRaises(ValueError):
+            Color.column_array("name")
+
+    def test_round_trip(self):
+        from tests.big_enum import ISOCountry
+
+        values = np.array(
+            [country.alpha3.lower() for country in ISOCountry] * 3, dtype=object
+        )
+        codes = ISOCountry.to_codes(values)
+        self.assertEqual(
+            ISOCountry.from_codes(codes, prop="alpha3").tolist(),
+            [country.alpha3 for country in ISOCountry] * 3,
+        )
+
+    def test_containers(self):
+        from enum_properties.containers import EnumMap, EnumSet
+
+        members = Color.from_codes(np.array([2, 0, 2]))
+        self.assertEqual(list(EnumSet(Color, members)), [Color.RED, Color.BLUE])
+        self.assertEqual(list(EnumSet(Color, members[:0])), [])
+
+        pairs = np.array([["ff0000", 1], ["0000FF", 3]], dtype=object)
+        self.assertEqual(dict(EnumMap(Color, pairs)), {Color.RED: 1, Color.BLUE: 3})
+        self.assertEqual(dict(EnumMap(Color, pairs[:0])), {})
+
+    def test_numpy_not_installed(self):
+        with patch.dict(sys.modules, {"numpy": None}):
+            sys.modules.pop("enum_properties.arrays", None)
+            try:
+                with self.assertRaises(ImportError):
+                    Color.to_codes(["RED"])
+                with self.assertRaises(ImportError):
+                    Color.from_codes([0])
+                with self.assertRaises(ImportError):
+                    Color.column_array("weight")
+                self.assertEqual(
+                    Color.column_array("weight", "d").tolist(), [0.25, 0.5, 0.75]
+                )
+            finally:
+                sys.modules.pop("enum_properties.arrays", None)
@@ -0,0 +1,92 @@
+"""
+Tests for the benchmark suites in tests/benchmarks.
+"""
+
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from tests.benchmarks import construction, import_time
+
+
+class TestImportTime(TestCase):
+    def test_run(self):
+        results = import_time.run(["many_annotations", "tests.big_enum"], repeat=2)
+        self.assertEqual(results["format"], import_time.FORMAT)
+        self.assertEqual(
+            list(results["results"]), ["many_annotations", "tests.big_enum"]
+        )
+        for result in results["results"].values():
+            self.assertEqual(len(result["samples"]), 2)
+            self.assertEqual(result["min"], min(result["samples"]))
+            self.assertGreater(result["min"], 0)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+    def test_compare(self):
+        def results(**times):
+            return {
+                "commit": "abc",
+                "python": "3.13.0",
+                "implementation": "CPython",
+                "platform": "Linux",
+                "results": {
+                    name: {"min": time, "median": time, "samples": [time]}
+                    for name, time in times.items()
+                },
+            }
+
+        lines, regressions = import_time.compare(
+            results(slower=1000, faster=1000, same=1000),
+            results(slower=1200, faster=800, same=1050, new=10),
+        )
+        self.assertEqual(regressions, ["slower"])
+        self.assertIn("+20.0%  REGRESSION", lines[1])
+        self.assertIn("-20.0%", lines[2])
+        self.assertEqual(len(lines), 5)
+
+        lines, regressions = import_time.compare(
+            results(slower=1000), {**results(slower=1200), "python": "3.14.0"}, 0.25
+        )
+        self.assertEqual(regressions, [])
+        self.assertIn("python differs", lines[0])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            self.assertEqual(
+                import_time.main(["many_legacy", "-r", "1", "-o", output]), 0
+            )
+            with open(output) as results:
+                self.assertIn("many_legacy", json.load(results)["results"])
+            # everything is a regression with a negative threshold
+            self.assertEqual(
+                import_time.main(["many_legacy", "-r", "1", "-c", output, "-t", "-1"]),
+                1,
+            )
+
+
+class TestConstruction(TestCase):
+    def test_run(self):
+        per_member = construction.run([200, 20], repeat=2)
+        self.assertEqual(list(per_member), [20, 200])
+        for seconds in per_member.values():
+            self.assertGreater(seconds, 0)
+
+    def test_check(self):
+        self.assertTrue(construction.check({1000: 1.0, 100_000: 4.0}))
+        self.assertFalse(construction.check({1000: 1.0, 100_000: 4.1}))
+        self.assertTrue(construction.check({100_000: 8.0, 1000: 1.0}, ratio=8))
+
+    def test_main(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(construction.main(["10", "50", "-r", "1"]), 0)
+        self.assertIn("50 members", output.getvalue())
+        with redirect_stdout(io.StringIO()):
+            # everything is a regression with a negative ratio
+            self.assertEqual(
+                construction.main(["10", "-r", "1", "--ratio", "-1"]),
+                1 if construction.LINEAR else 0,
+            )
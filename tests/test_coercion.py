@@ -0,0 +1,406 @@
+"""
+Tests for the symmetric coercion pipeline in SymmetricMixin._missing_.
+"""
+
+import typing as t
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from enum_properties import EnumProperties, IntEnumProperties, Symmetric
+
+
+class Hex:
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return self.value
+
+
+class Color(EnumProperties):
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+
+    RED = 1, "ff0000", (255, 0, 0)
+    GREEN = 2, "00ff00", (0, 255, 0)
+    BLUE = 3, "0000ff", (0, 0, 255)
+
+
+class Priority(IntEnumProperties):
+    label: t.Annotated[str, Symmetric(case_fold=True)]
+    weight: t.Annotated[float, Symmetric()]
+
+    LOW = 1, "low", 0.5
+    HIGH = 2, "high", 1.5
+
+
+class TestCoerceDispatch(TestCase):
+    def test_coercions_resolve(self):
+        self.assertIs(Color("1"), Color.RED)
+        self.assertIs(Color(" 2 "), Color.GREEN)
+        self.assertIs(Color(3.0), Color.BLUE)
+        self.assertIs(Color(Decimal(3)), Color.BLUE)
+        self.assertIs(Color(Hex("FF0000")), Color.RED)
+        self.assertIs(Color(b"2"), Color.GREEN)
+        self.assertIs(Priority("1.5"), Priority.HIGH)
+        self.assertIs(Priority(" 0.5"), Priority.LOW)
+        self.assertIs(Priority(True), Priority.LOW)
+
+    def test_misses_raise(self):
+        for value in ("garbage", "1.5", "", (1, 2), Hex("nope"), object(), 4.0):
+            with self.assertRaises(ValueError):
+                Color(value)
+        for value in ("nan", "inf", "1e", "-", "medium"):
+            with self.assertRaises(ValueError):
+                Priority(value)
+
+    def test_dispatch_table(self):
+        class Coerce(EnumProperties):
+            label: t.Annotated[str, Symmetric(case_fold=True)]
+
+            ONE = 1, "one"
+            TWO = 2, "two"
+
+        self.assertEqual(Coerce._ep_coerce_types_, [int, str])
+        self.assertEqual(Coerce._ep_coerce_dispatch_, {})
+
+        with self.assertRaises(ValueError):
+            Coerce("three")
+        # strings are never coerced to str again, int() is guarded
+        ((coerce_to, guard),) = Coerce._ep_coerce_dispatch_[str]
+        self.assertIs(coerce_to, int)
+        self.assertIsNotNone(guard)
+
+        with self.assertRaises(ValueError):
+            Coerce((1,))
+        # no int coercion is possible from a tuple
+        self.assertEqual([typ for typ, _ in Coerce._ep_coerce_dispatch_[tuple]], [str])
+
+        self.assertIs(Coerce(2.5), Coerce.TWO)
+        self.assertEqual(
+            [typ for typ, _ in Coerce._ep_coerce_dispatch_[float]], [int, str]
+        )
+
+    def test_no_coercion_verdict(self):
+        class OnlyInts(IntEnumProperties):
+            ONE = 1
+            TWO = 2
+
+        self.assertEqual(OnlyInts._ep_coerce_types_, [int])
+        with self.assertRaises(ValueError):
+            OnlyInts((1,))
+        self.assertEqual(OnlyInts._ep_coerce_dispatch_[tuple], ())
+        with self.assertRaises(ValueError):
+            OnlyInts(3)
+        self.assertEqual(OnlyInts._ep_coerce_dispatch_[int], ())
+        self.assertIs(OnlyInts("2"), OnlyInts.TWO)
+
+
+class TestMissCache(TestCase):
+    def test_disabled_by_default(self):
+        self.assertIsNone(Color._ep_miss_cache_)
+        self.assertIsNone(Color.miss_cache_info())
+
+    def test_bad_size(self):
+        for size in (0, -1, "10", 1.5, True):
+            with self.assertRaises(ValueError):
+
+                class BadCache(EnumProperties):
+                    _miss_cache_size_ = size
+
+                    ONE = 1
+
+    def test_repeat_misses(self):
+        class Cached(EnumProperties):
+            _miss_cache_size_ = 2
+
+            label: t.Annotated[str, Symmetric(case_fold=True)]
+
+            ONE = 1, "one"
+            TWO = 2, "two"
+
+        self.assertEqual(Cached.miss_cache_info(), (0, 0, 2, 0))
+        self.assertIs(Cached("ONE"), Cached.ONE)
+        self.assertEqual(Cached.miss_cache_info(), (0, 1, 2, 0))
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                Cached("three")
+        self.assertEqual(Cached.miss_cache_info(), (2, 2, 2, 1))
+
+        # equal values of different types are cached separately
+        with self.assertRaises(ValueError):
+            Cached(3)
+        with self.assertRaises(ValueError):
+            Cached(3.0)
+        self.assertEqual(Cached.miss_cache_info().currsize, 2)
+        self.assertIn((float, 3.0), Cached._ep_miss_cache_._keys)
+        self.assertNotIn((str, "three"), Cached._ep_miss_cache_._keys)
+
+        # unhashable values are never cached
+        with self.assertRaises((ValueError, TypeError)):
+            Cached(["three"])
+        self.assertEqual(Cached.miss_cache_info().currsize, 2)
+
+        Cached._ep_symmetric_map_["three"] = Cached.TWO
+        Cached._ep_maps_changed_()
+        self.assertEqual(Cached.miss_cache_info().currsize, 0)
+        self.assertIs(Cached("three"), Cached.TWO)
+
+    def test_flag_composites(self):
+        from enum_properties import IntFlagProperties
+
+        class Perm(IntFlagProperties):
+            _miss_cache_size_ = 8
+
+            label: t.Annotated[str, Symmetric()]
+
+            R = 1, "read"
+            W = 2, "write"
+
+        # composites fail symmetric resolution but are still created by Flag
+        self.assertEqual(Perm(3), Perm.R | Perm.W)
+        self.assertEqual(Perm.miss_cache_info().currsize, 1)
+        self.assertEqual(Perm(3), Perm.R | Perm.W)
+        self.assertIs(Perm("read"), Perm.R)
+
+    def test_flag_pseudo_members(self):
+        from enum_properties import IntFlagProperties
+
+        class Perm(IntFlagProperties):
+            _miss_cache_size_ = 8
+
+            label: t.Annotated[str, Symmetric()]
+
+            R = 1, "read"
+            W = 2, "write"
+
+        with self.assertRaises(ValueError):
+            Perm("3")
+        self.assertEqual(Perm.miss_cache_info().currsize, 1)
+
+        # creating the composite pseudo member makes the cached miss resolvable
+        self.assertEqual(Perm(3), Perm.R | Perm.W)
+        self.assertEqual(Perm("3"), Perm.R | Perm.W)
+        self.assertEqual(Perm.miss_cache_info().currsize, 0)
+        with self.assertRaises(ValueError):
+            Perm("4")
+        with self.assertRaises(ValueError):
+            Perm("4")
+        self.assertEqual(Perm.miss_cache_info().hits, 1)
+
+
+class TestGet(TestCase):
+    def test_get(self):
+        self.assertIs(Color.get(Color.RED), Color.RED)
+        self.assertIs(Color.get(1), Color.RED)
+        self.assertIs(Color.get("RED"), Color.RED)
+        self.assertIs(Color.get("FF0000"), Color.RED)
+        self.assertIs(Color.get((0, 255, 0)), Color.GREEN)
+        self.assertIs(Color.get("3"), Color.BLUE)
+        self.assertIs(Color.get(Hex("0000FF")), Color.BLUE)
+        self.assertIsNone(Color.get("purple"))
+        self.assertIsNone(Color.get(None))
+        self.assertIsNone(Color.get([1, 2]))
+        self.assertIs(Color.get("purple", Color.BLUE), Color.BLUE)
+        self.assertEqual(Color.get("purple", "default"), "default")
+
+    def test_get_does_not_raise(self):
+        from unittest.mock import patch
+
+        from enum_properties import EnumPropertiesMeta
+
+        with patch.object(
+            EnumPropertiesMeta,
+            "__call__",
+            side_effect=AssertionError("instantiation attempted"),
+        ):
+            self.assertIsNone(Color.get("purple"))
+            self.assertIs(Color.get("ff0000"), Color.RED)
+
+    def test_get_custom_missing(self):
+        class Custom(EnumProperties):
+            label: t.Annotated[str, Symmetric()]
+
+            ONE = 1, "one"
+            TWO = 2, "two"
+
+            @classmethod
+            def _missing_(cls, value):
+                if value == "uno":
+                    return cls.ONE
+                return super()._missing_(value)
+
+        self.assertIs(Custom.get("uno"), Custom.ONE)
+        self.assertIs(Custom.get("two"), Custom.TWO)
+        self.assertIsNone(Custom.get("dos"))
+
+    def test_get_flags(self):
+        from enum_properties import FlagProperties
+
+        class Perm(FlagProperties):
+            label: t.Annotated[str, Symmetric(case_fold=True)]
+
+            R = 1, "read"
+            W = 2, "write"
+            X = 4, "execute"
+
+        self.assertIs(Perm.get("READ"), Perm.R)
+        self.assertEqual(Perm.get(3), Perm.R | Perm.W)
+        self.assertEqual(Perm.get(["read", "execute"]), Perm.R | Perm.X)
+        self.assertEqual(Perm.get(label for label in ("write",)), Perm.W)
+        self.assertIsNone(Perm.get("delete"))
+        self.assertIsNone(Perm.get(["read", "delete"]))
+
+    def test_get_metaclass_only(self):
+        import enum
+        from enum_properties import EnumPropertiesMeta, p
+
+        class NoSymmetry(enum.Enum, metaclass=EnumPropertiesMeta):
+            label: str
+
+            ONE = 1, "one"
+
+        self.assertIs(NoSymmetry.get(1), NoSymmetry.ONE)
+        self.assertIsNone(NoSymmetry.get("one"))
+
+    def test_member_named_get(self):
+        class Method(EnumProperties):
+            get = "GET"
+            post = "POST"
+
+        self.assertIs(Method.get, Method("GET"))
+        self.assertIs(type(Method).get(Method, "POST"), Method.post)
+
+
+class TestCoerceMany(TestCase):
+    def test_coerce_many(self):
+        values = ["ff0000", "RED", 2, "0000FF", (255, 0, 0), "ff0000", Color.BLUE]
+        expected = [Color.RED, Color.RED, Color.GREEN, Color.BLUE]
+        expected += [Color.RED, Color.RED, Color.BLUE]
+        self.assertEqual(Color.coerce_many(values), expected)
+        self.assertEqual(Color.coerce_many(iter(values)), expected)
+        self.assertEqual(Color.coerce_many([]), [])
+
+        lazy = Color.coerce_many(values, lazy=True)
+        self.assertFalse(isinstance(lazy, list))
+        self.assertEqual(list(lazy), expected)
+
+    def test_on_error(self):
+        values = ["red", "purple", 2, [1], "purple"]
+        with self.assertRaises(ValueError):
+            Color.coerce_many(values)
+        with self.assertRaises(ValueError):
+            list(Color.coerce_many(values, lazy=True))
+        self.assertEqual(Color.coerce_many(values, on_error="skip"), [Color.GREEN])
+        self.assertEqual(
+            Color.coerce_many(values, on_error="default", default=Color.BLUE),
+            [Color.BLUE, Color.BLUE, Color.GREEN, Color.BLUE, Color.BLUE],
+        )
+        self.assertEqual(
+            Color.coerce_many(values, on_error="default"),
+            [None, None, Color.GREEN, None, None],
+        )
+        with self.assertRaises(ValueError):
+            Color.coerce_many(values, on_error="ignore", lazy=True)
+
+    def test_memo(self):
+        from unittest.mock import patch
+
+        from enum_properties import EnumPropertiesMeta
+
+        values = ["1", 1.0, "1", True, "1", 1.0, "purple", "purple"]
+        with patch.object(
+            EnumPropertiesMeta, "get", autospec=True, side_effect=EnumPropertiesMeta.get
+        ) as get:
+            self.assertEqual(
+                Color.coerce_many(values, on_error="skip"), [Color.RED] * 6
+            )
+        # 1.0 and True are equal to 1 but must be resolved separately
+        self.assertEqual(get.call_count, 4)
+
+
+class TestSymmetricEquality(TestCase):
+    def test_equality(self):
+        self.assertTrue(Color.RED == Color.RED)
+        self.assertFalse(Color.RED == Color.GREEN)
+        self.assertTrue(Color.RED == "FF0000")
+        self.assertTrue(Color.RED == 1)
+        self.assertTrue(Color.RED == "1")
+        self.assertTrue(Color.RED == (255, 0, 0))
+        self.assertTrue(Color.RED == Hex("ff0000"))
+        self.assertFalse(Color.RED == "00ff00")
+        self.assertFalse(Color.RED == "purple")
+        self.assertFalse(Color.RED == None)  # noqa: E711
+        self.assertFalse(Color.RED == [1])
+        self.assertTrue(Color.RED != "purple")
+        self.assertFalse(Color.RED != "red".upper())
+        self.assertIn("FF0000", [Color.RED])
+        self.assertNotIn(Color.RED, ["purple", "00ff00"])
+        self.assertIn(Color.BLUE, ["purple", "0000ff"])
+
+    def test_equality_does_not_raise(self):
+        from enum_properties import EnumPropertiesMeta
+
+        with patch.object(
+            EnumPropertiesMeta,
+            "__call__",
+            side_effect=AssertionError("instantiation attempted"),
+        ):
+            self.assertFalse(Color.RED == "purple")
+            self.assertTrue(Color.GREEN == "00FF00")
+
+    def test_flag_equality(self):
+        from enum_properties import IntFlagProperties
+
+        class Perm(IntFlagProperties):
+            label: t.Annotated[str, Symmetric()]
+
+            R = 1, "read"
+            W = 2, "write"
+
+        self.assertTrue(Perm.R | Perm.W == 3)
+        self.assertTrue(Perm.R == "read")
+        self.assertFalse(Perm.R == "write")
+        self.assertFalse(Perm.R == 8)
+        self.assertTrue(Perm.R | Perm.W == ["read", "write"])
+
+
+class TestCaseNormalization(TestCase):
+    def test_casenorm_matches_nfkd(self):
+        import random
+        import unicodedata
+
+        from enum_properties import _do_casenorm
+        from tests.big_enum import ISOCountry
+
+        def reference(text):
+            return unicodedata.normalize("NFKD", text.casefold())
+
+        rand = random.Random(0)
+        samples = ["", "us", "USA", "Ave", "ß", "ﬁ", "Σίσυφος", "Åland", "İ", "K"]
+        samples += [
+            "".join(chr(rand.randint(0, 0x2FFF)) for _ in range(rand.randint(1, 8)))
+            for _ in range(2000)
+        ]
+        samples += [
+            getattr(country, prop)
+            for country in ISOCountry
+            for prop in ("alpha2", "alpha3", "short_name", "full_name")
+        ]
+        for text in samples:
+            self.assertEqual(_do_casenorm(text), reference(text), repr(text))
+            self.assertIs(type(_do_casenorm(text)), str)
+            # memoized results are stable
+            self.assertEqual(_do_casenorm(text), reference(text), repr(text))
+
+    def test_str_subclass(self):
+        from enum_properties import _do_casenorm
+
+        class Label(str):
+            pass
+
+        self.assertEqual(_do_casenorm(Label("ÅB")), "åb".replace("å", "å"))
+        self.assertIs(type(_do_casenorm(Label("AB"))), str)
+        self.assertIs(type(_do_casenorm(Label("ÅB"))), str)
@@ -0,0 +1,91 @@
+"""
+Tests for columnar property access with column(), columns() and column_array().
+"""
+
+import typing as t
+from array import array
+from unittest import TestCase
+
+from enum_properties import (
+    EnumProperties,
+    IntFlagProperties,
+    Symmetric,
+    p,
+    s,
+    symmetric,
+)
+
+
+class Color(EnumProperties):
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+    weight: float
+
+    RED = 1, "ff0000", (255, 0, 0), 0.25
+    GREEN = 2, "00ff00", (0, 255, 0), 0.5
+    BLUE = 3, "0000ff", (0, 0, 255), 0.75
+
+    @symmetric()
+    def label(self):
+        return self.name.title()
+
+
+class TestColumns(TestCase):
+    def test_column(self):
+        self.assertEqual(Color.column("hex"), ("ff0000", "00ff00", "0000ff"))
+        self.assertEqual(Color.column("weight"), (0.25, 0.5, 0.75))
+        self.assertIs(Color.column("rgb"), Color.column("rgb"))
+        for prop in Color._properties_:
+            self.assertEqual(
+                Color.column(prop), tuple(getattr(member, prop) for member in Color)
+            )
+        for prop in ("label", "name", "nope"):
+            with self.assertRaisesRegex(ValueError, f"'{prop}' is not a property"):
+                Color.column(prop)
+
+    def test_columns(self):
+        columns = Color.columns()
+        self.assertEqual(list(columns), ["hex", "rgb", "weight"])
+        self.assertEqual(columns["rgb"][1], (0, 255, 0))
+        columns.clear()
+        self.assertEqual(len(Color.columns()), 3)
+
+        class Empty(EnumProperties):
+            ONE = 1
+
+        self.assertEqual(Empty.columns(), {})
+
+    def test_column_array(self):
+        weights = Color.column_array("weight", "d")
+        self.assertIsInstance(weights, array)
+        self.assertEqual(weights.tolist(), [0.25, 0.5, 0.75])
+        with self.assertRaises(TypeError):
+            Color.column_array("hex", "d")
+        with self.assertRaises(ValueError):
+            Color.column_array("label", "d")
+
+    def test_aliases_and_flags(self):
+        class Aliased(EnumProperties, p("label")):
+            ONE = 1, "one"
+            UNO = 1, "uno"
+            TWO = 2, "two"
+
+        self.assertEqual(
+            Aliased.column("label"), tuple(member.label for member in Aliased)
+        )
+
+        class Perm(IntFlagProperties, s("label", case_fold=True)):
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+
+        self.assertEqual(Perm.column("label"), ("read", "write", "read/write"))
+
+    def test_compact(self):
+        class Compact(EnumProperties, p("weight")):
+            _compact_properties_ = True
+
+            ONE = 1, 0.5
+            TWO = 2, 1.5
+
+        self.assertEqual(Compact.column("weight"), (0.5, 1.5))
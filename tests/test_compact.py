@@ -0,0 +1,137 @@
+"""
+Tests for storing property values in tuples with _compact_properties_.
+"""
+
+import pickle
+import sys
+import typing as t
+from unittest import TestCase
+
+from enum_properties import (
+    EnumProperties,
+    FlagProperties,
+    Symmetric,
+    p,
+    s,
+    specialize,
+    symmetric,
+)
+
+
+class CompactEnum(EnumProperties):
+    _compact_properties_ = True
+
+
+class Color(EnumProperties):
+    _compact_properties_ = True
+    _symmetric_builtins_ = [s("name", case_fold=True)]
+
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+    weight: float
+
+    RED = 1, "ff0000", (255, 0, 0), 0.5
+    GREEN = 2, "00ff00", (0, 255, 0), 0.75
+    BLUE = 3, "0000ff", (0, 0, 255), None
+
+    @symmetric(case_fold=True)
+    def label(self):
+        return self.name.title()
+
+
+class TestCompactProperties(TestCase):
+    def test_values(self):
+        self.assertEqual(Color.RED.hex, "ff0000")
+        self.assertEqual(Color.GREEN.rgb, (0, 255, 0))
+        self.assertIsNone(Color.BLUE.weight)
+        self.assertEqual(Color.BLUE.label, "Blue")
+        self.assertEqual(Color.RED._ep_values_, ("ff0000", (255, 0, 0), 0.5, 0))
+        self.assertEqual([member._ordinal_ for member in Color], [0, 1, 2])
+        self.assertNotIn("_ordinal_", vars(Color.GREEN))
+        for member in Color:
+            self.assertFalse({"hex", "rgb", "weight"} & set(vars(member)))
+        self.assertEqual(
+            [str(prop) for prop in Color._properties_], ["hex", "rgb", "weight"]
+        )
+
+    def test_lookups(self):
+        self.assertIs(Color("FF0000"), Color.RED)
+        self.assertIs(Color((0, 0, 255)), Color.BLUE)
+        self.assertIs(Color("green"), Color.GREEN)
+        self.assertIs(Color("Blue"), Color.BLUE)
+        self.assertIs(Color.by_property("hex", "00FF00"), Color.GREEN)
+        self.assertTrue(Color.RED == "ff0000")
+        self.assertIs(pickle.loads(pickle.dumps(Color.GREEN)), Color.GREEN)
+
+    def test_accessors(self):
+        accessor = Color.__dict__["rgb"]
+        self.assertEqual((accessor.name, accessor.index), ("rgb", 1))
+        self.assertIs(Color.rgb, accessor)
+        # values may still be overridden on a member
+        Color.RED.weight = 1.0
+        try:
+            self.assertEqual(Color.RED.weight, 1.0)
+        finally:
+            del Color.RED.weight
+        self.assertEqual(Color.RED.weight, 0.5)
+
+    def test_same_as_dict_storage(self):
+        class Compact(CompactEnum, s("alpha3", case_fold=True), p("independent")):
+            US = 840, "USA", True
+            VA = 336, "VAT", False
+
+        class Plain(EnumProperties, s("alpha3", case_fold=True), p("independent")):
+            US = 840, "USA", True
+            VA = 336, "VAT", False
+
+        for compact, plain in zip(Compact, Plain):
+            self.assertEqual(compact.alpha3, plain.alpha3)
+            self.assertEqual(compact.independent, plain.independent)
+        self.assertIs(Compact("vat"), Compact.VA)
+        self.assertLess(
+            sum(sys.getsizeof(vars(member)) for member in Compact),
+            sum(sys.getsizeof(vars(member)) for member in Plain),
+        )
+
+    def test_specialize(self):
+        class Shape(CompactEnum):
+            sides: int
+
+            SQUARE = 1, 4
+            CIRCLE = 2, 0
+
+            @specialize(SQUARE)
+            def area(self, size):
+                return size * size
+
+            @specialize(CIRCLE)
+            def area(self, size):
+                return 3 * size * size
+
+        self.assertEqual(Shape.SQUARE.area(2), 4)
+        self.assertEqual(Shape.CIRCLE.area(2), 12)
+        self.assertEqual(Shape.SQUARE.sides, 4)
+
+    def test_flags(self):
+        class Perm(FlagProperties):
+            _compact_properties_ = True
+
+            label: t.Annotated[str, Symmetric(case_fold=True)]
+
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read write"
+
+        self.assertEqual(Perm.RW.label, "read write")
+        self.assertIs(Perm("WRITE"), Perm.W)
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'label'"):
+            Perm(0).label
+        self.assertEqual(Perm.RW._ordinal_, 2)
+        self.assertIsNone(Perm(0)._ordinal_)
+
+    def test_missing_values(self):
+        with self.assertRaisesRegex(ValueError, "must have 2 property values"):
+
+            class Color(CompactEnum, p("hex"), p("weight")):
+                RED = 1, "ff0000", 0.5
+                GREEN = 2, "00ff00"
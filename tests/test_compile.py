@@ -0,0 +1,225 @@
+"""
+Tests for compiling enumerations into static modules with enum_properties.compile.
+"""
+
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import typing as t
+from contextlib import redirect_stderr
+from datetime import date
+from unittest import TestCase
+
+from enum_properties import EnumProperties, Symmetric, specialize
+from enum_properties.compile import (
+    _hydrate,
+    _snapshot,
+    compile_class,
+    compile_module,
+    main,
+)
+from tests import compile_enums
+
+
+def load_source(name, source):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{name}.py")
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(source)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def names(mapping):
+    return [(key, member.name) for key, member in mapping.items()]
+
+
+class TestCompile(TestCase):
+    def assertSame(self, original, compiled):
+        self.assertEqual(compiled.__name__, original.__name__)
+        self.assertIs(type(compiled), type(original))
+        self.assertEqual(compiled.__bases__, original.__bases__)
+        self.assertEqual(compiled.__doc__, original.__doc__)
+        self.assertEqual(list(compiled.__members__), list(original.__members__))
+        self.assertEqual(
+            [(m.name, m.value) for m in compiled], [(m.name, m.value) for m in original]
+        )
+        self.assertEqual(compiled._properties_, original._properties_)
+        for mine, theirs in zip(compiled._properties_, original._properties_):
+            self.assertEqual(mine.symmetric, theirs.symmetric)
+            if mine.symmetric:
+                self.assertEqual(mine.case_fold, theirs.case_fold)
+                self.assertEqual(mine.match_none, theirs.match_none)
+        for mine, theirs in zip(compiled._member_map_.values(), original):
+            for prop in original._properties_:
+                self.assertEqual(getattr(mine, prop), getattr(theirs, prop))
+        self.assertEqual(
+            names(compiled._ep_symmetric_map_), names(original._ep_symmetric_map_)
+        )
+        self.assertEqual(
+            names(compiled._ep_isymmetric_map_), names(original._ep_isymmetric_map_)
+        )
+        self.assertEqual(
+            {prop: names(m) for prop, m in compiled._ep_property_maps_.items()},
+            {prop: names(m) for prop, m in original._ep_property_maps_.items()},
+        )
+        self.assertEqual(
+            {prop: names(m) for prop, m in compiled._ep_iproperty_maps_.items()},
+            {prop: names(m) for prop, m in original._ep_iproperty_maps_.items()},
+        )
+        self.assertEqual(compiled._ep_coerce_types_, original._ep_coerce_types_)
+        self.assertEqual(compiled._num_sym_props_, original._num_sym_props_)
+        self.assertIsNone(compiled._ep_pending_)
+        for attr in ("_symmetric_builtins_", "_miss_cache_size_", "_lazy_symmetry_"):
+            self.assertEqual(
+                [str(b) for b in getattr(compiled, attr, [])]
+                if attr == "_symmetric_builtins_"
+                else getattr(compiled, attr, None),
+                [str(b) for b in getattr(original, attr, [])]
+                if attr == "_symmetric_builtins_"
+                else getattr(original, attr, None),
+            )
+
+    def test_module(self):
+        static = load_source("static_enums", compile_module("tests.compile_enums"))
+        for name in ("Color", "Level", "Perm", "Text", "_Private"):
+            original = getattr(compile_enums, name)
+            compiled = getattr(static, name)
+            self.assertEqual(compiled.__module__, "static_enums")
+            self.assertSame(original, compiled)
+            self.assertEqual(compiled.columns(), original.columns())
+            self.assertEqual(
+                [member._ordinal_ for member in compiled._ep_members_],
+                list(range(len(original._ep_members_))),
+            )
+
+        Color = static.Color
+        self.assertIs(Color("FF0000"), Color.RED)
+        self.assertIs(Color((0, 255, 0)), Color.GREEN)
+        self.assertIs(Color("lime"), Color.GREEN)
+        self.assertIs(Color("BLUE"), Color.BLUE)
+        self.assertIs(Color("green"), Color.GREEN)
+        self.assertEqual(Color.RED.label, "Red")
+        self.assertEqual(Color.GREEN.weight, 0.75)
+        self.assertIsNone(Color.BLUE.weight)
+        self.assertTrue(Color.RED == "scarlet")
+        self.assertIs(Color.by_property("alt", "scarlet"), Color.RED)
+        self.assertEqual(Color.complete("gr"), [Color.GREEN])
+        self.assertEqual(Color.fuzzy("scarlot"), [Color.RED])
+        self.assertIsNone(Color.get("purple"))
+        self.assertIsNotNone(Color.miss_cache_info())
+        self.assertEqual(
+            Color.RED._ep_values_, ("ff0000", (255, 0, 0), ["scarlet"], 0.5, 0)
+        )
+        self.assertNotIn("hex", vars(Color.RED))
+
+        Level = static.Level
+        self.assertIs(Level(None), Level.HIGH)
+        self.assertIs(Level("LOW"), Level.LOW)
+        self.assertEqual(Level.HIGH + 1, 3)
+
+        Perm = static.Perm
+        self.assertIs(Perm("READ"), Perm.R)
+        self.assertIs(Perm("all"), Perm.RWX)
+        self.assertEqual(Perm.R | Perm.W, Perm(3))
+        self.assertEqual(Perm.RWX.label, "all")
+        self.assertEqual(Perm.W.bits, "010")
+        self.assertIs(Perm("100"), Perm.X)
+
+        self.assertIs(static._Private.UNO, static._Private.ONE)
+        self.assertIs(static.Text("A"), static.Text.A)
+        self.assertEqual(static.Text.B, "b")
+
+    def test_big_enum(self):
+        from tests.big_enum import ISOCountry
+
+        static = load_source("static_big_enum", compile_module("tests.big_enum"))
+        self.assertSame(ISOCountry, static.ISOCountry)
+        self.assertIs(static.ISOCountry("usa"), static.ISOCountry.US)
+
+    def test_snapshot(self):
+        Color = compile_enums.Color
+        maps = (
+            Color._ep_symmetric_map_,
+            Color._ep_isymmetric_map_,
+            Color._ep_property_maps_,
+            Color._ep_iproperty_maps_,
+            Color._ep_coerce_types_,
+            Color._num_sym_props_,
+        )
+        hydrated = _hydrate(Color, _snapshot(Color, maps))
+        self.assertEqual(names(hydrated[0]), names(maps[0]))
+        self.assertEqual(names(hydrated[1]), names(maps[1]))
+        self.assertEqual(
+            {prop: names(m) for prop, m in hydrated[2].items()},
+            {prop: names(m) for prop, m in maps[2].items()},
+        )
+        self.assertEqual(hydrated[4:], maps[4:])
+
+        class Local(str):
+            pass
+
+        class Typed(EnumProperties):
+            ONE = Local("one")
+
+        with self.assertRaises(LookupError):
+            _snapshot(Typed, (*maps[:4], [Local], 0))
+
+    def test_not_compilable(self):
+        class Methods(EnumProperties):
+            ONE = 1
+
+            def double(self):
+                return self.value * 2
+
+        class Specialized(EnumProperties):
+            ONE = 1
+
+            @specialize(ONE)
+            def describe(self):
+                return "one"
+
+        class Dated(EnumProperties):
+            day: t.Annotated[date, Symmetric()]
+
+            ONE = 1, date(2020, 1, 1)
+
+        class Nan(EnumProperties):
+            ONE = float("nan")
+
+        class Base(EnumProperties):
+            pass
+
+        class Derived(Base):
+            ONE = 1
+
+        for cls in (Methods, Specialized, Dated, Nan, Derived, int):
+            with self.assertRaises(ValueError, msg=cls.__name__):
+                compile_class(cls)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.py")
+            self.assertEqual(main(["tests.compile_enums", "-o", path]), 0)
+            with open(path, encoding="utf-8") as src:
+                self.assertEqual(src.read(), compile_module("tests.compile_enums"))
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            self.assertEqual(main(["tests.does_not_exist"]), 1)
+        self.assertTrue(stderr.getvalue().startswith("error:"))
+
+    def test_command(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "enum_properties.compile", "tests.compile_enums"],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        self.assertEqual(result.stdout, compile_module("tests.compile_enums"))
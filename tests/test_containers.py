@@ -0,0 +1,307 @@
+"""
+Tests for the containers in enum_properties.containers.
+"""
+
+import copy
+import enum
+import pickle
+import typing as t
+from collections.abc import MutableMapping, MutableSet
+from unittest import TestCase
+from unittest.mock import patch
+
+from enum_properties import (
+    EnumProperties,
+    EnumPropertiesMeta,
+    IntFlagProperties,
+    StrEnumProperties,
+    Symmetric,
+    s,
+)
+from enum_properties.containers import EnumMap, EnumSet
+
+
+class Color(EnumProperties):
+    _symmetric_builtins_ = [s("name", case_fold=True)]
+
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+    rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+
+    RED = 1, "ff0000", (255, 0, 0)
+    GREEN = 2, "00ff00", (0, 255, 0)
+    BLUE = 3, "0000ff", (0, 0, 255)
+
+
+Big = EnumProperties("Big", [f"M{idx}" for idx in range(1000)], module=__name__)
+
+
+class TestEnumMap(TestCase):
+    def test_mapping(self):
+        colors = EnumMap(Color)
+        self.assertIsInstance(colors, MutableMapping)
+        self.assertEqual(len(colors), 0)
+        self.assertIs(colors.enum, Color)
+
+        colors[Color.BLUE] = "blue"
+        colors["FF0000"] = "red"
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(list(colors), [Color.RED, Color.BLUE])
+        self.assertEqual(list(colors.values()), ["red", "blue"])
+        self.assertEqual(colors[(255, 0, 0)], "red")
+        self.assertEqual(colors["blue"], "blue")
+        self.assertEqual(colors[3], "blue")
+
+        colors["red"] = "scarlet"
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(colors[Color.RED], "scarlet")
+
+        del colors["0000ff"]
+        self.assertEqual(dict(colors), {Color.RED: "scarlet"})
+        with self.assertRaises(KeyError):
+            del colors[Color.BLUE]
+        with self.assertRaises(KeyError):
+            colors[Color.GREEN]
+
+        self.assertEqual(colors.setdefault("green", "lime"), "lime")
+        self.assertEqual(colors.pop(Color.GREEN), "lime")
+        self.assertEqual(colors.popitem(), (Color.RED, "scarlet"))
+        self.assertFalse(colors)
+
+    def test_keys_that_do_not_resolve(self):
+        colors = EnumMap(Color, {Color.RED: 1})
+        for key in ("purple", 4, None, [1], object()):
+            self.assertNotIn(key, colors)
+            self.assertIsNone(colors.get(key))
+            self.assertEqual(colors.get(key, 0), 0)
+            with self.assertRaises(KeyError):
+                colors[key]
+            with self.assertRaises(KeyError):
+                colors[key] = 1
+        self.assertEqual(colors.get("red"), 1)
+        self.assertIsNone(colors.get("green"))
+
+    def test_keys_resolve_without_raising(self):
+        colors = EnumMap(Color, {Color.RED: 1})
+        # neither misses nor symmetric values are resolved by instantiation
+        with patch.object(
+            EnumPropertiesMeta, "__call__", side_effect=AssertionError
+        ) as call:
+            for key in ("purple", 4, None, (0, 255, 0)):
+                self.assertIsNone(colors.get(key))
+                self.assertNotIn(key, colors)
+            self.assertIn("RED", colors)
+        call.assert_not_called()
+        self.assertEqual(colors.get((255, 0, 0)), 1)
+
+    def test_none_values(self):
+        colors = EnumMap(Color, [(Color.RED, None)])
+        self.assertIn(Color.RED, colors)
+        self.assertIsNone(colors[Color.RED])
+        self.assertEqual(colors.get(Color.RED, 0), None)
+
+    def test_flags(self):
+        class Perm(IntFlagProperties, s("label")):
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+            X = 4, "execute"
+
+        perms = EnumMap(Perm, {"read/write": True, Perm.X: False})
+        self.assertEqual(list(perms), [Perm.RW, Perm.X])
+        self.assertNotIn(Perm.R | Perm.X, perms)
+        with self.assertRaises(KeyError):
+            perms[Perm.R | Perm.X] = True
+
+    def test_copy_equality_and_pickle(self):
+        colors = EnumMap(Color, {Color.GREEN: [1], Color.RED: [2]})
+        for clone in (
+            colors.copy(),
+            copy.copy(colors),
+            copy.deepcopy(colors),
+            pickle.loads(pickle.dumps(colors)),
+        ):
+            self.assertIsInstance(clone, EnumMap)
+            self.assertEqual(clone, colors)
+            self.assertEqual(len(clone), 2)
+            clone[Color.BLUE] = [3]
+            self.assertNotEqual(clone, colors)
+        self.assertIs(colors.copy()[Color.GREEN], colors[Color.GREEN])
+        self.assertIsNot(copy.deepcopy(colors)[Color.GREEN], colors[Color.GREEN])
+
+        self.assertEqual(colors, {Color.RED: [2], Color.GREEN: [1]})
+        self.assertNotEqual(colors, {Color.RED: [2]})
+        self.assertNotEqual(colors, EnumMap(Color))
+        with self.assertRaises(TypeError):
+            hash(colors)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(EnumMap(Color, {"blue": 3, "red": 1})),
+            "EnumMap(Color, {<Color.RED: 1>: 1, <Color.BLUE: 3>: 3})",
+        )
+
+    def test_not_enum_properties(self):
+        class Plain(enum.Enum):
+            ONE = 1
+
+        with self.assertRaises(TypeError):
+            EnumMap(Plain)
+
+
+class TestEnumSet(TestCase):
+    def test_set(self):
+        colors = EnumSet(Color)
+        self.assertIsInstance(colors, MutableSet)
+        self.assertEqual(len(colors), 0)
+        self.assertFalse(colors)
+        self.assertIs(colors.enum, Color)
+
+        colors.add(Color.BLUE)
+        colors.add("FF0000")
+        colors.add((255, 0, 0))
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(list(colors), [Color.RED, Color.BLUE])
+        self.assertEqual(colors.bits, 0b101)
+        for key in (Color.RED, "red", "ff0000", (0, 0, 255), 3):
+            self.assertIn(key, colors)
+        for key in (Color.GREEN, "green", "purple", 4, None, [1], object()):
+            self.assertNotIn(key, colors)
+
+        colors.discard("blue")
+        colors.discard("purple")
+        self.assertEqual(set(colors), {Color.RED})
+        with self.assertRaises(KeyError):
+            colors.remove(Color.BLUE)
+        with self.assertRaises(KeyError):
+            colors.add("purple")
+        colors.remove("Red")
+        self.assertFalse(colors)
+
+        colors = EnumSet(Color, ["green", Color.BLUE])
+        self.assertIn(colors.pop(), {Color.GREEN, Color.BLUE})
+        colors.clear()
+        self.assertEqual(colors.bits, 0)
+
+    def test_algebra(self):
+        warm = EnumSet(Color, ["red", "green"])
+        cool = EnumSet(Color, ["green", "blue"])
+        self.assertEqual(list(warm | cool), list(Color))
+        self.assertEqual(list(warm & cool), [Color.GREEN])
+        self.assertEqual(list(warm - cool), [Color.RED])
+        self.assertEqual(list(warm ^ cool), [Color.RED, Color.BLUE])
+        self.assertEqual(list(~warm), [Color.BLUE])
+        self.assertEqual(EnumSet.all(Color), EnumSet(Color, Color))
+        for result in (warm | cool, warm & cool, warm - cool, warm ^ cool, ~warm):
+            self.assertIsInstance(result, EnumSet)
+
+        # other iterables are resolved to members
+        self.assertEqual(list(warm | {"blue"}), list(Color))
+        self.assertEqual(list({"blue"} | warm), list(Color))
+        self.assertEqual(list(warm & {Color.RED, "purple"}), [Color.RED])
+        self.assertEqual(list(warm - {Color.RED}), [Color.GREEN])
+        self.assertEqual(list(warm ^ {Color.RED}), [Color.GREEN])
+
+        self.assertFalse(warm.isdisjoint(cool))
+        self.assertTrue((warm - cool).isdisjoint(cool))
+        self.assertTrue(warm.isdisjoint({Color.BLUE}))
+        self.assertTrue(warm & cool <= warm)
+        self.assertTrue(warm & cool < warm)
+        self.assertFalse(warm < warm)
+        self.assertTrue(warm >= warm & cool)
+        self.assertTrue(warm > warm & cool)
+        self.assertFalse(warm > cool)
+        self.assertTrue(warm <= {Color.RED, Color.GREEN})
+        self.assertTrue(warm >= {Color.RED})
+
+    def test_in_place(self):
+        colors = EnumSet(Color, ["red"])
+        same = colors
+        colors |= EnumSet(Color, ["blue"])
+        colors |= ["green"]
+        self.assertEqual(list(colors), list(Color))
+        colors &= EnumSet(Color, ["green", "blue"])
+        colors -= EnumSet(Color, ["blue"])
+        self.assertEqual(list(colors), [Color.GREEN])
+        colors ^= EnumSet(Color, ["green", "red"])
+        colors ^= {Color.BLUE}
+        colors -= {Color.BLUE}
+        colors &= {Color.RED, Color.GREEN}
+        self.assertEqual(list(colors), [Color.RED])
+        self.assertIs(colors, same)
+
+    def test_enumerations(self):
+        class Perm(IntFlagProperties, s("label")):
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+            X = 4, "execute"
+
+        perms = EnumSet(Perm, ["read/write", Perm.X])
+        self.assertEqual(list(perms), [Perm.RW, Perm.X])
+        self.assertNotIn(Perm.R | Perm.X, perms)
+        with self.assertRaises(KeyError):
+            perms.add(Perm.R | Perm.X)
+
+        class Suit(StrEnumProperties, s("symbol")):
+            HEARTS = "hearts", "♥"
+            SPADES = "spades", "♠"
+
+        self.assertEqual(list(EnumSet(Suit, ["♠", "hearts"])), list(Suit))
+
+        # sets of different enumerations are compared as plain sets
+        self.assertNotEqual(EnumSet(Suit), EnumSet(Color, ["red"]))
+        self.assertEqual(EnumSet(Suit), EnumSet(Color))
+
+    def test_large(self):
+        even = EnumSet(Big, list(Big)[::2])
+        self.assertEqual(len(even), 500)
+        self.assertEqual(len(~even), 500)
+        self.assertEqual(list(~even)[:2], [Big.M1, Big.M3])
+        self.assertEqual(even.bits, int("01" * 500, 2))
+        self.assertIn(Big.M998, even)
+        self.assertNotIn(Big.M999, even)
+        # only the bits are pickled, not the members
+        self.assertEqual(pickle.loads(pickle.dumps(even)), even)
+        self.assertLess(len(pickle.dumps(even)), len(pickle.dumps(set(even))) / 10)
+
+    def test_copy_equality_and_pickle(self):
+        colors = EnumSet(Color, [Color.GREEN, Color.RED])
+        for clone in (
+            colors.copy(),
+            copy.copy(colors),
+            copy.deepcopy(colors),
+            pickle.loads(pickle.dumps(colors)),
+        ):
+            self.assertIsInstance(clone, EnumSet)
+            self.assertEqual(clone, colors)
+            clone.add(Color.BLUE)
+            self.assertNotEqual(clone, colors)
+
+        self.assertEqual(colors, {Color.RED, Color.GREEN})
+        self.assertNotEqual(colors, {Color.RED})
+        self.assertNotEqual(colors, EnumSet(Color))
+        with self.assertRaises(TypeError):
+            hash(colors)
+
+    def test_from_bits(self):
+        self.assertEqual(
+            list(EnumSet.from_bits(Color, 0b110)), [Color.GREEN, Color.BLUE]
+        )
+        for bits in (-1, 0b1000):
+            with self.assertRaisesRegex(ValueError, "not a valid set of Color members"):
+                EnumSet.from_bits(Color, bits)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(EnumSet(Color, ["blue", "red"])),
+            "EnumSet(Color, {<Color.RED: 1>, <Color.BLUE: 3>})",
+        )
+
+    def test_not_enum_properties(self):
+        class Plain(enum.Enum):
+            ONE = 1
+
+        with self.assertRaises(TypeError):
+            EnumSet(Plain)
+        with self.assertRaises(TypeError):
+            EnumSet.from_bits(Plain, 1)
@@ -0,0 +1,249 @@
+"""
+Tests for creating enumerations from CSV and JSON data with from_csv() and
+from_json().
+"""
+
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from enum_properties import EnumProperties, IntEnumProperties, p, s
+
+CSV = """code,number,symbol,decimals,name
+USD,840,$,2,US Dollar
+EUR,978,€,2,Euro
+JPY,392,¥,0,Yen
+"""
+
+ROWS = [
+    {"code": "USD", "number": 840, "symbol": "$", "decimals": 2, "name": "US Dollar"},
+    {"code": "EUR", "number": 978, "symbol": "€", "decimals": 2, "name": "Euro"},
+    {"code": "JPY", "number": 392, "symbol": "¥", "decimals": 0, "name": "Yen"},
+]
+
+
+class TestFromCSV(TestCase):
+    def check(self, Currency):
+        self.assertEqual(Currency.__name__, "Currency")
+        self.assertEqual(Currency.__module__, __name__)
+        self.assertEqual([member.name for member in Currency], ["USD", "EUR", "JPY"])
+        self.assertEqual(Currency.USD.value, 840)
+        self.assertEqual(Currency.EUR.decimals, 2)
+        self.assertEqual(Currency.JPY.name, "JPY")
+        self.assertIs(Currency("€"), Currency.EUR)
+        self.assertIs(Currency("yen"), Currency.JPY)
+        self.assertIs(Currency(392), Currency.JPY)
+        self.assertEqual(
+            [str(prop) for prop in Currency._properties_],
+            ["symbol", "decimals", "full_name"],
+        )
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "currencies.csv")
+            with open(path, "w", encoding="utf-8") as out:
+                out.write(CSV.replace("name", "full_name", 1))
+            self.check(
+                EnumProperties.from_csv(
+                    "Currency",
+                    path,
+                    member="code",
+                    value="number",
+                    properties=[
+                        s("symbol"),
+                        "decimals",
+                        s("full_name", case_fold=True),
+                    ],
+                    converters={"number": int, "decimals": int},
+                )
+            )
+
+    def test_file(self):
+        self.check(
+            EnumProperties.from_csv(
+                "Currency",
+                io.StringIO(CSV.replace("name", "full_name", 1)),
+                member="code",
+                value="number",
+                properties=[s("symbol"), p("decimals"), s("full_name", case_fold=True)],
+                converters={"number": int, "decimals": int},
+            )
+        )
+
+    def test_sequential_values(self):
+        Currency = IntEnumProperties.from_csv(
+            "Currency",
+            CSV.splitlines(),
+            member="name",
+            properties=["code"],
+            start=10,
+            converters={"name": str.upper},
+            module="currencies",
+            qualname="money.Currency",
+        )
+        self.assertEqual(Currency["US DOLLAR"], 10)
+        self.assertEqual(Currency.YEN.code, "JPY")
+        self.assertEqual(Currency.__module__, "currencies")
+        self.assertEqual(Currency.__qualname__, "money.Currency")
+
+    def test_no_properties(self):
+        Currency = EnumProperties.from_csv(
+            "Currency", io.StringIO(CSV), member="code", value="name"
+        )
+        self.assertEqual(Currency.EUR.value, "Euro")
+        self.assertEqual(Currency._properties_, [])
+
+    def test_dialect(self):
+        Currency = EnumProperties.from_csv(
+            "Currency",
+            io.StringIO(CSV.replace(",", ";")),
+            member="code",
+            value="number",
+            properties=[s("symbol")],
+            delimiter=";",
+        )
+        self.assertIs(Currency("$"), Currency.USD)
+        self.assertEqual(Currency.USD.value, "840")
+
+    def test_missing_columns(self):
+        with self.assertRaisesRegex(ValueError, "missing columns: rate, ratio"):
+            EnumProperties.from_csv(
+                "Currency",
+                io.StringIO(CSV),
+                member="code",
+                value="rate",
+                properties=["symbol", "ratio"],
+            )
+        with self.assertRaisesRegex(ValueError, "missing columns: code"):
+            EnumProperties.from_csv("Currency", io.StringIO(""), member="code")
+
+    def test_short_rows(self):
+        with self.assertRaisesRegex(ValueError, "row 2 does not have 'symbol'"):
+            EnumProperties.from_csv(
+                "Currency",
+                io.StringIO("code,number,symbol\nUSD,840,$\nEUR,978\n"),
+                member="code",
+                value="number",
+                properties=[s("symbol")],
+            )
+        with self.assertRaisesRegex(ValueError, "row 1 does not have 'code'"):
+            EnumProperties.from_csv(
+                "Currency",
+                io.StringIO("number,code\n840\n"),
+                member="code",
+                value="number",
+            )
+        # empty values are values
+        Currency = EnumProperties.from_csv(
+            "Currency",
+            io.StringIO("code,number,symbol\nEUR,978,\n"),
+            member="code",
+            value="number",
+            properties=["symbol"],
+        )
+        self.assertEqual(Currency.EUR.symbol, "")
+
+    def test_large(self):
+        rows = 20000
+
+        def lines():
+            yield "name,value,label\n"
+            for idx in range(rows):
+                yield f"M{idx},{idx},label {idx}\n"
+
+        Big = EnumProperties.from_csv(
+            "Big",
+            lines(),
+            member="name",
+            value="value",
+            properties=[s("label")],
+            converters={"value": int},
+        )
+        self.assertEqual(len(Big), rows)
+        self.assertIs(Big("label 12345"), Big.M12345)
+        self.assertIs(Big(19999), Big.M19999)
+
+
+class TestFromJSON(TestCase):
+    def check(self, Currency):
+        self.assertEqual(Currency.__module__, __name__)
+        self.assertEqual([member.name for member in Currency], ["USD", "EUR", "JPY"])
+        self.assertEqual(Currency.USD.value, 840)
+        self.assertEqual(Currency.JPY.decimals, 0)
+        self.assertEqual(Currency.EUR.full_name, "EURO")
+        self.assertIs(Currency("¥"), Currency.JPY)
+
+    def test_array(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "currencies.json")
+            with open(path, "w", encoding="utf-8") as out:
+                json.dump(
+                    [{**row, "full_name": row["name"]} for row in ROWS],
+                    out,
+                    ensure_ascii=False,
+                )
+            self.check(
+                EnumProperties.from_json(
+                    "Currency",
+                    path,
+                    member="code",
+                    value="number",
+                    properties=[s("symbol"), "decimals", "full_name"],
+                    converters={"full_name": str.upper},
+                )
+            )
+
+    def test_lines(self):
+        text = "\n".join(json.dumps({**row, "full_name": row["name"]}) for row in ROWS)
+        self.check(
+            EnumProperties.from_json(
+                "Currency",
+                io.StringIO(text + "\n\n"),
+                member="code",
+                value="number",
+                properties=[s("symbol"), "decimals", "full_name"],
+                lines=True,
+                converters={"full_name": str.upper},
+            )
+        )
+
+    def test_lines_iterable(self):
+        self.check(
+            EnumProperties.from_json(
+                "Currency",
+                json.dumps(
+                    [{**row, "full_name": row["name"]} for row in ROWS],
+                    ensure_ascii=False,
+                    indent=1,
+                ).splitlines(keepends=True),
+                member="code",
+                value="number",
+                properties=[s("symbol"), "decimals", "full_name"],
+                converters={"full_name": str.upper},
+            )
+        )
+
+    def test_values(self):
+        Currency = EnumProperties.from_json(
+            "Currency",
+            io.StringIO(json.dumps(ROWS)),
+            member="code",
+            properties=[s("number")],
+        )
+        self.assertEqual(Currency.EUR.value, 2)
+        self.assertIs(Currency(392), Currency.JPY)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "JSON array"):
+            EnumProperties.from_json("Currency", io.StringIO("{}"), member="code")
+        with self.assertRaisesRegex(ValueError, "row 2 does not have 'rate'"):
+            EnumProperties.from_json(
+                "Currency",
+                io.StringIO(json.dumps([{"code": "A", "rate": 1}, {"code": "B"}])),
+                member="code",
+                value="rate",
+            )
+        with self.assertRaisesRegex(ValueError, "row 1 is not an object"):
+            EnumProperties.from_json("Currency", io.StringIO("[[1, 2]]"), member="code")
@@ -0,0 +1,170 @@
+"""
+Tests for deferring symmetric map construction with _lazy_symmetry_.
+"""
+
+import threading
+import time
+import typing as t
+from unittest import TestCase
+from unittest.mock import patch
+
+import enum_properties
+from enum_properties import EnumProperties, Symmetric, p, s, symmetric
+
+
+class LazyEnum(EnumProperties):
+    _lazy_symmetry_ = True
+
+
+def define(base=EnumProperties):
+    class Color(base):
+        hex: t.Annotated[str, Symmetric(case_fold=True)]
+        rgb: t.Annotated[tuple[int, int, int], Symmetric()]
+        alt: t.Annotated[list[str], Symmetric()]
+
+        RED = 1, "ff0000", (255, 0, 0), ["scarlet"]
+        GREEN = 2, "00ff00", (0, 255, 0), ["lime", "2"]
+        BLUE = 3, "0000ff", (0, 0, 255), []
+
+        @symmetric(case_fold=True)
+        def label(self):
+            return self.name.title()
+
+    return Color
+
+
+class TestLazySymmetry(TestCase):
+    def test_deferred(self):
+        Color = define(LazyEnum)
+        self.assertIsNotNone(Color._ep_pending_)
+        self.assertEqual(Color._ep_isymmetric_map_, {})
+        self.assertEqual(Color._ep_coerce_types_, [])
+        self.assertNotIn("ff0000", Color._ep_symmetric_map_)
+
+        self.assertIs(Color("FF0000"), Color.RED)
+        self.assertIsNone(Color._ep_pending_)
+        self.assertIn("ff0000", Color._ep_symmetric_map_)
+
+    def test_same_as_eager(self):
+        Lazy = define(LazyEnum)
+        Eager = define()
+        self.assertIsNone(Eager._ep_pending_)
+        Lazy("red")
+
+        def names(mapping):
+            return [(key, member.name) for key, member in mapping.items()]
+
+        self.assertEqual(
+            names(Lazy._ep_symmetric_map_), names(Eager._ep_symmetric_map_)
+        )
+        self.assertEqual(
+            names(Lazy._ep_isymmetric_map_), names(Eager._ep_isymmetric_map_)
+        )
+        self.assertEqual(
+            {prop: names(mapping) for prop, mapping in Lazy._ep_property_maps_.items()},
+            {
+                prop: names(mapping)
+                for prop, mapping in Eager._ep_property_maps_.items()
+            },
+        )
+        self.assertEqual(Lazy._ep_coerce_types_, Eager._ep_coerce_types_)
+        self.assertEqual(Lazy._num_sym_props_, Eager._num_sym_props_)
+        for value in ("lime", "2", 2, (0, 0, 255), "scarlet", "Blue", "bLuE"):
+            self.assertEqual(Lazy(value).name, Eager(value).name)
+
+    def test_lookups_build(self):
+        for lookup in (
+            lambda Color: Color.RED == "scarlet",
+            lambda Color: Color.get("scarlet"),
+            lambda Color: Color.coerce_many(["scarlet"]),
+            lambda Color: Color.by_property("alt", "scarlet"),
+            lambda Color: Color.complete("scar"),
+            lambda Color: Color.fuzzy("scarlot"),
+        ):
+            Color = define(LazyEnum)
+            self.assertIsNotNone(Color._ep_pending_)
+            self.assertTrue(lookup(Color))
+            self.assertIsNone(Color._ep_pending_)
+
+    def test_value_lookups_do_not_build(self):
+        Color = define(LazyEnum)
+        self.assertIs(Color(1), Color.RED)
+        self.assertIs(Color["GREEN"], Color.GREEN)
+        self.assertEqual(Color.BLUE.hex, "0000ff")
+        self.assertIsNotNone(Color._ep_pending_)
+
+    def test_legacy(self):
+        class Color(EnumProperties, s("hex", case_fold=True), p("weight")):
+            _lazy_symmetry_ = True
+
+            RED = 1, "ff0000", 0.5
+            GREEN = 2, "00ff00", 0.75
+
+        self.assertIsNotNone(Color._ep_pending_)
+        self.assertIs(Color("00FF00"), Color.GREEN)
+        self.assertIsNone(Color._ep_pending_)
+
+    def test_errors_are_deterministic(self):
+        class Unhashable(EnumProperties):
+            _lazy_symmetry_ = True
+
+            tags: t.Annotated[t.Any, Symmetric()]
+
+            ONE = 1, "one"
+            TWO = 2, {"two": 2}
+
+        self.assertIs(Unhashable(1), Unhashable.ONE)
+        members = dict(Unhashable._member_map_)
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                Unhashable("one")
+            with self.assertRaises(ValueError):
+                Unhashable.by_property("tags", "one")
+            # a failed build publishes nothing
+            self.assertEqual(dict(Unhashable._member_map_), members)
+            self.assertIsNotNone(Unhashable._ep_pending_)
+
+        class BadBuiltins(EnumProperties):
+            _lazy_symmetry_ = True
+            _symmetric_builtins_ = ["name", "nope"]
+
+            ONE = 1
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                BadBuiltins("ONE")
+
+    def test_eager_errors(self):
+        with self.assertRaises(ValueError):
+
+            class Unhashable(EnumProperties):
+                tags: t.Annotated[t.Any, Symmetric()]
+
+                ONE = 1, {"one": 1}
+
+    def test_threads(self):
+        Color = define(LazyEnum)
+        build = enum_properties._build_maps
+        calls = []
+
+        def slow_build(*args, **kwargs):
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return build(*args, **kwargs)
+
+        results = []
+        barrier = threading.Barrier(8)
+
+        def lookup():
+            barrier.wait()
+            results.append(Color("lime"))
+
+        with patch("enum_properties._build_maps", slow_build):
+            threads = [threading.Thread(target=lookup) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [Color.GREEN] * 8)
@@ -0,0 +1,182 @@
+"""
+Tests for the targeted lookup APIs on EnumPropertiesMeta.
+"""
+
+import typing as t
+from unittest import TestCase
+
+from enum_properties import EnumProperties, Symmetric, _edit_distance, symmetric
+from tests.big_enum import ISOCountry
+
+
+class Route(EnumProperties):
+    name: t.Annotated[str, Symmetric(case_fold=True)]
+
+    abbr: t.Annotated[str, Symmetric(case_fold=True)]
+    alt: t.Annotated[list[str], Symmetric()]
+    note: str
+
+    ALLEY = 1, "ALY", ["ALLEE", "ALLY"], "a narrow street"
+    AVENUE = 2, "AVE", ["AV", "AVEN", "AVENU", "ALLY"], "a wide street"
+    CIRCLE = 3, "CIR", ["CIRC", "AVE"], "a round street"
+
+    @symmetric()
+    def label(self):
+        return self.name.title()
+
+
+class TestByProperty(TestCase):
+    def test_by_property(self):
+        self.assertIs(ISOCountry.by_property("alpha3", "USA"), ISOCountry.US)
+        self.assertIs(ISOCountry.by_property("alpha3", "usa"), ISOCountry.US)
+        self.assertIs(ISOCountry.by_property("alpha2", "us"), ISOCountry.US)
+        with self.assertRaises(ValueError):
+            # a valid alpha2 but not a valid alpha3
+            ISOCountry.by_property("alpha3", "US")
+        self.assertIsNone(ISOCountry.by_property("alpha3", "US", None))
+
+    def test_no_fall_through(self):
+        self.assertIs(Route("AVE"), Route.AVENUE)
+        self.assertIs(Route.by_property("abbr", "ave"), Route.AVENUE)
+        self.assertIs(Route.by_property("alt", "AVE"), Route.CIRCLE)
+        # alt is case sensitive
+        self.assertIs(Route.by_property("alt", "ave", Route.ALLEY), Route.ALLEY)
+        # first definition wins within a property
+        self.assertIs(Route.by_property("alt", "ALLY"), Route.ALLEY)
+        with self.assertRaises(ValueError):
+            Route.by_property("abbr", 1)
+        with self.assertRaises(ValueError):
+            Route.by_property("alt", "ALY")
+
+    def test_builtins(self):
+        self.assertIs(Route.by_property("name", "circle"), Route.CIRCLE)
+        self.assertIs(Route.by_property("label", "Circle"), Route.CIRCLE)
+        self.assertIsNone(Route.by_property("label", "circle", None))
+
+    def test_not_symmetric(self):
+        for prop in ("note", "value", "nope"):
+            with self.assertRaises(ValueError):
+                Route.by_property(prop, "a round street")
+            with self.assertRaises(ValueError):
+                Route.by_property(prop, "a round street", None)
+
+    def test_property_maps(self):
+        self.assertEqual(
+            set(Route._ep_property_maps_), {"name", "abbr", "alt", "label"}
+        )
+        self.assertEqual(set(Route._ep_iproperty_maps_), {"name", "abbr"})
+        self.assertEqual(
+            Route._ep_iproperty_maps_["abbr"],
+            {"aly": Route.ALLEY, "ave": Route.AVENUE, "cir": Route.CIRCLE},
+        )
+
+
+class TestComplete(TestCase):
+    def test_complete(self):
+        self.assertEqual(
+            ISOCountry.complete("United"),
+            [ISOCountry.AE, ISOCountry.GB, ISOCountry.UM, ISOCountry.US],
+        )
+        # every property here is case folded
+        self.assertEqual(ISOCountry.complete("united"), ISOCountry.complete("United"))
+        self.assertEqual(
+            ISOCountry.complete("united", limit=2), [ISOCountry.AE, ISOCountry.GB]
+        )
+        self.assertEqual(ISOCountry.complete("usa"), [ISOCountry.US])
+        self.assertEqual(ISOCountry.complete("United", limit=0), [])
+        self.assertEqual(ISOCountry.complete("Zz"), [])
+        self.assertEqual(len(ISOCountry.complete("")), len(ISOCountry))
+
+    def test_case_fold(self):
+        # alt is case sensitive, abbr and name are not
+        self.assertEqual(Route.complete("ALL"), [Route.ALLEY])
+        self.assertEqual(Route.complete("all"), [Route.ALLEY])
+        self.assertEqual(Route.complete("CIRC"), [Route.CIRCLE])
+        self.assertEqual(Route.complete("circ"), [Route.CIRCLE])
+        self.assertEqual(Route.complete("CIRC", prop="alt"), [Route.CIRCLE])
+        self.assertEqual(Route.complete("circ", prop="alt"), [])
+        self.assertEqual(Route.complete("circ", prop="abbr"), [])
+
+    def test_exact_case_first(self):
+        self.assertEqual(Route.complete("Av"), [Route.AVENUE])
+        # ordered by first matching value: ALLEE, AV, AVE
+        self.assertEqual(
+            Route.complete("A", prop="alt"), [Route.ALLEY, Route.AVENUE, Route.CIRCLE]
+        )
+        self.assertEqual(
+            Route.complete("AVE", prop="alt"), [Route.CIRCLE, Route.AVENUE]
+        )
+        # exact case matches on any property come before case insensitive ones
+        self.assertEqual(Route.complete("Ci"), [Route.CIRCLE])
+        self.assertEqual(Route.complete("a"), [Route.ALLEY, Route.AVENUE])
+        self.assertEqual(Route.complete("C", prop="label"), [Route.CIRCLE])
+
+    def test_not_symmetric(self):
+        for prop in ("note", "value", "nope"):
+            with self.assertRaises(ValueError):
+                Route.complete("a", prop=prop)
+
+    def test_invalidation(self):
+        class Color(EnumProperties):
+            hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+            RED = 1, "ff0000"
+            GREEN = 2, "00ff00"
+
+        self.assertEqual(Color.complete("ff"), [Color.RED])
+        Color._ep_isymmetric_map_["ffff00"] = Color.GREEN
+        Color._ep_maps_changed_()
+        self.assertEqual(Color.complete("ff"), [Color.RED, Color.GREEN])
+
+
+class TestFuzzy(TestCase):
+    def test_edit_distance(self):
+        self.assertEqual(_edit_distance("kitten", "sitting", 3), 3)
+        self.assertEqual(_edit_distance("kitten", "sitting", 2), 3)
+        self.assertEqual(_edit_distance("", "abc", 5), 3)
+        self.assertEqual(_edit_distance("abc", "", 1), 2)
+        self.assertEqual(_edit_distance("flaw", "lawn", 2), 2)
+        self.assertEqual(_edit_distance("same", "same", 0), 0)
+        self.assertEqual(_edit_distance("abcdef", "ab", 2), 3)
+
+    def test_fuzzy(self):
+        self.assertEqual(ISOCountry.fuzzy("Germny"), [ISOCountry.DE])
+        self.assertEqual(ISOCountry.fuzzy("GERMNY"), [ISOCountry.DE])
+        self.assertEqual(ISOCountry.fuzzy("Germny", max_distance=0), [])
+        self.assertEqual(ISOCountry.fuzzy("Germany", max_distance=0), [ISOCountry.DE])
+        self.assertEqual(
+            ISOCountry.fuzzy("the Unitd States of Amerika"), [ISOCountry.US]
+        )
+        self.assertEqual(ISOCountry.fuzzy("qqqqqqqqqqqqqq"), [])
+
+    def test_closest_first(self):
+        self.assertEqual(ISOCountry.fuzzy("usa")[0], ISOCountry.US)
+        self.assertEqual(ISOCountry.fuzzy("usa", limit=1), [ISOCountry.US])
+        self.assertEqual(len(ISOCountry.fuzzy("usa", limit=3)), 3)
+        self.assertEqual(ISOCountry.fuzzy("usa", limit=0), [])
+        matches = ISOCountry.fuzzy("Austrai", max_distance=2)
+        self.assertEqual(set(matches[:2]), {ISOCountry.AT, ISOCountry.AU})
+
+    def test_case_fold(self):
+        # alt is case sensitive, abbr is not
+        self.assertEqual(Route.fuzzy("ALLE", max_distance=1), [Route.ALLEY])
+        self.assertEqual(Route.fuzzy("alle", max_distance=1), [Route.ALLEY])
+        self.assertEqual(Route.fuzzy("CIRK", max_distance=1), [Route.CIRCLE])
+        self.assertEqual(Route.fuzzy("CIRC", max_distance=0), [Route.CIRCLE])
+        self.assertEqual(Route.fuzzy("circ", max_distance=0), [])
+
+    def test_not_a_string(self):
+        with self.assertRaises(TypeError):
+            Route.fuzzy(1)  # type: ignore[arg-type]
+
+    def test_invalidation(self):
+        class Color(EnumProperties):
+            hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+            RED = 1, "ff0000"
+            GREEN = 2, "00ff00"
+
+        self.assertEqual(Color.fuzzy("ff00fe"), [Color.RED])
+        Color._ep_isymmetric_map_["ff00ff"] = Color.GREEN
+        Color._ep_maps_changed_()
+        self.assertEqual(Color.fuzzy("ff00fe"), [Color.GREEN, Color.RED])
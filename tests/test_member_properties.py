@@ -0,0 +1,275 @@
+"""
+Tests for properties computed once per member with @member_property.
+"""
+
+import pickle
+import typing as t
+from unittest import TestCase
+
+from enum_properties import (
+    EnumProperties,
+    FlagProperties,
+    IntEnumProperties,
+    IntFlagProperties,
+    Symmetric,
+    member_property,
+    p,
+    s,
+    specialize,
+    symmetric,
+)
+
+
+class MapBoxStyle(EnumProperties):
+    label: t.Annotated[str, Symmetric(case_fold=True)]
+    version: int
+
+    STREETS = "streets", "Streets", 12
+    OUTDOORS = "outdoors", "Outdoors", 12
+    LIGHT = "light", "Light", 11
+
+    @symmetric(case_fold=True)
+    @member_property
+    def uri(self):
+        """The mapbox style uri."""
+        return f"mapbox://styles/mapbox/{self.value}-v{self.version}"
+
+    @member_property
+    def title(self):
+        return f"{self.label} ({self.uri})"
+
+
+class TestMemberProperty(TestCase):
+    def test_values(self):
+        self.assertEqual(MapBoxStyle.LIGHT.uri, "mapbox://styles/mapbox/light-v11")
+        self.assertEqual(
+            MapBoxStyle.STREETS.title, "Streets (mapbox://styles/mapbox/streets-v12)"
+        )
+        self.assertEqual(
+            [str(prop) for prop in MapBoxStyle._properties_],
+            ["label", "version", "uri", "title"],
+        )
+        self.assertTrue(MapBoxStyle._properties_[2].symmetric)
+        self.assertFalse(MapBoxStyle._properties_[3].symmetric)
+        for member in MapBoxStyle:
+            self.assertEqual(vars(member)["uri"], member.uri)
+        self.assertEqual(
+            MapBoxStyle.column("uri"),
+            tuple(
+                f"mapbox://styles/mapbox/{m.value}-v{m.version}" for m in MapBoxStyle
+            ),
+        )
+        self.assertEqual(MapBoxStyle.uri.__doc__, "The mapbox style uri.")
+
+    def test_lookups(self):
+        self.assertIs(
+            MapBoxStyle("mapbox://styles/mapbox/light-v11"), MapBoxStyle.LIGHT
+        )
+        self.assertIs(
+            MapBoxStyle("MAPBOX://STYLES/MAPBOX/LIGHT-V11"), MapBoxStyle.LIGHT
+        )
+        self.assertIs(
+            MapBoxStyle.by_property("uri", "mapbox://styles/mapbox/streets-v12"),
+            MapBoxStyle.STREETS,
+        )
+        self.assertTrue(MapBoxStyle.OUTDOORS == "mapbox://styles/mapbox/outdoors-v12")
+        # non-symmetric member properties are not lookup values
+        with self.assertRaises(ValueError):
+            MapBoxStyle(MapBoxStyle.LIGHT.title)
+        self.assertIs(pickle.loads(pickle.dumps(MapBoxStyle.LIGHT)), MapBoxStyle.LIGHT)
+
+    def test_evaluated_once(self):
+        calls = []
+
+        class Color(IntEnumProperties, p("hex")):
+            RED = 1, "ff0000"
+            GREEN = 2, "00ff00"
+            SCARLET = 1, "ff0000"
+
+            @member_property
+            def integer(self):
+                calls.append(self)
+                return int(self.hex, 16)
+
+        self.assertEqual(calls, [Color.RED, Color.GREEN])
+        self.assertEqual(Color.GREEN.integer, 0x00FF00)
+        self.assertEqual(Color.SCARLET.integer, 0xFF0000)
+        self.assertEqual(len(calls), 2)
+
+    def test_compact(self):
+        class Color(EnumProperties, s("hex", case_fold=True)):
+            _compact_properties_ = True
+
+            RED = 1, "ff0000"
+            GREEN = 2, "00ff00"
+
+            @symmetric()
+            @member_property
+            def integer(self):
+                return int(self.hex, 16)
+
+            @member_property
+            def double(self):
+                return self.integer * 2
+
+        self.assertEqual(Color.RED._ep_values_, ("ff0000", 0xFF0000, 0x1FE0000, 0))
+        self.assertEqual(Color.GREEN.double, 0x00FF00 * 2)
+        self.assertIs(Color(0xFF0000), Color.RED)
+        self.assertEqual(Color.GREEN._ordinal_, 1)
+        self.assertNotIn("integer", vars(Color.RED))
+
+    def test_specialize(self):
+        class Shape(EnumProperties, p("sides")):
+            SQUARE = 1, 4
+            CIRCLE = 2, 0
+
+            @specialize(SQUARE)
+            def area(self, size):
+                return size * size
+
+            @specialize(CIRCLE)
+            def area(self, size):
+                return 3 * size * size
+
+            @member_property
+            def unit_area(self):
+                return self.area(1)
+
+        self.assertEqual(Shape.SQUARE.unit_area, 1)
+        self.assertEqual(Shape.CIRCLE.unit_area, 3)
+
+    def test_flags(self):
+        class Perm(FlagProperties, s("label")):
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+
+            @symmetric()
+            @member_property
+            def bits(self):
+                return f"{self.value:02b}"
+
+        self.assertEqual(Perm.RW.bits, "11")
+        self.assertIs(Perm("10"), Perm.W)
+        # composite values that are not named members are computed on access
+        self.assertEqual(Perm(0).bits, "00")
+
+    def test_compact_flags(self):
+        class Perm(IntFlagProperties, s("label")):
+            _compact_properties_ = True
+
+            R = 1, "read"
+            W = 2, "write"
+            X = 4, "execute"
+
+            @symmetric()
+            @member_property
+            def bits(self):
+                return f"{self.value:03b}"
+
+        self.assertEqual(Perm.W.bits, "010")
+        self.assertIs(Perm("100"), Perm.X)
+        # composites have no stored values, so they are computed on access
+        self.assertEqual((Perm.R | Perm.W).bits, "011")
+        with self.assertRaises(AttributeError):
+            (Perm.R | Perm.W).label
+
+    def test_existing_property(self):
+        with self.assertRaisesRegex(ValueError, "hex is already a property"):
+
+            class Color(EnumProperties, p("hex")):
+                RED = 1, "ff0000"
+
+                @member_property
+                def hex(self):
+                    return "ff0000"
+
+
+class StyleBase(EnumProperties):
+    _symmetric_builtins_ = [s("name", case_fold=True)]
+
+    @symmetric(case_fold=True)
+    @member_property
+    def uri(self):
+        return f"mapbox://styles/mapbox/{self.value}-v{self.version}"
+
+    @member_property
+    def slug(self):
+        return self.value.replace("-", "_")
+
+
+class TestInheritance(TestCase):
+    def test_inherited(self):
+        class Style(StyleBase, p("version")):
+            LIGHT = "light", 11
+            DARK = "dark", 10
+
+        self.assertEqual(
+            [str(prop) for prop in Style._properties_], ["version", "uri", "slug"]
+        )
+        self.assertEqual(vars(Style.LIGHT)["uri"], "mapbox://styles/mapbox/light-v11")
+        self.assertIs(Style.get("MAPBOX://STYLES/MAPBOX/DARK-V10"), Style.DARK)
+        self.assertIs(Style.get("light"), Style.LIGHT)
+        self.assertEqual(Style.column("slug"), ("light", "dark"))
+        self.assertEqual(list(Style._ep_member_properties_), ["uri", "slug"])
+
+    def test_compact(self):
+        class Style(StyleBase, p("version")):
+            _compact_properties_ = True
+
+            LIGHT = "light", 11
+            SATELLITE_STREETS = "satellite-streets", 12
+
+        self.assertEqual(Style.SATELLITE_STREETS.slug, "satellite_streets")
+        self.assertEqual(
+            Style.LIGHT._ep_values_,
+            (11, "mapbox://styles/mapbox/light-v11", "light", 0),
+        )
+        self.assertIs(Style("mapbox://styles/mapbox/light-v11"), Style.LIGHT)
+
+    def test_override(self):
+        class Style(StyleBase, p("version"), s("slug")):
+            LIGHT = "light", 11, "lite"
+
+            @member_property
+            def uri(self):
+                return f"mapbox://{self.value}"
+
+        # overriding replaces the inherited symmetric property with a plain one
+        self.assertEqual(
+            [(str(prop), prop.symmetric) for prop in Style._properties_],
+            [("version", False), ("slug", True), ("uri", False)],
+        )
+        self.assertEqual(Style.LIGHT.uri, "mapbox://light")
+        self.assertIsNone(Style.get("mapbox://light"))
+        self.assertIs(Style("lite"), Style.LIGHT)
+
+        class Plain(StyleBase, p("version")):
+            LIGHT = "light", 11
+
+            @property
+            def uri(self):
+                return "uri"
+
+        self.assertEqual(
+            [str(prop) for prop in Plain._properties_], ["version", "slug"]
+        )
+        self.assertEqual(Plain.LIGHT.uri, "uri")
+
+    def test_multiple_bases(self):
+        class Mixin(EnumProperties):
+            @member_property
+            def upper(self):
+                return self.value.upper()
+
+        class Base(Mixin):
+            @member_property
+            def lower(self):
+                return self.value.lower()
+
+        class Style(Base):
+            LIGHT = "Light"
+
+        self.assertEqual([str(prop) for prop in Style._properties_], ["upper", "lower"])
+        self.assertEqual((Style.LIGHT.upper, Style.LIGHT.lower), ("LIGHT", "light"))
+        self.assertEqual(vars(Style.LIGHT)["lower"], "light")
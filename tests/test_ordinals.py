@@ -0,0 +1,81 @@
+"""
+Tests for member ordinals and from_ordinal().
+"""
+
+import typing as t
+from unittest import TestCase
+
+from enum_properties import (
+    EnumProperties,
+    IntFlagProperties,
+    StrEnumProperties,
+    Symmetric,
+    p,
+)
+
+
+class Color(EnumProperties):
+    hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+    RED = 1, "ff0000"
+    GREEN = 2, "00ff00"
+    BLUE = 3, "0000ff"
+
+
+class TestOrdinals(TestCase):
+    def test_ordinals(self):
+        self.assertEqual([member._ordinal_ for member in Color], [0, 1, 2])
+        self.assertEqual(Color._ep_members_, (Color.RED, Color.GREEN, Color.BLUE))
+        for member in Color:
+            self.assertIs(Color.from_ordinal(member._ordinal_), member)
+
+    def test_from_ordinal_errors(self):
+        for bad in (-1, 3, 100):
+            with self.assertRaisesRegex(ValueError, f"{bad} is not a valid Color"):
+                Color.from_ordinal(bad)
+
+    def test_aliases(self):
+        class Aliased(EnumProperties, p("label")):
+            ONE = 1, "one"
+            UNO = 1, "uno"
+            TWO = 2, "two"
+
+        self.assertIs(Aliased.UNO, Aliased.ONE)
+        self.assertEqual(Aliased._ep_members_, (Aliased.ONE, Aliased.TWO))
+        self.assertEqual(Aliased.TWO._ordinal_, 1)
+        self.assertIs(Aliased.from_ordinal(1), Aliased.TWO)
+
+    def test_flags(self):
+        class Perm(IntFlagProperties, p("label")):
+            R = 1, "read"
+            W = 2, "write"
+            RW = 3, "read/write"
+            X = 4, "execute"
+
+        self.assertEqual(
+            [m._ordinal_ for m in (Perm.R, Perm.W, Perm.RW, Perm.X)], [0, 1, 2, 3]
+        )
+        self.assertIs(Perm.from_ordinal(2), Perm.RW)
+        # composite values that are not named members have no ordinal
+        self.assertIsNone((Perm.R | Perm.X)._ordinal_)
+
+    def test_side_table(self):
+        class Level(StrEnumProperties):
+            LOW = "low"
+            HIGH = "high"
+
+        counts = [0] * len(Level._ep_members_)
+        for level in ("low", "high", "high", "low", "high"):
+            counts[Level(level)._ordinal_] += 1
+        self.assertEqual(
+            {Level.from_ordinal(idx): count for idx, count in enumerate(counts)},
+            {Level.LOW: 2, Level.HIGH: 3},
+        )
+
+    def test_reserved(self):
+        with self.assertRaisesRegex(ValueError, "_ordinal_ is reserved"):
+
+            class Bad(EnumProperties):
+                _ordinal_ = 1
+
+                ONE = 1
@@ -0,0 +1,127 @@
+"""
+Tests for class construction profiling in enum_properties.profiling.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import typing as t
+from pathlib import Path
+from unittest import TestCase
+
+import enum_properties
+from enum_properties import EnumProperties, Symmetric, specialize, symmetric
+from enum_properties.profiling import STAGES, Profile, profile
+
+
+def define():
+    class Color(EnumProperties):
+        hex: t.Annotated[str, Symmetric(case_fold=True)]
+
+        RED = 1, "ff0000"
+        GREEN = 2, "00ff00"
+
+        @symmetric()
+        def label(self):
+            return self.name.title()
+
+        @specialize(RED)
+        def warm(self):
+            return True
+
+    return Color
+
+
+class TestProfiling(TestCase):
+    def test_profile(self):
+        with profile() as prof:
+            Color = define()
+        self.assertIsNone(enum_properties._profiler)
+        self.assertEqual(len(prof.classes), 1)
+        record = prof.classes[0]
+        self.assertEqual(record.name, f"{__name__}.define.<locals>.Color")
+        for stage in (
+            "prepare",
+            "members",
+            "enum",
+            "specialize",
+            "properties",
+            "symmetric",
+            "builtins",
+        ):
+            self.assertIn(stage, record.stages)
+            self.assertGreater(record.stages[stage].seconds, 0)
+        self.assertEqual(record.stages["prepare"].calls, 1)
+        self.assertGreaterEqual(record.stages["members"].calls, 2)
+        self.assertTrue(set(record.stages).issubset(STAGES))
+        self.assertAlmostEqual(
+            record.seconds, sum(stats.seconds for stats in record.stages.values())
+        )
+        self.assertIs(Color("Red"), Color.RED)
+
+    def test_not_profiled(self):
+        self.assertIsNone(enum_properties._profiler)
+        with profile() as prof:
+            pass
+        define()
+        self.assertEqual(prof.classes, [])
+
+    def test_nested(self):
+        with profile() as outer:
+            define()
+            with profile() as inner:
+                define()
+            self.assertIs(enum_properties._profiler, outer)
+        self.assertEqual(len(outer.classes), 1)
+        self.assertEqual(len(inner.classes), 1)
+
+    def test_functional(self):
+        with profile() as prof:
+            EnumProperties("Functional", [("ONE", 1), ("TWO", 2)])
+        self.assertEqual(len(prof.classes), 1)
+        self.assertIn("enum", prof.classes[0].stages)
+
+    def test_report(self):
+        with profile() as prof:
+            for _ in range(3):
+                define()
+        totals = prof.totals()
+        self.assertEqual(totals["prepare"].calls, 3)
+        self.assertEqual(totals["annotations"].calls, 0)
+
+        report = prof.report()
+        lines = report.splitlines()
+        self.assertTrue(lines[0].startswith("class"))
+        for stage in ("prepare", "symmetric", "builtins"):
+            self.assertIn(stage, lines[0])
+        self.assertTrue(lines[-1].startswith("TOTAL (3 classes)"))
+        # header, rule, 3 classes, rule, total
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(len(prof.report(limit=1).splitlines()), 5)
+
+        for sort in ("seconds", "blocks", "name", *STAGES):
+            self.assertEqual(len(prof.sorted(sort)), 3)
+        seconds = [record.seconds for record in prof.sorted("seconds")]
+        self.assertEqual(seconds, sorted(seconds, reverse=True))
+        with self.assertRaises(ValueError):
+            prof.sorted("nope")
+
+    def test_empty_report(self):
+        self.assertTrue(Profile().report().splitlines()[-1].startswith("TOTAL (0"))
+
+    def test_environment(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report = Path(tmp) / "report.txt"
+            subprocess.run(
+                [sys.executable, "-c", "import tests.big_enum"],
+                check=True,
+                env={
+                    **os.environ,
+                    "ENUM_PROPERTIES_PROFILE": str(report),
+                    "PYTHONPATH": os.pathsep.join(sys.path),
+                },
+            )
+            lines = report.read_text().splitlines()
+        self.assertTrue(lines[2].startswith("tests.big_enum.ISOCountry"))
+        self.assertTrue(lines[-1].startswith("TOTAL (1 classes)"))
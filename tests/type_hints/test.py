@@ -17,6 +17,7 @@ from enum_properties import (
     IntEnumProperties,
     IntFlagProperties,
     StrEnumProperties,
+    member_property,
     symmetric,
 )
 
@@ -303,3 +304,20 @@ def test() -> None:
 
     assert_type(SymColor.RED.integer, int)
     assert_type(SymColor.RED.label, str)
+
+    # ----------------------------------------------------- @member_property
+    class MemberColor(EnumProperties):
+        @member_property
+        def integer(self) -> int:
+            return int(str(self.value), 16)
+
+        @symmetric()
+        @member_property
+        def label(self) -> str:
+            return self.name
+
+        RED = "ff0000"
+        GREEN = "00ff00"
+
+    assert_type(MemberColor.RED.integer, int)
+    assert_type(MemberColor.RED.label, str)